@@ -0,0 +1,325 @@
+import gzip
+import hashlib
+import logging
+import os
+import re
+import threading
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import FrozenSet, List, Optional, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+try:
+    import brotli  # pyright: ignore[reportMissingImports]
+except ImportError:  # optional: without it responses are gzip-only
+    logger.info("brotli is not installed, responses are compressed with gzip only")
+    brotli = None
+
+COMPRESSION_MIN_SIZE = int(os.environ.get("APP_COMPRESSION_MIN_SIZE", "500"))
+COMPRESSION_GZIP_LEVEL = int(os.environ.get("APP_COMPRESSION_GZIP_LEVEL", "6"))
+COMPRESSION_BROTLI_QUALITY = int(os.environ.get("APP_COMPRESSION_BROTLI_QUALITY", "5"))
+# Responses with a known length up to this size are compressed in one piece (and cached if cacheable);
+# anything larger, or of unknown length, is compressed as a stream
+COMPRESSION_MAX_BUFFER = int(os.environ.get("APP_COMPRESSION_MAX_BUFFER", str(4 * 1024 * 1024)))
+COMPRESSION_CACHE_MAX_BYTES = int(os.environ.get("APP_COMPRESSION_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+
+COMPRESSIBLE_TYPES: FrozenSet[str] = frozenset(
+    {
+        "text/html",
+        "text/css",
+        "text/plain",
+        "text/javascript",
+        "application/javascript",
+        "application/json",
+        "application/xml",
+        "image/svg+xml",
+    }
+)
+
+
+@dataclass(frozen=True, slots=True)
+class CompressedCacheStats:
+    hits: int
+    misses: int
+    entries: int
+    size_bytes: int
+
+
+class CompressedCache:
+    """LRU of compressed bodies, bounded by their total size.
+
+    Keys include a validator of the uncompressed body (its ETag, or a digest), so a changed asset
+    never hits a stale entry.
+    """
+
+    def __init__(self, max_bytes: int = COMPRESSION_CACHE_MAX_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Tuple[str, str, str], bytes] = OrderedDict()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[str, str, str]) -> Optional[bytes]:
+        with self._lock:
+            body = self._entries.get(key)
+            if body is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return body
+
+    def put(self, key: Tuple[str, str, str], body: bytes) -> None:
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._entries[key] = body
+            self._size += len(body)
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> CompressedCacheStats:
+        with self._lock:
+            return CompressedCacheStats(self._hits, self._misses, len(self._entries), self._size)
+
+
+# An Accept-Encoding weight (RFC 9110 section 12.4.2)
+_QVALUE = re.compile(r"0(\.\d{0,3})?|1(\.0{0,3})?")
+
+
+def choose_encoding(accept_encoding: str, brotli_available: bool = brotli is not None) -> Optional[str]:
+    """Preferred encoding the client accepts: br over gzip; None when neither is acceptable"""
+    accepted = set()
+    for part in accept_encoding.split(","):
+        name, _, params = part.partition(";")
+        name = name.strip().lower()
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip() == "q":
+                # a malformed weight counts as 0, i.e. not acceptable
+                quality = float(value) if _QVALUE.fullmatch(value.strip()) else 0.0
+        if quality > 0:
+            accepted.add(name)
+    if brotli_available and ("br" in accepted or "*" in accepted):
+        return "br"
+    if "gzip" in accepted or "*" in accepted:
+        return "gzip"
+    return None
+
+
+def compress(body: bytes, encoding: str, gzip_level: int, brotli_quality: int) -> bytes:
+    match encoding:
+        case "br" if brotli is not None:
+            return brotli.compress(body, quality=brotli_quality)
+        case "gzip":
+            # mtime=0 keeps the output deterministic, so equal bodies compress to equal bytes
+            return gzip.compress(body, compresslevel=gzip_level, mtime=0)
+        case _:
+            raise ValueError(f"Unsupported encoding: {encoding}")
+
+
+class _StreamCompressor:
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int) -> None:
+        self.encoding = encoding
+        match encoding:
+            case "br" if brotli is not None:
+                self._brotli = brotli.Compressor(quality=brotli_quality)
+            case "gzip":
+                self._zlib = zlib.compressobj(gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+            case _:
+                raise ValueError(f"Unsupported encoding: {encoding}")
+
+    def compress(self, data: bytes) -> bytes:
+        # Flush per chunk so streamed output reaches the client as the app produces it
+        if self.encoding == "br":
+            return self._brotli.process(data) + self._brotli.flush()
+        return self._zlib.compress(data) + self._zlib.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._brotli.finish()
+        return self._zlib.flush(zlib.Z_FINISH)
+
+
+class CompressionMiddleware:
+    """Pure ASGI gzip/brotli compression for allowlisted content types.
+
+    Bodies below minimum_size are sent as is. Responses with an ETag or an immutable Cache-Control
+    are compressed once per encoding and served from cache afterwards. Compressed responses get a
+    weak ETag, since the bytes differ from the uncompressed representation.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = COMPRESSION_MIN_SIZE,
+        content_types: FrozenSet[str] = COMPRESSIBLE_TYPES,
+        gzip_level: int = COMPRESSION_GZIP_LEVEL,
+        brotli_quality: int = COMPRESSION_BROTLI_QUALITY,
+        max_buffer: int = COMPRESSION_MAX_BUFFER,
+        cache: Optional[CompressedCache] = None,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.content_types = content_types
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.max_buffer = max_buffer
+        self.cache = cache if cache is not None else COMPRESSED_CACHE
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+        accept_encoding = ""
+        for name, value in scope["headers"]:
+            if name == b"accept-encoding":
+                accept_encoding = value.decode("latin-1")
+                break
+        encoding = choose_encoding(accept_encoding)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        await self.app(scope, receive, _CompressingSender(self, encoding, scope["path"], send).send)
+
+
+class _CompressingSender:
+    """Per-response state: holds the start message until the body shows whether to compress"""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, path: str, send: Send) -> None:
+        self.middleware = middleware
+        self.encoding = encoding
+        self.path = path
+        self._send = send
+        self._start: Optional[Message] = None
+        self._headers: List[Tuple[bytes, bytes]] = []
+        self._chunks: List[bytes] = []
+        self._buffered = 0
+        self._passthrough = False
+        self._stream: Optional[_StreamCompressor] = None
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self._on_start(message)
+            if self._passthrough:
+                await self._send(message)
+            return
+        if message["type"] != "http.response.body" or self._passthrough:
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self._stream is not None:
+            await self._send_stream_chunk(body, more_body)
+            return
+
+        self._chunks.append(body)
+        self._buffered += len(body)
+        if not more_body:
+            await self._send_whole(b"".join(self._chunks))
+        elif self._buffered > self.middleware.max_buffer or self._header(b"content-length") is None:
+            await self._start_stream()
+
+    def _on_start(self, message: Message) -> None:
+        self._start = message
+        self._headers = list(message.get("headers", ()))
+        content_type = (self._header(b"content-type") or b"").split(b";")[0].strip().decode("latin-1")
+        if content_type not in self.middleware.content_types:
+            self._passthrough = True
+            return
+        self._set_header(b"vary", self._vary())
+        if message["status"] != 200 or self._header(b"content-encoding") is not None:
+            self._passthrough = True
+            message["headers"] = self._headers
+
+    async def _send_whole(self, body: bytes) -> None:
+        assert self._start is not None
+        if len(body) < self.middleware.minimum_size:
+            self._start["headers"] = self._headers
+            await self._send(self._start)
+            await self._send({"type": "http.response.body", "body": body})
+            return
+
+        compressed = None
+        key = self._cache_key(body)
+        if key is not None:
+            compressed = self.middleware.cache.get(key)
+        if compressed is None:
+            compressed = compress(body, self.encoding, self.middleware.gzip_level, self.middleware.brotli_quality)
+            if key is not None:
+                self.middleware.cache.put(key, compressed)
+
+        self._mark_encoded()
+        self._set_header(b"content-length", str(len(compressed)).encode())
+        self._start["headers"] = self._headers
+        await self._send(self._start)
+        await self._send({"type": "http.response.body", "body": compressed})
+
+    async def _start_stream(self) -> None:
+        assert self._start is not None
+        self._stream = _StreamCompressor(self.encoding, self.middleware.gzip_level, self.middleware.brotli_quality)
+        self._mark_encoded()
+        self._headers = [header for header in self._headers if header[0] != b"content-length"]
+        self._start["headers"] = self._headers
+        await self._send(self._start)
+        buffered, self._chunks = b"".join(self._chunks), []
+        await self._send_stream_chunk(buffered, True)
+
+    async def _send_stream_chunk(self, body: bytes, more_body: bool) -> None:
+        assert self._stream is not None
+        data = self._stream.compress(body)
+        if not more_body:
+            data += self._stream.finish()
+        if data or not more_body:
+            await self._send({"type": "http.response.body", "body": data, "more_body": more_body})
+
+    def _cache_key(self, body: bytes) -> Optional[Tuple[str, str, str]]:
+        etag = self._header(b"etag")
+        if etag is not None:
+            return self.path, self.encoding, etag.decode("latin-1")
+        if b"immutable" in (self._header(b"cache-control") or b""):
+            return self.path, self.encoding, hashlib.sha1(body).hexdigest()
+        return None
+
+    def _mark_encoded(self) -> None:
+        self._set_header(b"content-encoding", self.encoding.encode())
+        etag = self._header(b"etag")
+        if etag is not None and not etag.startswith(b"W/"):
+            self._set_header(b"etag", b"W/" + etag)
+
+    def _vary(self) -> bytes:
+        vary = self._header(b"vary")
+        if vary is None:
+            return b"Accept-Encoding"
+        if b"accept-encoding" in vary.lower():
+            return vary
+        return vary + b", Accept-Encoding"
+
+    def _header(self, name: bytes) -> Optional[bytes]:
+        for key, value in self._headers:
+            if key.lower() == name:
+                return value
+        return None
+
+    def _set_header(self, name: bytes, value: bytes) -> None:
+        self._headers = [header for header in self._headers if header[0].lower() != name]
+        self._headers.append((name, value))
+
+
+COMPRESSED_CACHE = CompressedCache()
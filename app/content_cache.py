@@ -0,0 +1,114 @@
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+
+from sqlmodel import SQLModel
+
+from app.models import Benefit, CallToAction, FooterContent, HeroSection, Service
+
+T = TypeVar("T")
+M = TypeVar("M", bound=SQLModel)
+
+CONTENT_CACHE_TTL = float(os.environ.get("APP_CONTENT_CACHE_TTL", "300"))
+
+# Cache keys are "<namespace>" or "<namespace>:<detail>"; invalidation works per namespace
+LANDING_NAMESPACE = "landing"
+SITE_CONFIG_NAMESPACE = "site_config"
+
+
+@dataclass(frozen=True, slots=True)
+class LandingContentSnapshot:
+    """Immutable view of all active landing page content at one cache version.
+
+    The contained model instances are detached from any session and shared between readers,
+    so they must be treated as read-only; the section getters hand out copies of them.
+    """
+
+    version: int
+    hero: Optional[HeroSection]
+    services: Tuple[Service, ...]
+    benefits: Tuple[Benefit, ...]
+    cta_buttons: Tuple[CallToAction, ...]
+    footer: Optional[FooterContent]
+
+
+def copy_model(model: M) -> M:
+    """A new instance with the field values of model, so a caller can change it without touching the cache"""
+    return type(model).model_validate(model.model_dump())
+
+
+@dataclass(frozen=True, slots=True)
+class _CacheEntry:
+    value: object
+    version: int
+    expires_at: float
+
+
+class ContentCache:
+    """Versioned in-process cache with TTL expiry and explicit per-namespace invalidation.
+
+    Reads on the hot path are lock-free dictionary lookups. Invalidation bumps the namespace
+    version, so a load that was already in flight when content changed is never stored.
+    """
+
+    def __init__(self, ttl_seconds: float = CONTENT_CACHE_TTL) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[str, _CacheEntry] = {}
+        self._versions: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def version(self, namespace: str) -> int:
+        """Current version of a namespace; increases on every invalidation"""
+        return self._versions.setdefault(namespace, 0)
+
+    def get_or_load(self, key: str, loader: Callable[[], T]) -> T:
+        """Return the cached value for key, calling loader on a miss or after expiry"""
+        version = self.version(_namespace(key))
+        entry = self._lookup(key, version)
+        if entry is not None:
+            return entry.value  # type: ignore[return-value]
+
+        value = loader()
+        self._store(key, version, value)
+        return value
+
+    async def aget_or_load(self, key: str, loader: Callable[[], Awaitable[T]]) -> T:
+        """Async variant of get_or_load for loaders that await the database"""
+        version = self.version(_namespace(key))
+        entry = self._lookup(key, version)
+        if entry is not None:
+            return entry.value  # type: ignore[return-value]
+
+        value = await loader()
+        self._store(key, version, value)
+        return value
+
+    def invalidate(self, namespace: Optional[str] = None) -> None:
+        """Drop cached entries of one namespace, or of all namespaces when none is given"""
+        with self._lock:
+            namespaces = [namespace] if namespace is not None else list(self._versions)
+            for name in namespaces:
+                self._versions[name] = self._versions.get(name, 0) + 1
+            for key in list(self._entries):
+                if namespace is None or _namespace(key) == namespace:
+                    del self._entries[key]
+
+    def _lookup(self, key: str, version: int) -> Optional[_CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is not None and entry.version == version and entry.expires_at > time.monotonic():
+            return entry
+        return None
+
+    def _store(self, key: str, version: int, value: object) -> None:
+        with self._lock:
+            if self._versions.get(_namespace(key)) == version:
+                self._entries[key] = _CacheEntry(value, version, time.monotonic() + self.ttl_seconds)
+
+
+def _namespace(key: str) -> str:
+    return key.partition(":")[0]
+
+
+CONTENT_CACHE = ContentCache()
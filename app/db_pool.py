@@ -0,0 +1,139 @@
+import bisect
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple, cast
+
+from sqlalchemy import AsyncAdaptedQueuePool, QueuePool
+
+# Per engine and per worker process: a deployment opens up to
+# workers * engines * (DB_POOL_SIZE + DB_MAX_OVERFLOW) connections
+DB_POOL_SIZE = int(os.environ.get("APP_DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.environ.get("APP_DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.environ.get("APP_DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.environ.get("APP_DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = os.environ.get("APP_DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+
+# Upper bounds in seconds of the checkout wait histogram; anything slower lands in +Inf
+WAIT_BUCKETS: Tuple[float, ...] = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+@dataclass(frozen=True, slots=True)
+class PoolStats:
+    """Point-in-time view of one connection pool.
+
+    wait_buckets holds cumulative (upper bound, count) pairs, ending with +Inf, so it can be
+    exported as a Prometheus histogram as is.
+    """
+
+    size: int
+    max_overflow: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    checkouts: int
+    checkout_failures: int
+    wait_seconds_total: float
+    wait_seconds_max: float
+    wait_buckets: Tuple[Tuple[float, int], ...]
+
+
+class PoolMetrics:
+    """Checkout counters shared by a pool and the pools that replace it on recreate()"""
+
+    def __init__(self, buckets: Tuple[float, ...] = WAIT_BUCKETS) -> None:
+        self.buckets = buckets
+        self._counts: List[int] = [0] * (len(buckets) + 1)
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._failures = 0
+        self._lock = threading.Lock()
+
+    def record_wait(self, seconds: float) -> None:
+        with self._lock:
+            self._counts[bisect.bisect_left(self.buckets, seconds)] += 1
+            self._wait_total += seconds
+            self._wait_max = max(self._wait_max, seconds)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts = [0] * (len(self.buckets) + 1)
+            self._wait_total = 0.0
+            self._wait_max = 0.0
+            self._failures = 0
+
+    def snapshot(self, pool: QueuePool) -> PoolStats:
+        with self._lock:
+            counts = list(self._counts)
+            wait_total, wait_max, failures = self._wait_total, self._wait_max, self._failures
+        cumulative: List[Tuple[float, int]] = []
+        running = 0
+        for bound, count in zip((*self.buckets, float("inf")), counts):
+            running += count
+            cumulative.append((bound, running))
+        return PoolStats(
+            size=pool.size(),
+            max_overflow=pool._max_overflow,
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            # QueuePool starts at -pool_size and counts up as connections are opened
+            overflow=max(pool.overflow(), 0),
+            checkouts=running,
+            checkout_failures=failures,
+            wait_seconds_total=wait_total,
+            wait_seconds_max=wait_max,
+            wait_buckets=tuple(cumulative),
+        )
+
+
+class _InstrumentedPoolMixin:
+    """Times every checkout: waiting on the queue, opening overflow connections and pre-ping"""
+
+    metrics: PoolMetrics
+
+    def connect(self) -> Any:
+        start = time.perf_counter()
+        try:
+            connection = super().connect()  # type: ignore[misc]
+        except Exception:
+            self.metrics.record_failure()
+            raise
+        self.metrics.record_wait(time.perf_counter() - start)
+        return connection
+
+    def stats(self) -> PoolStats:
+        return self.metrics.snapshot(self)  # type: ignore[arg-type]
+
+    def recreate(self) -> QueuePool:
+        # Engine.dispose() swaps in a fresh pool; keep counting into the same metrics
+        pool = cast(QueuePool, super().recreate())  # type: ignore[misc]
+        pool.metrics = self.metrics  # type: ignore[attr-defined]
+        return pool
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+
+class InstrumentedAsyncAdaptedQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+
+def pool_options() -> Dict[str, Any]:
+    """create_engine keyword arguments for the configured pool sizing"""
+    return {
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+    }
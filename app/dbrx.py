@@ -1,56 +1,663 @@
-from typing import List, Dict, Any, ClassVar, Sequence, TypeVar
+import asyncio
+import csv
+import io
+import itertools
+import json
+import os
+import re
+import threading
+import time
+import urllib.request
+from array import array
+from operator import itemgetter
+from typing import (
+    List,
+    Dict,
+    Any,
+    BinaryIO,
+    Callable,
+    ClassVar,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
 from databricks.sdk import WorkspaceClient
-from databricks.sdk.service.sql import StatementState, State
+from databricks.sdk.errors import NotFound
+from databricks.sdk.service.sql import (
+    ColumnInfo,
+    ColumnInfoTypeName,
+    Disposition,
+    ExecuteStatementRequestOnWaitTimeout,
+    ExternalLink,
+    Format,
+    ResultData,
+    StatementExecutionAPI,
+    StatementParameterListItem,
+    StatementResponse,
+    StatementState,
+    State,
+)
 
 from pydantic import BaseModel
+
+from app.query_cache import DATABRICKS_QUERY_CACHE, read_only_statement
 from logging import getLogger
 
 logger = getLogger(__name__)
 
 T = TypeVar("T", bound="DatabricksModel")
 
+# One result row; values arrive as strings (None for NULL) and are shared with ResultStream.columns
+Row = Tuple[Optional[str], ...]
 
-def execute_databricks_query(query: str) -> List[Dict[str, Any]]:
-    """helper function to execute SQL query via WorkspaceClient"""
-    client = WorkspaceClient()
+# How long the chosen warehouse is trusted before it is re-resolved in the background
+DATABRICKS_WAREHOUSE_TTL = float(os.environ.get("APP_DATABRICKS_WAREHOUSE_TTL", "300"))
+# Statements still running after this server-side wait (0s or 5s to 50s) are polled instead
+DATABRICKS_SUBMIT_WAIT = os.environ.get("APP_DATABRICKS_SUBMIT_WAIT", "5s")
+DATABRICKS_POLL_INTERVAL = float(os.environ.get("APP_DATABRICKS_POLL_INTERVAL", "0.25"))
+DATABRICKS_MAX_POLL_INTERVAL = float(os.environ.get("APP_DATABRICKS_MAX_POLL_INTERVAL", "5"))
+DATABRICKS_QUERY_TIMEOUT = float(os.environ.get("APP_DATABRICKS_QUERY_TIMEOUT", "300"))
+DATABRICKS_MAX_CONCURRENCY = int(os.environ.get("APP_DATABRICKS_MAX_CONCURRENCY", "8"))
+DATABRICKS_LINK_TIMEOUT = float(os.environ.get("APP_DATABRICKS_LINK_TIMEOUT", "60"))
 
-    # use warehouse to execute query
-    running_warehouses = [x for x in client.warehouses.list() if x.state == State.RUNNING]
-    if not running_warehouses:
-        warehouse = list(client.warehouses.list())[0]
-    else:
-        warehouse = running_warehouses[0]
+# Result columns of these types are read into typed arrays (array module typecodes), others stay strings
+COLUMN_TYPECODES: Dict[ColumnInfoTypeName, str] = {
+    ColumnInfoTypeName.BOOLEAN: "b",
+    ColumnInfoTypeName.BYTE: "b",
+    ColumnInfoTypeName.SHORT: "h",
+    ColumnInfoTypeName.INT: "i",
+    ColumnInfoTypeName.LONG: "q",
+    ColumnInfoTypeName.FLOAT: "f",
+    ColumnInfoTypeName.DOUBLE: "d",
+}
 
-    if warehouse.id is None:
-        raise RuntimeError("Warehouse ID is None")
+# Errors meaning the cached warehouse is gone or stopped, so another one has to be chosen
+_WAREHOUSE_UNAVAILABLE = re.compile(r"warehouse.*(not found|does not exist|deleted|stopped|not running)", re.I)
 
-    logger.info(f"Executing query {query.replace('\n', '\t')} on warehouse: {warehouse.id}")
-    execution = client.statement_execution.execute_statement(
-        warehouse_id=warehouse.id, statement=query, wait_timeout="30s"
-    )
 
-    if execution.status is None:
+def warehouse_unavailable(error: Exception) -> bool:
+    """Whether error says the warehouse a statement was sent to cannot run it"""
+    return isinstance(error, NotFound) or _WAREHOUSE_UNAVAILABLE.search(str(error)) is not None
+
+
+class WarehouseResolver:
+    """Chooses the warehouse statements run on and remembers the choice for ttl_seconds.
+
+    A running warehouse is preferred, otherwise the first one listed. Once the choice is older than
+    ttl_seconds it keeps being returned while a background thread resolves it again, so queries never
+    wait on the warehouse listing after the first one. invalidate() forgets a warehouse that failed.
+    """
+
+    def __init__(
+        self,
+        client: Callable[[], WorkspaceClient],
+        ttl_seconds: float = DATABRICKS_WAREHOUSE_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._client = client
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._warehouse_id: Optional[str] = None
+        self._resolved_at = 0.0
+        self._lock = threading.Lock()
+        self._refreshing = False
+
+    def warehouse_id(self) -> str:
+        """The cached warehouse id, resolving it first if nothing is cached"""
+        with self._lock:
+            warehouse_id = self._warehouse_id
+            stale = warehouse_id is not None and self._clock() - self._resolved_at >= self.ttl_seconds
+            if stale and not self._refreshing:
+                self._refreshing = True
+                threading.Thread(target=self._refresh_in_background, name="warehouse-refresh", daemon=True).start()
+        return warehouse_id if warehouse_id is not None else self.refresh()
+
+    def refresh(self) -> str:
+        """List the warehouses once and cache the one to use"""
+        warehouses = list(self._client().warehouses.list())
+        running = [warehouse for warehouse in warehouses if warehouse.state == State.RUNNING]
+        candidates = running or warehouses
+        if not candidates or candidates[0].id is None:
+            raise RuntimeError("No SQL warehouse available")
+        warehouse_id = candidates[0].id
+        with self._lock:
+            if warehouse_id != self._warehouse_id:
+                logger.info(f"Using warehouse {warehouse_id} ({candidates[0].state})")
+            self._warehouse_id = warehouse_id
+            self._resolved_at = self._clock()
+        return warehouse_id
+
+    def invalidate(self, warehouse_id: Optional[str] = None) -> None:
+        """Forget the cached warehouse, or only warehouse_id if another one was chosen meanwhile"""
+        with self._lock:
+            if warehouse_id is None or warehouse_id == self._warehouse_id:
+                self._warehouse_id = None
+
+    def _refresh_in_background(self) -> None:
+        try:
+            self.refresh()
+        except Exception as e:
+            # keep the previous choice; a failing statement will invalidate it
+            logger.error(f"Error refreshing warehouse: {e}")
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+
+def result_options(bounded_memory: bool) -> Tuple[Disposition, Format]:
+    """How results are delivered: inline JSON, or CSV external links that can be read incrementally"""
+    if bounded_memory:
+        return Disposition.EXTERNAL_LINKS, Format.CSV
+    return Disposition.INLINE, Format.JSON_ARRAY
+
+
+def open_external_link(link: ExternalLink) -> BinaryIO:
+    """Open a presigned result link; it is fetched without the workspace credentials"""
+    request = urllib.request.Request(link.external_link or "", headers=link.http_headers or {})
+    return urllib.request.urlopen(request, timeout=DATABRICKS_LINK_TIMEOUT)
+
+
+class ResultStream:
+    """Rows of a finished statement as tuples sharing one column schema, fetched chunk by chunk.
+
+    Chunks are requested while iterating and dropped once read, so at most one chunk is held in
+    memory; rows of CSV external links are parsed while they download. CSV writes NULL as "null", so
+    NULL and the string "null" are both read as None. Iterating again fetches the chunks again.
+    """
+
+    def __init__(
+        self,
+        statement_execution: StatementExecutionAPI,
+        response: StatementResponse,
+        open_link: Callable[[ExternalLink], BinaryIO] = open_external_link,
+    ) -> None:
+        self._statement_execution = statement_execution
+        self._open_link = open_link
+        self.statement_id = response.statement_id or ""
+        manifest = response.manifest
+        schema_columns = manifest.schema.columns if manifest and manifest.schema else None
+        self.schema: Tuple[ColumnInfo, ...] = tuple(schema_columns or ())
+        self.columns: Tuple[str, ...] = tuple(column.name or "" for column in self.schema)
+        self.total_rows = manifest.total_row_count if manifest else None
+        self.truncated = bool(manifest and manifest.truncated)
+        self.format = manifest.format if manifest and manifest.format else Format.JSON_ARRAY
+        self._chunk_count = manifest.total_chunk_count if manifest else None
+        self._first_chunk = response.result
+
+    def __iter__(self) -> Iterator[Row]:
+        for chunk in self._chunks():
+            yield from chunk
+
+    def batches(self, size: Optional[int] = None) -> Iterator[List[Row]]:
+        """Rows in lists of at most size rows, or one list per chunk if size is None"""
+        for chunk in self._chunks():
+            if size is None:
+                yield list(chunk)
+                continue
+            while batch := list(itertools.islice(chunk, size)):
+                yield batch
+
+    def dicts(self) -> Iterator[Dict[str, Any]]:
+        """Rows as dictionaries keyed by column name"""
+        for row in self:
+            yield dict(zip(self.columns, row))
+
+    def _chunks(self) -> Iterator[Iterator[Row]]:
+        # the first chunk arrives with the statement; it is released once read and fetched again if needed
+        result, self._first_chunk = self._first_chunk, None
+        if result is None and self._chunk_count:
+            result = self._statement_execution.get_statement_result_chunk_n(self.statement_id, 0)
+        while result is not None:
+            yield self._rows(result)
+            next_index = result.external_links[-1].next_chunk_index if result.external_links else None
+            if next_index is None:
+                next_index = result.next_chunk_index
+            result = (
+                None
+                if next_index is None
+                else self._statement_execution.get_statement_result_chunk_n(self.statement_id, next_index)
+            )
+
+    def _rows(self, result: ResultData) -> Iterator[Row]:
+        for row in result.data_array or ():
+            yield tuple(row)
+        for link in result.external_links or ():
+            yield from self._link_rows(link)
+
+    def _link_rows(self, link: ExternalLink) -> Iterator[Row]:
+        with self._open_link(link) as body:
+            match self.format:
+                case Format.CSV:
+                    reader = csv.reader(io.TextIOWrapper(body, encoding="utf-8", newline=""))
+                    if link.chunk_index == 0:
+                        next(reader, None)  # only the first chunk starts with a header row
+                    for row in reader:
+                        yield tuple(None if value == "null" else value for value in row)
+                case Format.JSON_ARRAY:
+                    for row in json.load(body):
+                        yield tuple(row)
+                case _:
+                    raise ValueError(f"Rows cannot be read from {self.format} results")
+
+
+def _parse_boolean(value: str) -> bool:
+    return value == "true"
+
+
+class Column:
+    """Values of one result column: a typed array for numeric and boolean columns, strings otherwise.
+
+    NULLs of typed columns are stored as 0 and flagged in a mask that is only allocated once the
+    first NULL arrives. Typed values support the buffer protocol, e.g. numpy.frombuffer(column.values).
+    """
+
+    __slots__ = ("name", "type_name", "values", "_parse", "_nulls")
+
+    def __init__(self, name: str, type_name: Optional[ColumnInfoTypeName] = None) -> None:
+        self.name = name
+        self.type_name = type_name
+        typecode = COLUMN_TYPECODES.get(type_name) if type_name is not None else None
+        self.values: Union[array, List[Optional[str]]] = array(typecode) if typecode else []
+        self._parse: Optional[Callable[[str], Any]] = None
+        if typecode is not None:
+            match type_name:
+                case ColumnInfoTypeName.BOOLEAN:
+                    self._parse = _parse_boolean
+                case ColumnInfoTypeName.FLOAT | ColumnInfoTypeName.DOUBLE:
+                    self._parse = float
+                case _:
+                    self._parse = int
+        self._nulls: Optional[bytearray] = None
+
+    def extend(self, values: Sequence[Optional[str]]) -> None:
+        """Append the values of one batch as they arrive from the statement API"""
+        if self._parse is None:
+            self.values.extend(values)
+            return
+        if None not in values:
+            self.values.extend(map(self._parse, values))
+            if self._nulls is not None:
+                self._nulls.extend(bytes(len(values)))
+            return
+        if self._nulls is None:
+            self._nulls = bytearray(len(self.values))
+        self._nulls.extend(value is None for value in values)
+        self.values.extend(0 if value is None else self._parse(value) for value in values)
+
+    @property
+    def null_count(self) -> int:
+        if self._parse is None:
+            return self.values.count(None)
+        return self._nulls.count(1) if self._nulls is not None else 0
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, index: int) -> Any:
+        if self._nulls is not None and self._nulls[index]:
+            return None
+        value = self.values[index]
+        return bool(value) if self.type_name == ColumnInfoTypeName.BOOLEAN else value
+
+    def __iter__(self) -> Iterator[Any]:
+        if self._nulls is None and self.type_name != ColumnInfoTypeName.BOOLEAN:
+            return iter(self.values)
+        return (self[index] for index in range(len(self.values)))
+
+
+class ColumnarResult(Mapping[str, Column]):
+    """A query result held column by column, keyed by column name.
+
+    Typed columns take 1 to 8 bytes per value instead of a Python object per value and a dict per
+    row; to_models() builds DatabricksModel instances only when they are needed.
+    """
+
+    def __init__(self, columns: Sequence[Column]) -> None:
+        self._columns = {column.name: column for column in columns}
+
+    @classmethod
+    def from_stream(cls, stream: ResultStream) -> "ColumnarResult":
+        """Read a result chunk by chunk into typed columns"""
+        columns = [Column(info.name or "", info.type_name) for info in stream.schema]
+        for batch in stream.batches():
+            for index, column in enumerate(columns):
+                column.extend(list(map(itemgetter(index), batch)))
+        return cls(columns)
+
+    @property
+    def num_rows(self) -> int:
+        return len(next(iter(self._columns.values()))) if self._columns else 0
+
+    def __getitem__(self, name: str) -> Column:
+        return self._columns[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._columns)
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    def rows(self) -> Iterator[Tuple[Any, ...]]:
+        """Rows as tuples of typed values"""
+        return zip(*self._columns.values())
+
+    def to_models(self, model: type[T]) -> List[T]:
+        """Rows as instances of model, validated from the typed values"""
+        names = list(self._columns)
+        return [model.model_validate(dict(zip(names, row))) for row in self.rows()]
+
+
+class _Submission:
+    """Hands the statement id from the worker thread submitting it to the task awaiting it.
+
+    Whichever side comes second cancels the statement when the task gives up mid-submission.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._statement_id: Optional[str] = None
+        self._abandoned = False
+
+    def submitted(self, statement_id: Optional[str]) -> bool:
+        """Record the submitted statement; False if the awaiting task has given up on it"""
+        with self._lock:
+            self._statement_id = statement_id
+            return not self._abandoned
+
+    def abandon(self) -> Optional[str]:
+        """Give up on the statement, returning its id if it was already submitted"""
+        with self._lock:
+            self._abandoned = True
+            return self._statement_id
+
+
+class StatementExecutor:
+    """Runs SQL statements through one long-lived WorkspaceClient on a cached warehouse.
+
+    Statements are submitted with a short wait and, if still pending or running, polled with
+    exponential backoff until they finish or their deadline passes, which cancels them. The async
+    methods run every SDK call in a worker thread, so they never block the event loop. The client is
+    created on first use, so importing this module needs no credentials.
+    """
+
+    def __init__(
+        self,
+        client_factory: Callable[[], WorkspaceClient] = WorkspaceClient,
+        warehouse_ttl: float = DATABRICKS_WAREHOUSE_TTL,
+        submit_wait: str = DATABRICKS_SUBMIT_WAIT,
+        poll_interval: float = DATABRICKS_POLL_INTERVAL,
+        max_poll_interval: float = DATABRICKS_MAX_POLL_INTERVAL,
+        max_concurrency: int = DATABRICKS_MAX_CONCURRENCY,
+        open_link: Optional[Callable[[ExternalLink], BinaryIO]] = None,
+    ) -> None:
+        self._client_factory = client_factory
+        self._client: Optional[WorkspaceClient] = None
+        self._lock = threading.Lock()
+        self.warehouses = WarehouseResolver(lambda: self.client, warehouse_ttl)
+        self.submit_wait = submit_wait
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.max_concurrency = max_concurrency
+        self._slots: Optional[asyncio.Semaphore] = None
+        self.open_link = open_link or open_external_link
+
+    @property
+    def client(self) -> WorkspaceClient:
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = self._client_factory()
+        return self._client
+
+    def execute(
+        self,
+        query: str,
+        timeout: float = DATABRICKS_QUERY_TIMEOUT,
+        parameters: Optional[Mapping[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Execute query and return all its rows as dictionaries, blocking until it finishes"""
+        return list(self.stream(query, timeout, parameters=parameters).dicts())
+
+    def stream(
+        self,
+        query: str,
+        timeout: float = DATABRICKS_QUERY_TIMEOUT,
+        bounded_memory: bool = False,
+        parameters: Optional[Mapping[str, Any]] = None,
+    ) -> ResultStream:
+        """Execute query, blocking until it finishes, and return its rows as a lazily fetched stream.
+
+        Inline results are limited to 25 MiB by Databricks; bounded_memory fetches the result as CSV
+        external links instead, which are parsed while they download. parameters fill the query's
+        :name markers. Raises TimeoutError, after cancelling the statement, if it runs longer than
+        timeout seconds.
+        """
+        disposition, result_format = result_options(bounded_memory)
+        deadline = time.monotonic() + timeout
+        response = self._submit(query, None, disposition, result_format, parameters)
+        delays = poll_delays(self.poll_interval, self.max_poll_interval)
+        while still_running(response):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self._cancel(response.statement_id)
+                raise TimeoutError(f"Query did not finish within {timeout:g}s")
+            time.sleep(min(next(delays), remaining))
+            response = self.client.statement_execution.get_statement(response.statement_id)
+        return ResultStream(self.client.statement_execution, finished(response), self.open_link)
+
+    async def aexecute(
+        self,
+        query: str,
+        timeout: float = DATABRICKS_QUERY_TIMEOUT,
+        parameters: Optional[Mapping[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Async variant of execute; cancelling the awaiting task also cancels the statement"""
+        result = await self.astream(query, timeout, parameters=parameters)
+        return await asyncio.to_thread(list, result.dicts())
+
+    def columnar(
+        self, query: str, timeout: float = DATABRICKS_QUERY_TIMEOUT, bounded_memory: bool = False
+    ) -> ColumnarResult:
+        """Execute query and return its result column by column in typed arrays"""
+        return ColumnarResult.from_stream(self.stream(query, timeout, bounded_memory))
+
+    async def astream(
+        self,
+        query: str,
+        timeout: float = DATABRICKS_QUERY_TIMEOUT,
+        bounded_memory: bool = False,
+        parameters: Optional[Mapping[str, Any]] = None,
+    ) -> ResultStream:
+        """Async variant of stream; cancelling the awaiting task also cancels the statement.
+
+        At most max_concurrency statements per executor are in flight, the others wait for a slot.
+        Reading the stream fetches chunks with blocking calls, so iterate it in a worker thread.
+        """
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_concurrency)
+        disposition, result_format = result_options(bounded_memory)
+        submission = _Submission()
+        try:
+            async with asyncio.timeout(timeout), self._slots:
+                response = await asyncio.to_thread(
+                    self._submit, query, submission, disposition, result_format, parameters
+                )
+                delays = poll_delays(self.poll_interval, self.max_poll_interval)
+                while still_running(response):
+                    await asyncio.sleep(next(delays))
+                    response = await asyncio.to_thread(
+                        self.client.statement_execution.get_statement, response.statement_id
+                    )
+        except TimeoutError:
+            self._cancel_in_background(submission.abandon())
+            raise TimeoutError(f"Query did not finish within {timeout:g}s") from None
+        except asyncio.CancelledError:
+            self._cancel_in_background(submission.abandon())
+            raise
+        return ResultStream(self.client.statement_execution, finished(response), self.open_link)
+
+    async def acolumnar(
+        self, query: str, timeout: float = DATABRICKS_QUERY_TIMEOUT, bounded_memory: bool = False
+    ) -> ColumnarResult:
+        """Async variant of columnar; the result is read into columns in a worker thread"""
+        result = await self.astream(query, timeout, bounded_memory)
+        return await asyncio.to_thread(ColumnarResult.from_stream, result)
+
+    async def aexecute_many(
+        self, queries: Sequence[str], timeout: float = DATABRICKS_QUERY_TIMEOUT
+    ) -> List[List[Dict[str, Any]]]:
+        """Run queries concurrently and return their rows in query order.
+
+        If one of them fails the others are cancelled, together with their statements, and its
+        error is raised.
+        """
+        try:
+            async with asyncio.TaskGroup() as group:
+                tasks = [group.create_task(self.aexecute(query, timeout)) for query in queries]
+        except ExceptionGroup as errors:
+            raise errors.exceptions[0] from None
+        return [task.result() for task in tasks]
+
+    def _submit(
+        self,
+        query: str,
+        submission: Optional[_Submission] = None,
+        disposition: Disposition = Disposition.INLINE,
+        result_format: Format = Format.JSON_ARRAY,
+        parameters: Optional[Mapping[str, Any]] = None,
+    ) -> StatementResponse:
+        """Submit query, retrying once on a newly resolved warehouse if its warehouse is unavailable"""
+        warehouse_id = self.warehouses.warehouse_id()
+        try:
+            response = self._submit_to(warehouse_id, query, disposition, result_format, parameters)
+        except Exception as e:
+            if not warehouse_unavailable(e):
+                raise
+            logger.warning(f"Warehouse {warehouse_id} unavailable, resolving another: {e}")
+            self.warehouses.invalidate(warehouse_id)
+            response = self._submit_to(self.warehouses.warehouse_id(), query, disposition, result_format, parameters)
+        if submission is not None and not submission.submitted(response.statement_id) and still_running(response):
+            # the awaiting task gave up while the statement was being submitted
+            self._cancel(response.statement_id)
+        return response
+
+    def _submit_to(
+        self,
+        warehouse_id: str,
+        query: str,
+        disposition: Disposition,
+        result_format: Format,
+        parameters: Optional[Mapping[str, Any]] = None,
+    ) -> StatementResponse:
+        one_line = query.replace("\n", "\t")
+        logger.info(f"Executing query {one_line} on warehouse: {warehouse_id}")
+        response = self.client.statement_execution.execute_statement(
+            warehouse_id=warehouse_id,
+            statement=query,
+            wait_timeout=self.submit_wait,
+            on_wait_timeout=ExecuteStatementRequestOnWaitTimeout.CONTINUE,
+            disposition=disposition,
+            format=result_format,
+            parameters=statement_parameters(parameters),
+        )
+        # a statement that failed straight away is reported now, so a missing warehouse can be retried
+        return response if still_running(response) else finished(response)
+
+    def _cancel(self, statement_id: Optional[str]) -> None:
+        if statement_id is None:
+            return
+        try:
+            self.client.statement_execution.cancel_execution(statement_id)
+        except Exception as e:
+            logger.error(f"Error cancelling statement {statement_id}: {e}")
+
+    def _cancel_in_background(self, statement_id: Optional[str]) -> None:
+        # the awaiting task is being torn down, so the cancel request must not depend on it
+        if statement_id is not None:
+            threading.Thread(target=self._cancel, args=(statement_id,), name="statement-cancel", daemon=True).start()
+
+
+def statement_parameters(parameters: Optional[Mapping[str, Any]]) -> Optional[List[StatementParameterListItem]]:
+    """parameters as named statement parameters; values are sent as strings and None as NULL"""
+    if not parameters:
+        return None
+    return [
+        StatementParameterListItem(name=name, value=None if value is None else str(value))
+        for name, value in parameters.items()
+    ]
+
+
+def poll_delays(initial: float, maximum: float) -> Iterator[float]:
+    """Seconds to wait before each poll: initial, doubling up to maximum"""
+    delay = initial
+    while True:
+        yield delay
+        delay = min(delay * 2, maximum)
+
+
+def still_running(response: StatementResponse) -> bool:
+    return response.status is not None and response.status.state in (StatementState.PENDING, StatementState.RUNNING)
+
+
+def finished(response: StatementResponse) -> StatementResponse:
+    """response if its statement succeeded, otherwise raise RuntimeError with the failure"""
+    if response.status is None:
         raise RuntimeError("Execution status is None")
 
-    if execution.status.state != StatementState.SUCCEEDED:
-        error_msg = f"Query failed with state: {execution.status.state}"
-        if execution.status.error is not None:
-            error_msg += f" - {execution.status.error.message}"
+    if response.status.state != StatementState.SUCCEEDED:
+        error_msg = f"Query failed with state: {response.status.state}"
+        if response.status.error is not None:
+            error_msg += f" - {response.status.error.message}"
         raise RuntimeError(error_msg)
+    return response
 
-    # convert result to dictionaries
-    if (
-        execution.result is not None
-        and execution.result.data_array is not None
-        and execution.manifest is not None
-        and execution.manifest.schema is not None
-        and execution.manifest.schema.columns is not None
-    ):
-        col_names = [col.name or "" for col in execution.manifest.schema.columns]
-        rows = execution.result.data_array
-        return [dict(zip(col_names, row)) for row in rows]
 
-    return []
+STATEMENT_EXECUTOR = StatementExecutor()
+
+
+def execute_databricks_query(
+    query: str, parameters: Optional[Mapping[str, Any]] = None, cache: bool = True
+) -> List[Dict[str, Any]]:
+    """helper function to execute SQL query via the shared WorkspaceClient.
+
+    SELECT and WITH results are cached by DATABRICKS_QUERY_CACHE unless cache is False (e.g. for
+    reads of current_timestamp() or rand()), and identical queries running at the same time share
+    one execution; the returned rows are shared and must not be modified. Any other statement runs
+    every time and then drops the cached results, since it may have changed what they read.
+    """
+    if not read_only_statement(query):
+        rows = STATEMENT_EXECUTOR.execute(query, parameters=parameters)
+        invalidate_databricks_query_cache()
+        return rows
+    if not cache:
+        return STATEMENT_EXECUTOR.execute(query, parameters=parameters)
+    return DATABRICKS_QUERY_CACHE.get_or_load(
+        query, lambda: STATEMENT_EXECUTOR.execute(query, parameters=parameters), parameters
+    )
+
+
+async def aexecute_databricks_query(
+    query: str, parameters: Optional[Mapping[str, Any]] = None, cache: bool = True
+) -> List[Dict[str, Any]]:
+    """Async variant of execute_databricks_query that keeps the event loop free while the query runs"""
+    if not read_only_statement(query):
+        rows = await STATEMENT_EXECUTOR.aexecute(query, parameters=parameters)
+        invalidate_databricks_query_cache()
+        return rows
+    if not cache:
+        return await STATEMENT_EXECUTOR.aexecute(query, parameters=parameters)
+    return await DATABRICKS_QUERY_CACHE.aget_or_load(
+        query, lambda: STATEMENT_EXECUTOR.aexecute(query, parameters=parameters), parameters
+    )
+
+
+def invalidate_databricks_query_cache() -> None:
+    """Drop every cached Databricks result, e.g. after writing to the tables they read outside this module"""
+    DATABRICKS_QUERY_CACHE.invalidate()
 
 
 class DatabricksModel(BaseModel):
@@ -62,6 +669,11 @@ class DatabricksModel(BaseModel):
     def table_name(cls) -> str:
         return f"{cls.__catalog__}.{cls.__schema__}.{cls.__table__}"
 
+    @classmethod
+    def fetch_columns(cls, query: Optional[str] = None) -> ColumnarResult:
+        """Rows of query, by default the whole table, as typed columns; to_models(cls) converts them"""
+        return STATEMENT_EXECUTOR.columnar(query or f"SELECT * FROM {cls.table_name()}")
+
     @classmethod
     def fetch(cls: type[T], **params) -> Sequence[T]:
         raise NotImplementedError(f"Must implement fetch() method, but {cls.__name__} does not have it.")
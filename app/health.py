@@ -0,0 +1,218 @@
+import asyncio
+import logging
+import math
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+from sqlalchemy import Engine, NullPool, create_engine, text
+
+from app.database import ENGINE, pool_stats
+from app.db_pool import PoolStats
+from app.page_view_buffer import PAGE_VIEW_BUFFER, PageViewBuffer
+
+logger = logging.getLogger(__name__)
+
+# Reports are reused this long, so frequent or concurrent probes cost at most one check per interval
+HEALTH_CACHE_TTL = float(os.environ.get("APP_HEALTH_CACHE_TTL", "2.0"))
+# A probe still running after this long fails; docker-compose gives up on /health after 3 seconds
+HEALTH_PROBE_TIMEOUT = float(os.environ.get("APP_HEALTH_PROBE_TIMEOUT", "1.5"))
+HEALTH_DB_BUDGET_MS = float(os.environ.get("APP_HEALTH_DB_BUDGET_MS", "100"))
+# Share of checked-out connections (of pool size plus overflow) that degrades or fails readiness
+HEALTH_POOL_WARN_RATIO = float(os.environ.get("APP_HEALTH_POOL_WARN_RATIO", "0.8"))
+HEALTH_POOL_FAIL_RATIO = float(os.environ.get("APP_HEALTH_POOL_FAIL_RATIO", "1.0"))
+# Share of the page view buffer in use; a filling queue means its writes are not getting through
+HEALTH_QUEUE_WARN_RATIO = float(os.environ.get("APP_HEALTH_QUEUE_WARN_RATIO", "0.5"))
+HEALTH_QUEUE_FAIL_RATIO = float(os.environ.get("APP_HEALTH_QUEUE_FAIL_RATIO", "0.9"))
+
+PASS = "pass"
+WARN = "warn"
+FAIL = "fail"
+_SEVERITY = {PASS: 0, WARN: 1, FAIL: 2}
+
+# A check returns (status, detail) and may raise, which counts as a failure
+Check = Callable[[], Tuple[str, str]]
+
+
+@dataclass(frozen=True, slots=True)
+class HealthProbe:
+    """A named readiness check; a passing check slower than budget_ms is reported as a warning"""
+
+    name: str
+    check: Check
+    budget_ms: float
+
+
+@dataclass(frozen=True, slots=True)
+class ProbeResult:
+    name: str
+    status: str
+    latency_ms: float
+    detail: str
+
+
+@dataclass(frozen=True, slots=True)
+class HealthReport:
+    status: str
+    checks: Tuple[ProbeResult, ...]
+    checked_at: float
+
+    @property
+    def ready(self) -> bool:
+        return self.status != FAIL
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "status": self.status,
+            "checked_at": self.checked_at,
+            "checks": {
+                result.name: {
+                    "status": result.status,
+                    "latency_ms": round(result.latency_ms, 3),
+                    "detail": result.detail,
+                }
+                for result in self.checks
+            },
+        }
+
+
+def _ratio_status(ratio: float, warn_ratio: float, fail_ratio: float) -> str:
+    if ratio >= fail_ratio:
+        return FAIL
+    if ratio >= warn_ratio:
+        return WARN
+    return PASS
+
+
+def database_check(engine: Engine = ENGINE, timeout: float = HEALTH_PROBE_TIMEOUT) -> Check:
+    """Round trip of SELECT 1 to the engine's database on a connection outside its pool.
+
+    A timed-out probe is only no longer awaited; its thread keeps running. Through a saturated pool it
+    would block on checkout for pool_timeout, so the probe connects on its own and gives up after
+    timeout (libpq waits at least 2s to connect). pool_check reports the saturation.
+    """
+    probe_engine = create_engine(
+        engine.url,
+        poolclass=NullPool,
+        connect_args={
+            "connect_timeout": max(math.ceil(timeout), 1),
+            "options": f"-c statement_timeout={math.ceil(timeout * 1000)}",
+        },
+    )
+
+    def check() -> Tuple[str, str]:
+        with probe_engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        return PASS, "SELECT 1 succeeded"
+
+    return check
+
+
+def pool_check(
+    stats: Callable[[], Dict[str, PoolStats]] = pool_stats,
+    warn_ratio: float = HEALTH_POOL_WARN_RATIO,
+    fail_ratio: float = HEALTH_POOL_FAIL_RATIO,
+) -> Check:
+    """Saturation of the busiest connection pool"""
+
+    def check() -> Tuple[str, str]:
+        status, details = PASS, []
+        for name, pool in stats().items():
+            capacity = pool.size + max(pool.max_overflow, 0)
+            ratio = pool.checked_out / capacity if capacity > 0 else 0.0
+            pool_status = _ratio_status(ratio, warn_ratio, fail_ratio)
+            if _SEVERITY[pool_status] > _SEVERITY[status]:
+                status = pool_status
+            details.append(f"{name} {pool.checked_out}/{capacity} checked out")
+        return status, ", ".join(details)
+
+    return check
+
+
+def queue_check(
+    buffer: PageViewBuffer = PAGE_VIEW_BUFFER,
+    warn_ratio: float = HEALTH_QUEUE_WARN_RATIO,
+    fail_ratio: float = HEALTH_QUEUE_FAIL_RATIO,
+) -> Check:
+    """Depth of the page view write-behind queue"""
+
+    def check() -> Tuple[str, str]:
+        pending = buffer.stats().pending
+        status = _ratio_status(pending / buffer.max_size if buffer.max_size > 0 else 0.0, warn_ratio, fail_ratio)
+        return status, f"{pending}/{buffer.max_size} page views pending"
+
+    return check
+
+
+def default_probes() -> Tuple[HealthProbe, ...]:
+    return (
+        HealthProbe("database", database_check(), HEALTH_DB_BUDGET_MS),
+        # In-memory checks; their budgets only flag a starved thread pool or event loop
+        HealthProbe("connection_pool", pool_check(), 50.0),
+        HealthProbe("page_view_queue", queue_check(), 50.0),
+    )
+
+
+class HealthChecker:
+    """Runs readiness probes concurrently and caches the report for ttl_seconds.
+
+    Concurrent callers during a check wait for that check instead of starting their own, so
+    health traffic never adds more than one probe round per interval to the database.
+    """
+
+    def __init__(
+        self,
+        probes: Optional[Sequence[HealthProbe]] = None,
+        ttl_seconds: float = HEALTH_CACHE_TTL,
+        timeout: float = HEALTH_PROBE_TIMEOUT,
+    ) -> None:
+        self.probes = tuple(probes) if probes is not None else default_probes()
+        self.ttl_seconds = ttl_seconds
+        self.timeout = timeout
+        self._report: Optional[HealthReport] = None
+        self._expires_at = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def check(self) -> HealthReport:
+        report = self._cached()
+        if report is not None:
+            return report
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            report = self._cached()
+            if report is not None:
+                return report
+            results = await asyncio.gather(*(self._run(probe) for probe in self.probes))
+            status = max((result.status for result in results), key=_SEVERITY.__getitem__, default=PASS)
+            report = HealthReport(status=status, checks=tuple(results), checked_at=time.time())
+            self._report, self._expires_at = report, time.monotonic() + self.ttl_seconds
+            return report
+
+    def clear(self) -> None:
+        self._report = None
+        self._expires_at = 0.0
+
+    def _cached(self) -> Optional[HealthReport]:
+        if self._report is not None and time.monotonic() < self._expires_at:
+            return self._report
+        return None
+
+    async def _run(self, probe: HealthProbe) -> ProbeResult:
+        start = time.perf_counter()
+        try:
+            status, detail = await asyncio.wait_for(asyncio.to_thread(probe.check), self.timeout)
+        except asyncio.TimeoutError:
+            status, detail = FAIL, f"timed out after {self.timeout:g}s"
+        except Exception as e:
+            logger.error(f"Health probe {probe.name} failed: {e}")
+            # The endpoint is public: report the error type only, the log has the message
+            status, detail = FAIL, type(e).__name__
+        latency_ms = (time.perf_counter() - start) * 1000
+        if status == PASS and latency_ms > probe.budget_ms:
+            status, detail = WARN, f"{detail}; {latency_ms:.1f}ms exceeds the {probe.budget_ms:g}ms budget"
+        return ProbeResult(name=probe.name, status=status, latency_ms=latency_ms, detail=detail)
+
+
+HEALTH_CHECKER = HealthChecker()
@@ -0,0 +1,275 @@
+import functools
+import inspect
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from app.metrics import Histogram
+
+logger = logging.getLogger(__name__)
+
+# Detailed per-method statistics are opt-in; the duration histogram is always recorded
+SERVICE_INSTRUMENTATION_ENABLED = os.environ.get("APP_SERVICE_INSTRUMENTATION", "false").lower() in ("1", "true", "yes")
+SERVICE_SLOW_CALL_MS = float(os.environ.get("APP_SERVICE_SLOW_CALL_MS", "100"))
+# Most recent durations kept per method for the percentiles
+SERVICE_LATENCY_SAMPLES = int(os.environ.get("APP_SERVICE_LATENCY_SAMPLES", "1024"))
+
+SORT_KEYS = ("total_ms", "calls", "mean_ms", "p95_ms", "max_ms", "errors", "rows")
+
+
+@dataclass(frozen=True, slots=True)
+class MethodStats:
+    """Calls of one service method since instrumentation was enabled or last reset.
+
+    Percentiles cover the most recent calls only, so they follow the current load.
+    """
+
+    name: str
+    calls: int
+    errors: int
+    slow_calls: int
+    rows: int
+    total_ms: float
+    max_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.calls if self.calls else 0.0
+
+
+class _MethodRecorder:
+    def __init__(self, name: str, max_samples: int) -> None:
+        self.name = name
+        self._samples: Deque[float] = deque(maxlen=max_samples)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._calls = 0
+            self._errors = 0
+            self._slow_calls = 0
+            self._rows = 0
+            self._total_ms = 0.0
+            self._max_ms = 0.0
+            self._samples.clear()
+
+    def record(self, elapsed_ms: float, rows: int, slow: bool) -> None:
+        with self._lock:
+            self._calls += 1
+            self._rows += rows
+            self._total_ms += elapsed_ms
+            self._max_ms = max(self._max_ms, elapsed_ms)
+            self._samples.append(elapsed_ms)
+            if slow:
+                self._slow_calls += 1
+
+    def record_error(self) -> None:
+        with self._lock:
+            self._errors += 1
+
+    def snapshot(self) -> MethodStats:
+        with self._lock:
+            samples = sorted(self._samples)
+            return MethodStats(
+                name=self.name,
+                calls=self._calls,
+                errors=self._errors,
+                slow_calls=self._slow_calls,
+                rows=self._rows,
+                total_ms=self._total_ms,
+                max_ms=self._max_ms,
+                p50_ms=percentile(samples, 0.50),
+                p95_ms=percentile(samples, 0.95),
+                p99_ms=percentile(samples, 0.99),
+            )
+
+
+def percentile(ordered: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an ascending list"""
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))]
+
+
+def count_rows(result: Any) -> int:
+    """Rows a service call returned: the length of collections, 0 for None, otherwise 1"""
+    if result is None or isinstance(result, bool):
+        return 0
+    if isinstance(result, (list, tuple, dict, set, frozenset)):
+        return len(result)
+    return 1
+
+
+# Set during an instrumented call: calls it makes to other instrumented methods are covered by its
+# duration, so they are not recorded again
+_IN_SERVICE_CALL: ContextVar[bool] = ContextVar("in_service_call", default=False)
+# Recorder of the current instrumented call, so errors logged inside it are attributed to it
+_CURRENT_CALL: ContextVar[Optional[_MethodRecorder]] = ContextVar("current_service_call", default=None)
+
+
+class _ErrorLogFilter(logging.Filter):
+    """Counts ERROR records logged during an instrumented call.
+
+    Service methods catch their exceptions and log them, so the log is where failures show up.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.ERROR:
+            recorder = _CURRENT_CALL.get()
+            if recorder is not None:
+                recorder.record_error()
+        return True
+
+
+# One shared filter: addFilter() ignores it on loggers that already have it
+_ERROR_LOG_FILTER = _ErrorLogFilter()
+
+
+class ServiceInstrumentation:
+    """Opt-in call statistics for the static methods of a service class.
+
+    While disabled an instrumented call costs one attribute check on top of the duration
+    histogram. Enabled, every call also records its count, duration, rows returned and logged
+    errors, and calls slower than slow_call_ms are logged with a warning.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = SERVICE_INSTRUMENTATION_ENABLED,
+        slow_call_ms: float = SERVICE_SLOW_CALL_MS,
+        max_samples: int = SERVICE_LATENCY_SAMPLES,
+    ) -> None:
+        self.enabled = enabled
+        self.slow_call_ms = slow_call_ms
+        self.max_samples = max_samples
+        self._recorders: Dict[str, _MethodRecorder] = {}
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def reset(self) -> None:
+        for recorder in self._recorders.values():
+            recorder.reset()
+
+    def snapshot(self) -> Dict[str, MethodStats]:
+        """Statistics of every method called at least once"""
+        stats = (recorder.snapshot() for recorder in self._recorders.values())
+        return {method.name: method for method in stats if method.calls}
+
+    def report(self, sort_by: str = "total_ms", limit: Optional[int] = None) -> str:
+        """Plain-text table of the method statistics, most expensive first"""
+        if sort_by not in SORT_KEYS:
+            raise ValueError(f"Unknown sort key {sort_by!r}, expected one of {SORT_KEYS}")
+        methods = sorted(self.snapshot().values(), key=lambda method: getattr(method, sort_by), reverse=True)
+        lines = [
+            f"{'method':<40} {'calls':>8} {'errors':>6} {'slow':>6} {'rows':>8} "
+            f"{'total ms':>10} {'mean':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8}"
+        ]
+        for method in methods[:limit]:
+            lines.append(
+                f"{method.name:<40} {method.calls:>8} {method.errors:>6} {method.slow_calls:>6} {method.rows:>8} "
+                f"{method.total_ms:>10.1f} {method.mean_ms:>8.2f} {method.p50_ms:>8.2f} {method.p95_ms:>8.2f} "
+                f"{method.p99_ms:>8.2f} {method.max_ms:>8.2f}"
+            )
+        return "\n".join(lines)
+
+    def instrument(self, histogram: Histogram) -> Callable[[type], type]:
+        """Class decorator wrapping every public static method, sync or async.
+
+        The histogram is labelled by method name and observed on every call. Only the outermost
+        instrumented call is recorded, so nested calls are not counted twice.
+        """
+
+        def decorate(cls: type) -> type:
+            logging.getLogger(cls.__module__).addFilter(_ERROR_LOG_FILTER)
+            for name, member in list(vars(cls).items()):
+                if name.startswith("_") or not isinstance(member, staticmethod):
+                    continue
+                qualified = f"{cls.__name__}.{name}"
+                recorder = self._recorders.setdefault(qualified, _MethodRecorder(qualified, self.max_samples))
+                wrapped = self._wrap(member.__func__, recorder, histogram.labels(name))
+                setattr(cls, name, staticmethod(wrapped))
+            return cls
+
+        return decorate
+
+    def _wrap(self, func: Callable[..., Any], recorder: _MethodRecorder, duration: Any) -> Callable[..., Any]:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                if _IN_SERVICE_CALL.get():
+                    return await func(*args, **kwargs)
+                outer = _IN_SERVICE_CALL.set(True)
+                start = time.perf_counter()
+                if not self.enabled:
+                    try:
+                        return await func(*args, **kwargs)
+                    finally:
+                        _IN_SERVICE_CALL.reset(outer)
+                        duration.observe(time.perf_counter() - start)
+                token = _CURRENT_CALL.set(recorder)
+                result = None
+                try:
+                    result = await func(*args, **kwargs)
+                    return result
+                except Exception:
+                    recorder.record_error()
+                    raise
+                finally:
+                    _CURRENT_CALL.reset(token)
+                    _IN_SERVICE_CALL.reset(outer)
+                    self._finish(recorder, duration, start, result)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if _IN_SERVICE_CALL.get():
+                return func(*args, **kwargs)
+            outer = _IN_SERVICE_CALL.set(True)
+            start = time.perf_counter()
+            if not self.enabled:
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    _IN_SERVICE_CALL.reset(outer)
+                    duration.observe(time.perf_counter() - start)
+            token = _CURRENT_CALL.set(recorder)
+            result = None
+            try:
+                result = func(*args, **kwargs)
+                return result
+            except Exception:
+                recorder.record_error()
+                raise
+            finally:
+                _CURRENT_CALL.reset(token)
+                _IN_SERVICE_CALL.reset(outer)
+                self._finish(recorder, duration, start, result)
+
+        return wrapper
+
+    def _finish(self, recorder: _MethodRecorder, duration: Any, start: float, result: Any) -> None:
+        elapsed = time.perf_counter() - start
+        duration.observe(elapsed)
+        elapsed_ms = elapsed * 1000
+        slow = elapsed_ms >= self.slow_call_ms
+        if slow:
+            logger.warning(f"Slow call {recorder.name} took {elapsed_ms:.1f}ms (threshold {self.slow_call_ms:g}ms)")
+        recorder.record(elapsed_ms, count_rows(result), slow)
+
+
+SERVICE_INSTRUMENTATION = ServiceInstrumentation()
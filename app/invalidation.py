@@ -0,0 +1,146 @@
+import logging
+import select
+import threading
+from typing import Dict, Optional
+
+from sqlalchemy import Engine
+from sqlmodel import text
+
+from app.content_cache import CONTENT_CACHE, LANDING_NAMESPACE, SITE_CONFIG_NAMESPACE, ContentCache
+from app.database import ENGINE
+
+logger = logging.getLogger(__name__)
+
+NOTIFY_CHANNEL = "content_changed"
+
+# Table whose rows changed (the notification payload) -> cache namespace derived from it
+TABLE_NAMESPACES: Dict[str, str] = {
+    "hero_sections": LANDING_NAMESPACE,
+    "services": LANDING_NAMESPACE,
+    "benefits": LANDING_NAMESPACE,
+    "call_to_actions": LANDING_NAMESPACE,
+    "footer_contents": LANDING_NAMESPACE,
+    "site_configurations": SITE_CONFIG_NAMESPACE,
+}
+
+NOTIFY_FUNCTION_SQL = f"""
+CREATE OR REPLACE FUNCTION notify_content_changed() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('{NOTIFY_CHANNEL}', TG_TABLE_NAME);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+# CREATE OR REPLACE TRIGGER needs PostgreSQL 14 or later
+NOTIFY_TRIGGER_SQL = """
+CREATE OR REPLACE TRIGGER {table}_notify_content_changed
+AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table}
+FOR EACH STATEMENT EXECUTE FUNCTION notify_content_changed()
+"""
+
+# Serializes the trigger DDL of workers starting together, which would otherwise fail with
+# "tuple concurrently updated"; any constant works as long as nothing else locks it
+NOTIFY_INSTALL_LOCK = 0x636F6E74656E74
+
+
+def install_notify_triggers(engine: Engine = ENGINE) -> None:
+    """Create statement-level triggers that NOTIFY on every write to a cached content table"""
+    with engine.begin() as conn:
+        conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": NOTIFY_INSTALL_LOCK})
+        conn.execute(text(NOTIFY_FUNCTION_SQL))
+        for table in TABLE_NAMESPACES:
+            conn.execute(text(NOTIFY_TRIGGER_SQL.format(table=table)))
+
+
+class InvalidationListener:
+    """Background thread that LISTENs for content changes and evicts the matching cache namespace.
+
+    Changes made by any worker process reach every process sharing the database. After each
+    (re)connect the whole cache is invalidated, since notifications sent while disconnected are lost.
+    """
+
+    def __init__(
+        self,
+        cache: ContentCache = CONTENT_CACHE,
+        engine: Engine = ENGINE,
+        channel: str = NOTIFY_CHANNEL,
+        poll_interval: float = 1.0,
+        reconnect_delay: float = 5.0,
+    ) -> None:
+        self.cache = cache
+        self.engine = engine
+        self.channel = channel
+        self.poll_interval = poll_interval
+        self.reconnect_delay = reconnect_delay
+        self._stop = threading.Event()
+        self._listening = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start listening in a daemon thread; calling it again while running is a no-op"""
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="content-invalidation-listener", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Signal the listener to stop and wait for its thread to exit"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout if timeout is not None else self.poll_interval * 2)
+            self._thread = None
+        self._listening.clear()
+
+    def wait_until_listening(self, timeout: float) -> bool:
+        """Block until the LISTEN is active, returning False on timeout"""
+        return self._listening.wait(timeout)
+
+    def handle(self, table: str) -> None:
+        """Evict the cache namespace derived from the changed table"""
+        namespace = TABLE_NAMESPACES.get(table)
+        if namespace is None:
+            logger.warning(f"Ignoring change notification for unknown table: {table}")
+            return
+        logger.debug(f"Content of {table} changed, invalidating cache namespace {namespace}")
+        self.cache.invalidate(namespace)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self._listen()
+            except Exception as e:
+                logger.error(f"Content invalidation listener error, reconnecting: {e}")
+                self._listening.clear()
+                self._stop.wait(self.reconnect_delay)
+
+    def _listen(self) -> None:
+        # A detached connection lives outside the pool, so listening does not hold a pool slot
+        pooled = self.engine.raw_connection()
+        connection = pooled.driver_connection
+        assert connection is not None, "raw_connection() returned a closed connection"
+        pooled.detach()
+        try:
+            connection.autocommit = True
+            with connection.cursor() as cursor:
+                cursor.execute(f"LISTEN {self.channel}")
+            self.cache.invalidate()
+            self._listening.set()
+
+            while not self._stop.is_set():
+                readable, _, _ = select.select([connection], [], [], self.poll_interval)
+                if not readable:
+                    continue
+                connection.poll()
+                while connection.notifies:
+                    self.handle(connection.notifies.pop(0).payload)
+        finally:
+            pooled.close()
+
+
+CONTENT_LISTENER = InvalidationListener()
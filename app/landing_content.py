@@ -0,0 +1,294 @@
+from dataclasses import dataclass
+from typing import Tuple
+
+from app.content_cache import LandingContentSnapshot
+
+# Landing page copy and theme, shared by the live NiceGUI page and the static renderer.
+# Sections stored in the database replace the defaults below.
+THEME_META = """\
+<meta name="viewport" content="width=device-width, initial-scale=1.0">
+<meta name="description" content="Professional IT Smart Home Solutions - Transform your home with cutting-edge technology">
+<meta name="keywords" content="smart home, IT solutions, home automation, security systems, energy management">
+<meta name="robots" content="index, follow">
+<meta http-equiv="X-Content-Type-Options" content="nosniff">
+<meta http-equiv="X-Frame-Options" content="DENY">
+<meta http-equiv="X-XSS-Protection" content="1; mode=block">
+<meta http-equiv="Referrer-Policy" content="strict-origin-when-cross-origin">
+"""
+
+THEME_CSS = """\
+:root {
+    --primary-blue: #2563eb;
+    --dark-bg: #0f172a;
+    --darker-bg: #020617;
+    --light-blue: #3b82f6;
+    --text-light: #e2e8f0;
+    --text-gray: #64748b;
+}
+
+.hero-gradient {
+    background: linear-gradient(135deg, var(--darker-bg) 0%, var(--dark-bg) 50%, var(--primary-blue) 100%);
+}
+
+.glass-card {
+    background: rgba(15, 23, 42, 0.8);
+    backdrop-filter: blur(10px);
+    border: 1px solid rgba(59, 130, 246, 0.2);
+}
+
+.service-card {
+    background: var(--dark-bg);
+    border: 1px solid rgba(59, 130, 246, 0.1);
+    transition: all 0.3s ease;
+}
+
+.service-card:hover {
+    border-color: var(--primary-blue);
+    transform: translateY(-4px);
+    box-shadow: 0 20px 25px -5px rgba(0, 0, 0, 0.3);
+}
+
+.benefit-item {
+    background: rgba(15, 23, 42, 0.6);
+    border-left: 4px solid var(--primary-blue);
+}
+
+.cta-button {
+    background: linear-gradient(45deg, var(--primary-blue), var(--light-blue));
+    transition: all 0.3s ease;
+}
+
+.cta-button:hover {
+    transform: translateY(-2px);
+    box-shadow: 0 10px 20px rgba(37, 99, 235, 0.3);
+}
+
+.whatsapp-btn {
+    background: linear-gradient(45deg, #25d366, #128c7e);
+}
+
+.email-btn {
+    background: linear-gradient(45deg, var(--primary-blue), #1d4ed8);
+}
+
+body {
+    background-color: var(--darker-bg);
+    color: var(--text-light);
+}
+
+/* Responsive design */
+@media (max-width: 768px) {
+    .hero-content {
+        padding: 2rem 1rem;
+    }
+    .service-grid {
+        grid-template-columns: 1fr;
+    }
+}
+
+/* Accessibility improvements */
+.btn-focus:focus {
+    outline: 2px solid var(--primary-blue);
+    outline-offset: 2px;
+}
+
+/* Security: Hide potential info leakage */
+.no-select {
+    -webkit-user-select: none;
+    -moz-user-select: none;
+    -ms-user-select: none;
+    user-select: none;
+}
+"""
+
+# Quasar brand colors, black and blue scheme
+THEME_COLORS: Tuple[Tuple[str, str], ...] = (
+    ("primary", "#2563eb"),  # Professional blue
+    ("secondary", "#1e293b"),  # Dark slate
+    ("accent", "#3b82f6"),  # Bright blue
+    ("positive", "#10b981"),  # Success green
+    ("negative", "#ef4444"),  # Error red
+    ("warning", "#f59e0b"),  # Warning amber
+    ("info", "#06b6d4"),  # Info cyan
+)
+
+COMPANY_NAME = "SmartHome IT Solutions"
+COMPANY_TAGLINE = (
+    "Transforming homes with cutting-edge technology solutions. "
+    "Your trusted partner for smart home automation and IT infrastructure."
+)
+CONTACT_EMAIL = "info@smarthome-it.com"
+CONTACT_PHONE = "+1 (555) 123-SMART"
+CONTACT_HOURS = "Available Monday-Friday, 9AM-6PM EST"
+CONTACT_ADDRESS = "123 Technology Drive, Smart City, SC 12345"
+COPYRIGHT_TEXT = "© 2024 SmartHome IT Solutions. All rights reserved. | Privacy Policy | Terms of Service"
+
+WHATSAPP_PHONE = "1234567890"  # Replace with actual WhatsApp business number
+WHATSAPP_MESSAGE = "Hello! I'm interested in your smart home IT solutions. Could you provide more information?"
+EMAIL_SUBJECT = "Smart Home IT Solutions Inquiry"
+EMAIL_BODY = (
+    "Hello,\n\nI am interested in learning more about your smart home IT solutions. "
+    "Please provide information about:\n\n- Available services\n- Pricing options\n"
+    "- Installation timeline\n- Free consultation\n\nThank you!"
+)
+
+# Fallback for items stored without an icon
+DEFAULT_ICON = "check_circle"
+
+
+@dataclass(frozen=True, slots=True)
+class ContentItem:
+    icon: str
+    title: str
+    description: str
+
+
+HERO_HEADLINE = "Transform Your Home with Smart IT Solutions"
+HERO_DESCRIPTION = (
+    "Experience the future of home automation with our cutting-edge IT solutions. "
+    "From intelligent lighting systems to advanced security networks, we bring "
+    "technology and comfort together seamlessly."
+)
+
+DEFAULT_SERVICES = (
+    ContentItem(
+        icon="lightbulb",
+        title="Smart Lighting Systems",
+        description="Intelligent lighting solutions that adapt to your lifestyle. Control brightness, color, and scheduling from anywhere with energy-efficient LED technology and automated sensors.",
+    ),
+    ContentItem(
+        icon="security",
+        title="Advanced Security Networks",
+        description="Comprehensive security systems with HD cameras, smart locks, motion sensors, and 24/7 monitoring. Protect your home with enterprise-grade cybersecurity protocols.",
+    ),
+    ContentItem(
+        icon="power",
+        title="Energy Management",
+        description="Optimize your home's energy consumption with smart meters, automated HVAC control, and renewable energy integration. Reduce costs while maintaining comfort.",
+    ),
+    ContentItem(
+        icon="wifi",
+        title="Network Infrastructure",
+        description="High-performance Wi-Fi networks, mesh systems, and IoT device management. Ensure seamless connectivity throughout your smart home ecosystem.",
+    ),
+    ContentItem(
+        icon="home",
+        title="Home Automation Hub",
+        description="Centralized control systems that integrate all your smart devices. Voice control, mobile apps, and automated routines for ultimate convenience.",
+    ),
+    ContentItem(
+        icon="support_agent",
+        title="Technical Support",
+        description="24/7 technical support and maintenance services. Regular updates, troubleshooting, and system optimization to keep your smart home running perfectly.",
+    ),
+)
+
+# What initialize_default_data seeded before the defaults above; databases still holding exactly
+# this content are upgraded in place, edited content is left alone
+LEGACY_HERO_DESCRIPTION = "Experience the future of home automation with our cutting-edge IT solutions."
+LEGACY_SERVICES = (
+    ContentItem(
+        icon="lightbulb",
+        title="Smart Lighting Systems",
+        description="Intelligent lighting solutions that adapt to your lifestyle.",
+    ),
+    ContentItem(
+        icon="security",
+        title="Advanced Security Networks",
+        description="Comprehensive security systems with HD cameras and smart locks.",
+    ),
+    ContentItem(
+        icon="power",
+        title="Energy Management",
+        description="Optimize your home's energy consumption with smart automation.",
+    ),
+)
+
+DEFAULT_BENEFITS = (
+    ContentItem(
+        icon="verified",
+        title="Certified IT Professionals",
+        description="Our team consists of certified network engineers, cybersecurity specialists, and smart home technology experts with years of industry experience.",
+    ),
+    ContentItem(
+        icon="speed",
+        title="Rapid Implementation",
+        description="Quick and efficient installation processes with minimal disruption to your daily routine. Most systems are operational within 24-48 hours.",
+    ),
+    ContentItem(
+        icon="security",
+        title="Enterprise-Grade Security",
+        description="Military-level encryption, secure protocols, and regular security audits ensure your smart home data remains private and protected.",
+    ),
+    ContentItem(
+        icon="savings",
+        title="Cost-Effective Solutions",
+        description="Reduce energy bills by up to 30% with intelligent automation. Our solutions pay for themselves through energy savings and increased home value.",
+    ),
+    ContentItem(
+        icon="update",
+        title="Future-Proof Technology",
+        description="Scalable systems designed to grow with advancing technology. Regular firmware updates and hardware upgrade paths included.",
+    ),
+    ContentItem(
+        icon="support",
+        title="Lifetime Support",
+        description="Comprehensive warranty coverage, 24/7 technical support, and free system health monitoring to ensure optimal performance.",
+    ),
+)
+
+CONTACT_STATS = (("500+", "Homes Automated"), ("24/7", "Support Available"), ("98%", "Customer Satisfaction"))
+SOCIAL_ICONS = ("facebook", "twitter", "linkedin", "instagram")
+QUICK_LINKS = ("Services", "About Us", "Case Studies", "Support", "Contact")
+
+
+@dataclass(frozen=True, slots=True)
+class LandingView:
+    """Display-ready landing content: database rows where present, defaults for the rest"""
+
+    hero_headline: str
+    hero_description: str
+    services: Tuple[ContentItem, ...]
+    benefits: Tuple[ContentItem, ...]
+    company_name: str
+    contact_email: str
+    contact_phone: str
+    contact_address: str
+    copyright_text: str
+
+
+DEFAULT_LANDING_VIEW = LandingView(
+    hero_headline=HERO_HEADLINE,
+    hero_description=HERO_DESCRIPTION,
+    services=DEFAULT_SERVICES,
+    benefits=DEFAULT_BENEFITS,
+    company_name=COMPANY_NAME,
+    contact_email=CONTACT_EMAIL,
+    contact_phone=CONTACT_PHONE,
+    contact_address=CONTACT_ADDRESS,
+    copyright_text=COPYRIGHT_TEXT,
+)
+
+
+def build_landing_view(snapshot: LandingContentSnapshot) -> LandingView:
+    """Precompute everything the section builders render from one content snapshot"""
+    hero, footer = snapshot.hero, snapshot.footer
+    return LandingView(
+        hero_headline=hero.headline if hero else HERO_HEADLINE,
+        hero_description=hero.description if hero else HERO_DESCRIPTION,
+        services=tuple(
+            ContentItem(icon=service.icon_class or DEFAULT_ICON, title=service.title, description=service.description)
+            for service in snapshot.services
+        )
+        or DEFAULT_SERVICES,
+        benefits=tuple(
+            ContentItem(icon=benefit.icon_class or DEFAULT_ICON, title=benefit.title, description=benefit.description)
+            for benefit in snapshot.benefits
+        )
+        or DEFAULT_BENEFITS,
+        company_name=footer.company_name if footer else COMPANY_NAME,
+        contact_email=(footer.email if footer else None) or CONTACT_EMAIL,
+        contact_phone=(footer.phone if footer else None) or CONTACT_PHONE,
+        contact_address=(footer.address if footer else None) or CONTACT_ADDRESS,
+        copyright_text=footer.copyright_text if footer else COPYRIGHT_TEXT,
+    )
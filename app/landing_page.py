@@ -1,148 +1,87 @@
-from nicegui import ui
+import ipaddress
+import json
+import os
+from nicegui import app, ui
+from starlette.requests import Request
+from starlette.responses import Response
+from typing import Callable, Optional, Tuple, Union
+from app import static_page, theme_asset
+from app.landing_content import (
+    COMPANY_TAGLINE,
+    CONTACT_EMAIL,
+    CONTACT_HOURS,
+    CONTACT_STATS,
+    EMAIL_BODY,
+    EMAIL_SUBJECT,
+    QUICK_LINKS,
+    SOCIAL_ICONS,
+    THEME_META,
+    WHATSAPP_MESSAGE,
+    WHATSAPP_PHONE,
+    LandingView,
+)
+from app.landing_service import LandingPageService
+from app.metrics import PAGE_RENDER_DURATION
+from app.page_view_buffer import PAGE_VIEW_BUFFER
 import logging
 
 logger = logging.getLogger(__name__)
 
+# "live" builds a NiceGUI element tree per visitor, "lite" a NiceGUI page of shared HTML blocks
+# with live buttons, "static" serves pre-rendered HTML without a NiceGUI client
+LANDING_RENDER_MODE = os.environ.get("APP_LANDING_RENDER_MODE", "live")
+
+IPNetwork = Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
+
+
+def parse_trusted_proxies(value: str) -> Tuple[IPNetwork, ...]:
+    """Comma-separated proxy addresses or networks, e.g. "10.0.0.0/8, 127.0.0.1" """
+    return tuple(ipaddress.ip_network(entry.strip(), strict=False) for entry in value.split(",") if entry.strip())
+
+
+# Only requests arriving from these proxies may name the visitor in X-Forwarded-For; empty trusts none
+TRUSTED_PROXIES = parse_trusted_proxies(os.environ.get("APP_TRUSTED_PROXIES", ""))
+
 
 def apply_theme() -> None:
     """Apply black and blue color scheme with modern design"""
-    ui.colors(
-        primary="#2563eb",  # Professional blue
-        secondary="#1e293b",  # Dark slate
-        accent="#3b82f6",  # Bright blue
-        positive="#10b981",  # Success green
-        negative="#ef4444",  # Error red
-        warning="#f59e0b",  # Warning amber
-        info="#06b6d4",  # Info cyan
-    )
+    # Colors and custom styling come from one fingerprinted stylesheet shared by every page, so
+    # repeat visitors load it from their cache instead of receiving it inline with each page
+    ui.add_head_html(f"{THEME_META}{theme_asset.THEME_ASSET.link}", shared=True)
+
 
-    # Add custom CSS for enhanced styling and security
-    ui.add_head_html("""
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <meta name="description" content="Professional IT Smart Home Solutions - Transform your home with cutting-edge technology">
-    <meta name="keywords" content="smart home, IT solutions, home automation, security systems, energy management">
-    <meta name="robots" content="index, follow">
-    <meta http-equiv="X-Content-Type-Options" content="nosniff">
-    <meta http-equiv="X-Frame-Options" content="DENY">
-    <meta http-equiv="X-XSS-Protection" content="1; mode=block">
-    <meta http-equiv="Referrer-Policy" content="strict-origin-when-cross-origin">
-    
-    <style>
-        :root {
-            --primary-blue: #2563eb;
-            --dark-bg: #0f172a;
-            --darker-bg: #020617;
-            --light-blue: #3b82f6;
-            --text-light: #e2e8f0;
-            --text-gray: #64748b;
-        }
-        
-        .hero-gradient {
-            background: linear-gradient(135deg, var(--darker-bg) 0%, var(--dark-bg) 50%, var(--primary-blue) 100%);
-        }
-        
-        .glass-card {
-            background: rgba(15, 23, 42, 0.8);
-            backdrop-filter: blur(10px);
-            border: 1px solid rgba(59, 130, 246, 0.2);
-        }
-        
-        .service-card {
-            background: var(--dark-bg);
-            border: 1px solid rgba(59, 130, 246, 0.1);
-            transition: all 0.3s ease;
-        }
-        
-        .service-card:hover {
-            border-color: var(--primary-blue);
-            transform: translateY(-4px);
-            box-shadow: 0 20px 25px -5px rgba(0, 0, 0, 0.3);
-        }
-        
-        .benefit-item {
-            background: rgba(15, 23, 42, 0.6);
-            border-left: 4px solid var(--primary-blue);
-        }
-        
-        .cta-button {
-            background: linear-gradient(45deg, var(--primary-blue), var(--light-blue));
-            transition: all 0.3s ease;
-        }
-        
-        .cta-button:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 10px 20px rgba(37, 99, 235, 0.3);
-        }
-        
-        .whatsapp-btn {
-            background: linear-gradient(45deg, #25d366, #128c7e);
-        }
-        
-        .email-btn {
-            background: linear-gradient(45deg, var(--primary-blue), #1d4ed8);
-        }
-        
-        body {
-            background-color: var(--darker-bg);
-            color: var(--text-light);
-        }
-        
-        /* Responsive design */
-        @media (max-width: 768px) {
-            .hero-content {
-                padding: 2rem 1rem;
-            }
-            .service-grid {
-                grid-template-columns: 1fr;
-            }
-        }
-        
-        /* Accessibility improvements */
-        .btn-focus:focus {
-            outline: 2px solid var(--primary-blue);
-            outline-offset: 2px;
-        }
-        
-        /* Security: Hide potential info leakage */
-        .no-select {
-            -webkit-user-select: none;
-            -moz-user-select: none;
-            -ms-user-select: none;
-            user-select: none;
-        }
-    </style>
-    """)
-
-
-def create_hero_section() -> None:
+def create_hero_section(view: Optional[LandingView] = None) -> None:
     """Create the hero section with prominent headline and description"""
+    view = view or LandingPageService.get_landing_view()
     with ui.element("section").classes("hero-gradient min-h-screen flex items-center justify-center px-4"):
         with ui.column().classes("max-w-6xl mx-auto text-center hero-content"):
             # Hero headline
-            ui.label("Transform Your Home with Smart IT Solutions").classes(
-                "text-5xl md:text-7xl font-bold text-white mb-6 leading-tight"
-            )
+            ui.label(view.hero_headline).classes("text-5xl md:text-7xl font-bold text-white mb-6 leading-tight")
 
             # Hero description
-            ui.label(
-                "Experience the future of home automation with our cutting-edge IT solutions. "
-                "From intelligent lighting systems to advanced security networks, we bring "
-                "technology and comfort together seamlessly."
-            ).classes("text-xl md:text-2xl text-slate-300 mb-12 max-w-4xl mx-auto leading-relaxed")
+            ui.label(view.hero_description).classes(
+                "text-xl md:text-2xl text-slate-300 mb-12 max-w-4xl mx-auto leading-relaxed"
+            )
 
             # Hero CTA buttons
             with ui.row().classes("gap-6 justify-center flex-wrap"):
-                ui.button("Get Free Consultation", on_click=lambda: scroll_to_cta()).classes(
-                    "cta-button text-white px-8 py-4 text-lg font-semibold rounded-xl btn-focus"
-                ).props("no-caps")
+                create_hero_buttons()
 
-                ui.button("View Our Services", on_click=lambda: scroll_to_services()).classes(
-                    "border-2 border-blue-500 text-blue-400 hover:bg-blue-500 hover:text-white px-8 py-4 text-lg font-semibold rounded-xl btn-focus"
-                ).props("outline no-caps")
 
+def create_hero_buttons() -> None:
+    """Create the hero buttons that scroll to the contact and services sections"""
+    ui.button("Get Free Consultation", on_click=lambda: scroll_to_cta()).classes(
+        "cta-button text-white px-8 py-4 text-lg font-semibold rounded-xl btn-focus"
+    ).props("no-caps")
 
-def create_services_section() -> None:
+    ui.button("View Our Services", on_click=lambda: scroll_to_services()).classes(
+        "border-2 border-blue-500 text-blue-400 hover:bg-blue-500 hover:text-white px-8 py-4 text-lg font-semibold rounded-xl btn-focus"
+    ).props("outline no-caps")
+
+
+def create_services_section(view: Optional[LandingView] = None) -> None:
     """Create the services section with key offerings"""
+    view = view or LandingPageService.get_landing_view()
     with ui.element("section").classes("py-20 px-4").add_slot("services"):
         with ui.column().classes("max-w-6xl mx-auto"):
             # Section header
@@ -152,49 +91,18 @@ def create_services_section() -> None:
             )
 
             # Services grid
-            services_data = [
-                {
-                    "icon": "lightbulb",
-                    "title": "Smart Lighting Systems",
-                    "description": "Intelligent lighting solutions that adapt to your lifestyle. Control brightness, color, and scheduling from anywhere with energy-efficient LED technology and automated sensors.",
-                },
-                {
-                    "icon": "security",
-                    "title": "Advanced Security Networks",
-                    "description": "Comprehensive security systems with HD cameras, smart locks, motion sensors, and 24/7 monitoring. Protect your home with enterprise-grade cybersecurity protocols.",
-                },
-                {
-                    "icon": "power",
-                    "title": "Energy Management",
-                    "description": "Optimize your home's energy consumption with smart meters, automated HVAC control, and renewable energy integration. Reduce costs while maintaining comfort.",
-                },
-                {
-                    "icon": "wifi",
-                    "title": "Network Infrastructure",
-                    "description": "High-performance Wi-Fi networks, mesh systems, and IoT device management. Ensure seamless connectivity throughout your smart home ecosystem.",
-                },
-                {
-                    "icon": "home",
-                    "title": "Home Automation Hub",
-                    "description": "Centralized control systems that integrate all your smart devices. Voice control, mobile apps, and automated routines for ultimate convenience.",
-                },
-                {
-                    "icon": "support_agent",
-                    "title": "Technical Support",
-                    "description": "24/7 technical support and maintenance services. Regular updates, troubleshooting, and system optimization to keep your smart home running perfectly.",
-                },
-            ]
 
             with ui.element("div").classes("grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-8"):
-                for service in services_data:
+                for service in view.services:
                     with ui.card().classes("service-card p-8 rounded-2xl"):
-                        ui.icon(service["icon"]).classes("text-5xl text-blue-400 mb-6")
-                        ui.label(service["title"]).classes("text-2xl font-bold text-white mb-4")
-                        ui.label(service["description"]).classes("text-slate-300 leading-relaxed")
+                        ui.icon(service.icon).classes("text-5xl text-blue-400 mb-6")
+                        ui.label(service.title).classes("text-2xl font-bold text-white mb-4")
+                        ui.label(service.description).classes("text-slate-300 leading-relaxed")
 
 
-def create_benefits_section() -> None:
+def create_benefits_section(view: Optional[LandingView] = None) -> None:
     """Create the benefits section detailing why to choose the company"""
+    view = view or LandingPageService.get_landing_view()
     with ui.element("section").classes("py-20 px-4 bg-slate-900/50"):
         with ui.column().classes("max-w-6xl mx-auto"):
             # Section header
@@ -205,51 +113,19 @@ def create_benefits_section() -> None:
                 "text-xl text-slate-400 text-center mb-16 max-w-3xl mx-auto"
             )
 
-            benefits_data = [
-                {
-                    "icon": "verified",
-                    "title": "Certified IT Professionals",
-                    "description": "Our team consists of certified network engineers, cybersecurity specialists, and smart home technology experts with years of industry experience.",
-                },
-                {
-                    "icon": "speed",
-                    "title": "Rapid Implementation",
-                    "description": "Quick and efficient installation processes with minimal disruption to your daily routine. Most systems are operational within 24-48 hours.",
-                },
-                {
-                    "icon": "security",
-                    "title": "Enterprise-Grade Security",
-                    "description": "Military-level encryption, secure protocols, and regular security audits ensure your smart home data remains private and protected.",
-                },
-                {
-                    "icon": "savings",
-                    "title": "Cost-Effective Solutions",
-                    "description": "Reduce energy bills by up to 30% with intelligent automation. Our solutions pay for themselves through energy savings and increased home value.",
-                },
-                {
-                    "icon": "update",
-                    "title": "Future-Proof Technology",
-                    "description": "Scalable systems designed to grow with advancing technology. Regular firmware updates and hardware upgrade paths included.",
-                },
-                {
-                    "icon": "support",
-                    "title": "Lifetime Support",
-                    "description": "Comprehensive warranty coverage, 24/7 technical support, and free system health monitoring to ensure optimal performance.",
-                },
-            ]
-
             with ui.element("div").classes("grid grid-cols-1 md:grid-cols-2 gap-8"):
-                for benefit in benefits_data:
+                for benefit in view.benefits:
                     with ui.element("div").classes("benefit-item p-6 rounded-xl"):
                         with ui.row().classes("items-start gap-4"):
-                            ui.icon(benefit["icon"]).classes("text-3xl text-blue-400 mt-1")
+                            ui.icon(benefit.icon).classes("text-3xl text-blue-400 mt-1")
                             with ui.column().classes("flex-1"):
-                                ui.label(benefit["title"]).classes("text-xl font-bold text-white mb-2")
-                                ui.label(benefit["description"]).classes("text-slate-300 leading-relaxed")
+                                ui.label(benefit.title).classes("text-xl font-bold text-white mb-2")
+                                ui.label(benefit.description).classes("text-slate-300 leading-relaxed")
 
 
-def create_cta_section() -> None:
+def create_cta_section(view: Optional[LandingView] = None) -> None:
     """Create the call-to-action section with WhatsApp and Email buttons"""
+    view = view or LandingPageService.get_landing_view()
     with ui.element("section").classes("py-20 px-4").add_slot("cta"):
         with ui.column().classes("max-w-4xl mx-auto text-center"):
             # CTA header
@@ -260,113 +136,104 @@ def create_cta_section() -> None:
 
             # Contact statistics
             with ui.row().classes("justify-center gap-8 mb-12 flex-wrap"):
-                with ui.element("div").classes("text-center"):
-                    ui.label("500+").classes("text-3xl font-bold text-blue-400")
-                    ui.label("Homes Automated").classes("text-slate-400")
-
-                with ui.element("div").classes("text-center"):
-                    ui.label("24/7").classes("text-3xl font-bold text-blue-400")
-                    ui.label("Support Available").classes("text-slate-400")
-
-                with ui.element("div").classes("text-center"):
-                    ui.label("98%").classes("text-3xl font-bold text-blue-400")
-                    ui.label("Customer Satisfaction").classes("text-slate-400")
+                for value, caption in CONTACT_STATS:
+                    with ui.element("div").classes("text-center"):
+                        ui.label(value).classes("text-3xl font-bold text-blue-400")
+                        ui.label(caption).classes("text-slate-400")
 
             # CTA buttons
             with ui.row().classes("gap-6 justify-center flex-wrap"):
-                ui.button("Contact via WhatsApp", icon="chat", on_click=lambda: open_whatsapp()).classes(
-                    "whatsapp-btn text-white px-8 py-4 text-lg font-semibold rounded-xl btn-focus"
-                ).props("no-caps")
-
-                ui.button("Send us an Email", icon="email", on_click=lambda: open_email()).classes(
-                    "email-btn text-white px-8 py-4 text-lg font-semibold rounded-xl btn-focus"
-                ).props("no-caps")
+                create_contact_buttons(view.contact_email)
 
             # Additional contact info
             with ui.element("div").classes("mt-12 p-6 glass-card rounded-xl"):
                 ui.label("Prefer a Phone Call?").classes("text-lg font-semibold text-white mb-2")
-                ui.label("Call us at: +1 (555) 123-SMART").classes("text-blue-400 text-xl font-mono")
-                ui.label("Available Monday-Friday, 9AM-6PM EST").classes("text-slate-400 text-sm mt-2")
+                ui.label(f"Call us at: {view.contact_phone}").classes("text-blue-400 text-xl font-mono")
+                ui.label(CONTACT_HOURS).classes("text-slate-400 text-sm mt-2")
 
 
-def create_footer() -> None:
+def create_contact_buttons(email: str) -> None:
+    """Create the WhatsApp and email contact buttons"""
+    ui.button("Contact via WhatsApp", icon="chat", on_click=lambda: open_whatsapp()).classes(
+        "whatsapp-btn text-white px-8 py-4 text-lg font-semibold rounded-xl btn-focus"
+    ).props("no-caps")
+
+    ui.button("Send us an Email", icon="email", on_click=lambda: open_email(email)).classes(
+        "email-btn text-white px-8 py-4 text-lg font-semibold rounded-xl btn-focus"
+    ).props("no-caps")
+
+
+def create_footer(view: Optional[LandingView] = None) -> None:
     """Create a simple footer section"""
+    view = view or LandingPageService.get_landing_view()
     with ui.element("footer").classes("bg-slate-950 py-12 px-4 border-t border-slate-800"):
         with ui.column().classes("max-w-6xl mx-auto"):
             with ui.row().classes("justify-between items-start gap-8 flex-wrap"):
                 # Company info
                 with ui.column().classes("flex-1 min-w-64"):
-                    ui.label("SmartHome IT Solutions").classes("text-2xl font-bold text-white mb-4")
-                    ui.label(
-                        "Transforming homes with cutting-edge technology solutions. "
-                        "Your trusted partner for smart home automation and IT infrastructure."
-                    ).classes("text-slate-400 leading-relaxed mb-4")
+                    ui.label(view.company_name).classes("text-2xl font-bold text-white mb-4")
+                    ui.label(COMPANY_TAGLINE).classes("text-slate-400 leading-relaxed mb-4")
 
                     # Social links placeholder
                     with ui.row().classes("gap-4"):
-                        ui.icon("facebook").classes("text-2xl text-slate-500 hover:text-blue-400 cursor-pointer")
-                        ui.icon("twitter").classes("text-2xl text-slate-500 hover:text-blue-400 cursor-pointer")
-                        ui.icon("linkedin").classes("text-2xl text-slate-500 hover:text-blue-400 cursor-pointer")
-                        ui.icon("instagram").classes("text-2xl text-slate-500 hover:text-blue-400 cursor-pointer")
+                        for icon in SOCIAL_ICONS:
+                            ui.icon(icon).classes("text-2xl text-slate-500 hover:text-blue-400 cursor-pointer")
 
                 # Quick links
                 with ui.column().classes("min-w-48"):
                     ui.label("Quick Links").classes("text-lg font-semibold text-white mb-4")
-                    for link in ["Services", "About Us", "Case Studies", "Support", "Contact"]:
+                    for link in QUICK_LINKS:
                         ui.label(link).classes("text-slate-400 hover:text-blue-400 cursor-pointer mb-2")
 
                 # Contact info
                 with ui.column().classes("min-w-64"):
                     ui.label("Contact Information").classes("text-lg font-semibold text-white mb-4")
-                    ui.label("📧 info@smarthome-it.com").classes("text-slate-400 mb-2")
-                    ui.label("📞 +1 (555) 123-SMART").classes("text-slate-400 mb-2")
-                    ui.label("📍 123 Technology Drive, Smart City, SC 12345").classes("text-slate-400 mb-2")
+                    ui.label(f"📧 {view.contact_email}").classes("text-slate-400 mb-2")
+                    ui.label(f"📞 {view.contact_phone}").classes("text-slate-400 mb-2")
+                    ui.label(f"📍 {view.contact_address}").classes("text-slate-400 mb-2")
 
             # Copyright
             with ui.element("div").classes("border-t border-slate-800 pt-8 mt-8 text-center"):
-                ui.label(
-                    "© 2024 SmartHome IT Solutions. All rights reserved. | Privacy Policy | Terms of Service"
-                ).classes("text-slate-500 no-select")
+                ui.label(view.copyright_text).classes("text-slate-500 no-select")
 
 
 def scroll_to_services() -> None:
     """Scroll to services section"""
-    ui.run_javascript("document.querySelector('[slot=\"services\"]')?.scrollIntoView({ behavior: 'smooth' })")
+    ui.run_javascript(
+        "document.querySelector('#services, [slot=\"services\"]')?.scrollIntoView({ behavior: 'smooth' })"
+    )
 
 
 def scroll_to_cta() -> None:
     """Scroll to CTA section"""
-    ui.run_javascript("document.querySelector('[slot=\"cta\"]')?.scrollIntoView({ behavior: 'smooth' })")
+    ui.run_javascript("document.querySelector('#cta, [slot=\"cta\"]')?.scrollIntoView({ behavior: 'smooth' })")
 
 
 def open_whatsapp() -> None:
     """Open WhatsApp with pre-filled message"""
     # OWASP compliant - using client-side redirect with sanitized data
-    message = "Hello! I'm interested in your smart home IT solutions. Could you provide more information?"
-    phone = "1234567890"  # Replace with actual WhatsApp business number
-
     try:
-        ui.run_javascript(f'''
-            const message = encodeURIComponent("{message}");
-            const phone = "{phone}";
+        ui.run_javascript(f"""
+            const message = encodeURIComponent({json.dumps(WHATSAPP_MESSAGE)});
+            const phone = {json.dumps(WHATSAPP_PHONE)};
             const url = `https://wa.me/${{phone}}?text=${{message}}`;
             window.open(url, '_blank', 'noopener,noreferrer');
-        ''')
+        """)
         ui.notify("Opening WhatsApp...", type="info")
     except Exception as e:
         logger.error(f"Error opening WhatsApp: {e}")
         ui.notify("Error opening WhatsApp. Please try again.", type="negative")
 
 
-def open_email() -> None:
+def open_email(email: str = CONTACT_EMAIL) -> None:
     """Open email client with pre-filled message"""
     # OWASP compliant - using client-side mailto with sanitized data
     try:
-        ui.run_javascript("""
-            const subject = encodeURIComponent("Smart Home IT Solutions Inquiry");
-            const body = encodeURIComponent("Hello,\\n\\nI am interested in learning more about your smart home IT solutions. Please provide information about:\\n\\n- Available services\\n- Pricing options\\n- Installation timeline\\n- Free consultation\\n\\nThank you!");
-            const email = "info@smarthome-it.com";
-            const mailtoUrl = `mailto:${email}?subject=${subject}&body=${body}`;
+        ui.run_javascript(f"""
+            const subject = encodeURIComponent({json.dumps(EMAIL_SUBJECT)});
+            const body = encodeURIComponent({json.dumps(EMAIL_BODY)});
+            const email = {json.dumps(email)};
+            const mailtoUrl = `mailto:${{email}}?subject=${{subject}}&body=${{body}}`;
             window.location.href = mailtoUrl;
         """)
         ui.notify("Opening email client...", type="info")
@@ -375,28 +242,118 @@ def open_email() -> None:
         ui.notify("Error opening email client. Please try again.", type="negative")
 
 
+def is_trusted_proxy(host: str, trusted_proxies: Tuple[IPNetwork, ...]) -> bool:
+    try:
+        address = ipaddress.ip_address(host)
+    except ValueError:
+        logger.debug(f"Peer {host} is not an IP address, so it is not a trusted proxy")
+        return False
+    return any(address in network for network in trusted_proxies)
+
+
+def client_ip(request: Request, trusted_proxies: Tuple[IPNetwork, ...] = TRUSTED_PROXIES) -> Optional[str]:
+    """The visitor's address: the peer, or behind trusted proxies the nearest untrusted X-Forwarded-For hop.
+
+    Clients can send any X-Forwarded-For header, so it is only read when the peer is a trusted proxy,
+    and hops appended by trusted proxies are skipped from the right.
+    """
+    host = request.client.host if request.client else None
+    if host is None or not is_trusted_proxy(host, trusted_proxies):
+        return host
+    hops = [hop.strip() for hop in request.headers.get("x-forwarded-for", "").split(",") if hop.strip()]
+    for hop in reversed(hops):
+        if not is_trusted_proxy(hop, trusted_proxies):
+            return hop
+    return hops[0] if hops else host
+
+
+def capture_page_view(request: Optional[Request]) -> None:
+    """Hand a page view to the write-behind buffer without blocking the render or raising"""
+    try:
+        if request is None:
+            return
+        session = request.scope.get("session") or {}
+        LandingPageService.log_page_view(
+            page_path=request.url.path,
+            ip_address=client_ip(request),
+            user_agent=request.headers.get("user-agent"),
+            referrer=request.headers.get("referer"),
+            session_id=session.get("id"),
+        )
+    except Exception as e:
+        logger.error(f"Error capturing page view: {e}")
+        PAGE_VIEW_BUFFER.record_failure()
+
+
+def create_sections() -> None:
+    """Build every section from content precomputed once per content version"""
+    view = LandingPageService.get_landing_view()
+    create_hero_section(view)
+    create_services_section(view)
+    create_benefits_section(view)
+    create_cta_section(view)
+    create_footer(view)
+
+
+def create_lite_sections() -> None:
+    """Build the page from shared pre-rendered HTML fragments.
+
+    Only the buttons remain live elements, so each client holds about twenty elements instead of
+    over a hundred, and the fragment strings are the same objects for every client.
+    """
+    fragments = static_page.get_landing_fragments()
+    view = LandingPageService.get_landing_view()
+    with ui.element("section").classes("hero-gradient min-h-screen flex items-center justify-center px-4"):
+        with ui.column().classes("max-w-6xl mx-auto text-center hero-content"):
+            ui.html(fragments.hero_text).classes("w-full")
+            with ui.row().classes("gap-6 justify-center flex-wrap w-full"):
+                create_hero_buttons()
+    ui.html(fragments.services).classes("w-full")
+    ui.html(fragments.benefits).classes("w-full")
+    with ui.element("section").classes("py-20 px-4 w-full").props("id=cta"):
+        with ui.column().classes("max-w-4xl mx-auto text-center"):
+            ui.html(fragments.cta_intro).classes("w-full")
+            with ui.row().classes("gap-6 justify-center flex-wrap w-full"):
+                create_contact_buttons(view.contact_email)
+            ui.html(fragments.cta_contact).classes("w-full")
+    ui.html(fragments.footer).classes("w-full")
+
+
 def create() -> None:
     """Create the landing page with all sections"""
+    theme_asset.create()
+    match LANDING_RENDER_MODE:
+        case "live":
+            create_live_page(create_sections)
+        case "lite":
+            create_live_page(create_lite_sections)
+        case "static":
+            create_static_page()
+        case _:
+            raise ValueError(f"Unknown landing render mode: {LANDING_RENDER_MODE}")
+
+
+def create_static_page() -> None:
+    """Serve the landing page as pre-rendered HTML from a plain route, without a NiceGUI client"""
+
+    render_duration = PAGE_RENDER_DURATION.labels("static")
+
+    @app.api_route("/", methods=["GET", "HEAD"], include_in_schema=False)
+    def static_landing_page(request: Request) -> Response:
+        capture_page_view(request)
+        with render_duration.time():
+            return static_page.landing_response(request)
+
+
+def create_live_page(build_sections: Callable[[], None]) -> None:
+    """Serve the landing page as a NiceGUI page built per visitor"""
     apply_theme()
+    render_duration = PAGE_RENDER_DURATION.labels(LANDING_RENDER_MODE)
 
     @ui.page("/")
     def landing_page():
-        # Security headers and tracking (OWASP compliant)
-        try:
-            # Log page view for analytics (anonymized)
-            client_ip = getattr(ui.context.client, "environ", {}).get("REMOTE_ADDR", "unknown")
-            if client_ip and client_ip != "unknown":
-                # In production, implement proper IP anonymization
-                logger.info(f"Landing page view from IP: {client_ip[:8]}...")
-        except Exception as e:
-            logger.error(f"Error logging page view: {e}")
-
-        # Build the page sections
-        create_hero_section()
-        create_services_section()
-        create_benefits_section()
-        create_cta_section()
-        create_footer()
-
-        # Add smooth scrolling behavior
-        ui.add_head_html("<style>html { scroll-behavior: smooth; }</style>")
+        # Queue the visit for analytics (anonymized); the database write happens off the render path
+        capture_page_view(ui.context.client.request)
+
+        with render_duration.time():
+            build_sections()
@@ -1,5 +1,28 @@
-from sqlmodel import select, asc
-from app.database import get_session
+from sqlalchemy import Row
+from sqlmodel import select, func, text
+from app.content_cache import (
+    CONTENT_CACHE,
+    LANDING_NAMESPACE,
+    SITE_CONFIG_NAMESPACE,
+    LandingContentSnapshot,
+    copy_model,
+)
+from app.database import get_session, get_async_session, register_reset_hook
+from app.landing_content import (
+    DEFAULT_BENEFITS,
+    DEFAULT_LANDING_VIEW,
+    DEFAULT_SERVICES,
+    HERO_DESCRIPTION,
+    HERO_HEADLINE,
+    LEGACY_HERO_DESCRIPTION,
+    LEGACY_SERVICES,
+    LandingView,
+    build_landing_view,
+)
+from app.instrumentation import SERVICE_INSTRUMENTATION
+from app.metrics import CONTACT_SUBMISSIONS, SERVICE_CALL_DURATION
+from app.page_view_buffer import PAGE_VIEW_BUFFER
+from app.rate_limiter import CONTACT_RATE_LIMITER
 from app.models import (
     HeroSection,
     Service,
@@ -14,24 +37,76 @@ from app.models import (
     BenefitCreate,
     ContactSubmissionCreate,
 )
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 import logging
 import re
 
 logger = logging.getLogger(__name__)
 
+# Cached content must not outlive the tables it was read from
+register_reset_hook(CONTENT_CACHE.invalidate)
+
+# Derived from the landing snapshot, so it is invalidated together with it
+LANDING_VIEW_KEY = f"{LANDING_NAMESPACE}:view"
+
+# All active landing content as one row of JSON columns, so a cache miss costs one round trip
+LANDING_BUNDLE_QUERY = text("""
+    SELECT
+        (SELECT row_to_json(h) FROM (SELECT * FROM hero_sections WHERE is_active LIMIT 1) h) AS hero,
+        (SELECT coalesce(json_agg(s ORDER BY s.display_order), '[]'::json)
+            FROM services s WHERE s.is_active) AS services,
+        (SELECT coalesce(json_agg(b ORDER BY b.display_order), '[]'::json)
+            FROM benefits b WHERE b.is_active) AS benefits,
+        (SELECT coalesce(json_agg(c ORDER BY c.display_order), '[]'::json)
+            FROM call_to_actions c WHERE c.is_active) AS cta_buttons,
+        (SELECT row_to_json(f) FROM (SELECT * FROM footer_contents WHERE is_active LIMIT 1) f) AS footer
+""")
 
+
+@SERVICE_INSTRUMENTATION.instrument(SERVICE_CALL_DURATION)
 class LandingPageService:
     """Service layer for landing page operations"""
 
+    @staticmethod
+    def get_content_snapshot() -> LandingContentSnapshot:
+        """Get the cached snapshot of all active landing content, loading it on a miss.
+
+        Database errors propagate to the caller; the section getters below handle them.
+        """
+        return CONTENT_CACHE.get_or_load(LANDING_NAMESPACE, LandingPageService.get_landing_bundle)
+
+    @staticmethod
+    def get_landing_bundle() -> LandingContentSnapshot:
+        """Fetch all active landing content from the database in a single round trip, bypassing the cache.
+
+        Database errors propagate to the caller.
+        """
+        version = CONTENT_CACHE.version(LANDING_NAMESPACE)
+        with get_session() as session:
+            row = session.execute(LANDING_BUNDLE_QUERY).one()
+        return LandingPageService._bundle_from_row(version, row)
+
+    @staticmethod
+    def get_landing_view() -> LandingView:
+        """Display-ready landing content, computed once per content version.
+
+        Falls back to the built-in defaults when content cannot be loaded, so the page always renders.
+        """
+        try:
+            return CONTENT_CACHE.get_or_load(
+                LANDING_VIEW_KEY, lambda: build_landing_view(LandingPageService.get_content_snapshot())
+            )
+        except Exception as e:
+            logger.error(f"Error building landing view: {e}")
+            return DEFAULT_LANDING_VIEW
+
     @staticmethod
     def get_hero_section() -> Optional[HeroSection]:
         """Get the active hero section"""
         try:
-            with get_session() as session:
-                statement = select(HeroSection).where(HeroSection.is_active)
-                return session.exec(statement).first()
+            hero = LandingPageService.get_content_snapshot().hero
+            return copy_model(hero) if hero is not None else None
         except Exception as e:
             logger.error(f"Error fetching hero section: {e}")
             return None
@@ -40,9 +115,7 @@ class LandingPageService:
     def get_services() -> List[Service]:
         """Get all active services ordered by display_order"""
         try:
-            with get_session() as session:
-                statement = select(Service).where(Service.is_active).order_by(asc(Service.display_order))
-                return list(session.exec(statement))
+            return [copy_model(service) for service in LandingPageService.get_content_snapshot().services]
         except Exception as e:
             logger.error(f"Error fetching services: {e}")
             return []
@@ -51,9 +124,7 @@ class LandingPageService:
     def get_benefits() -> List[Benefit]:
         """Get all active benefits ordered by display_order"""
         try:
-            with get_session() as session:
-                statement = select(Benefit).where(Benefit.is_active).order_by(asc(Benefit.display_order))
-                return list(session.exec(statement))
+            return [copy_model(benefit) for benefit in LandingPageService.get_content_snapshot().benefits]
         except Exception as e:
             logger.error(f"Error fetching benefits: {e}")
             return []
@@ -62,9 +133,7 @@ class LandingPageService:
     def get_cta_buttons() -> List[CallToAction]:
         """Get all active call-to-action buttons ordered by display_order"""
         try:
-            with get_session() as session:
-                statement = select(CallToAction).where(CallToAction.is_active).order_by(asc(CallToAction.display_order))
-                return list(session.exec(statement))
+            return [copy_model(button) for button in LandingPageService.get_content_snapshot().cta_buttons]
         except Exception as e:
             logger.error(f"Error fetching CTA buttons: {e}")
             return []
@@ -73,9 +142,8 @@ class LandingPageService:
     def get_footer_content() -> Optional[FooterContent]:
         """Get the active footer content"""
         try:
-            with get_session() as session:
-                statement = select(FooterContent).where(FooterContent.is_active)
-                return session.exec(statement).first()
+            footer = LandingPageService.get_content_snapshot().footer
+            return copy_model(footer) if footer is not None else None
         except Exception as e:
             logger.error(f"Error fetching footer content: {e}")
             return None
@@ -100,7 +168,8 @@ class LandingPageService:
                 session.add(hero)
                 session.commit()
                 session.refresh(hero)
-                return hero
+            CONTENT_CACHE.invalidate(LANDING_NAMESPACE)
+            return hero
         except Exception as e:
             logger.error(f"Error creating hero section: {e}")
             return None
@@ -120,7 +189,8 @@ class LandingPageService:
                 session.add(service)
                 session.commit()
                 session.refresh(service)
-                return service
+            CONTENT_CACHE.invalidate(LANDING_NAMESPACE)
+            return service
         except Exception as e:
             logger.error(f"Error creating service: {e}")
             return None
@@ -140,7 +210,8 @@ class LandingPageService:
                 session.add(benefit)
                 session.commit()
                 session.refresh(benefit)
-                return benefit
+            CONTENT_CACHE.invalidate(LANDING_NAMESPACE)
+            return benefit
         except Exception as e:
             logger.error(f"Error creating benefit: {e}")
             return None
@@ -152,35 +223,28 @@ class LandingPageService:
         """Submit a contact form with security validations"""
         try:
             # Input validation and sanitization
-            if not LandingPageService._validate_email(contact_data.email):
-                logger.warning(f"Invalid email format submitted: {contact_data.email}")
-                return None
-
-            if not LandingPageService._validate_phone(contact_data.phone):
-                logger.warning(f"Invalid phone format submitted: {contact_data.phone}")
+            if not LandingPageService._validate_contact_form(contact_data):
+                CONTACT_SUBMISSIONS.labels("invalid").inc()
                 return None
 
-            # Rate limiting check (basic implementation)
+            # Rate limiting check (policy and backend configured in app.rate_limiter)
             if ip_address and LandingPageService._check_rate_limit(ip_address):
                 logger.warning(f"Rate limit exceeded for IP: {ip_address}")
+                CONTACT_SUBMISSIONS.labels("rate_limited").inc()
                 return None
 
             with get_session() as session:
-                contact = ContactSubmission(
-                    name=contact_data.name.strip()[:100],  # Sanitize and limit length
-                    email=contact_data.email.strip().lower()[:255],
-                    phone=contact_data.phone.strip()[:20] if contact_data.phone else None,
-                    message=contact_data.message.strip()[:2000],
-                    ip_address=LandingPageService._anonymize_ip(ip_address) if ip_address else None,
-                    user_agent=user_agent[:500] if user_agent else None,
-                    status="new",
-                )
+                contact = LandingPageService._new_contact_submission(contact_data, ip_address, user_agent)
                 session.add(contact)
                 session.commit()
                 session.refresh(contact)
-                return contact
+            if contact.ip_address:
+                CONTACT_RATE_LIMITER.record(contact.ip_address)
+            CONTACT_SUBMISSIONS.labels("accepted").inc()
+            return contact
         except Exception as e:
             logger.error(f"Error submitting contact form: {e}")
+            CONTACT_SUBMISSIONS.labels("error").inc()
             return None
 
     @staticmethod
@@ -191,38 +255,225 @@ class LandingPageService:
         referrer: Optional[str] = None,
         session_id: Optional[str] = None,
     ) -> Optional[PageView]:
-        """Log a page view for analytics"""
+        """Queue a page view for analytics; it is written in the background by PAGE_VIEW_BUFFER.
+
+        Returns the queued (not yet persisted) page view, or None if it was dropped.
+        """
         try:
-            with get_session() as session:
-                page_view = PageView(
-                    page_path=page_path[:200],
-                    ip_address=LandingPageService._anonymize_ip(ip_address) if ip_address else None,
-                    user_agent=user_agent[:500] if user_agent else None,
-                    referrer=referrer[:500] if referrer else None,
-                    session_id=session_id[:100] if session_id else None,
-                )
-                session.add(page_view)
-                session.commit()
-                session.refresh(page_view)
-                return page_view
+            page_view = PageView(
+                page_path=page_path[:200],
+                ip_address=LandingPageService._anonymize_ip(ip_address) if ip_address else None,
+                user_agent=user_agent[:500] if user_agent else None,
+                referrer=referrer[:500] if referrer else None,
+                session_id=session_id[:100] if session_id else None,
+            )
+            return page_view if PAGE_VIEW_BUFFER.submit(page_view) else None
         except Exception as e:
             logger.error(f"Error logging page view: {e}")
             return None
 
+    @staticmethod
+    def get_page_view_counts(since: datetime) -> Dict[str, int]:
+        """Count page views per path since the given time"""
+        try:
+            with get_session() as session:
+                statement = (
+                    select(PageView.page_path, func.count())
+                    .where(PageView.created_at >= since)
+                    .group_by(PageView.page_path)
+                )
+                return {page_path: count for page_path, count in session.exec(statement)}
+        except Exception as e:
+            logger.error(f"Error counting page views: {e}")
+            return {}
+
     @staticmethod
     def get_site_config(key: str) -> Optional[str]:
         """Get a site configuration value"""
         try:
-            with get_session() as session:
-                statement = select(SiteConfiguration).where(
-                    SiteConfiguration.config_key == key, SiteConfiguration.is_active
+            return CONTENT_CACHE.get_or_load(
+                f"{SITE_CONFIG_NAMESPACE}:{key}", lambda: LandingPageService._load_site_config(key)
+            )
+        except Exception as e:
+            logger.error(f"Error fetching site config for key {key}: {e}")
+            return None
+
+    @staticmethod
+    def _load_site_config(key: str) -> Optional[str]:
+        """Read a single active site configuration value from the database"""
+        with get_session() as session:
+            statement = select(SiteConfiguration).where(
+                SiteConfiguration.config_key == key, SiteConfiguration.is_active
+            )
+            config = session.exec(statement).first()
+            return config.config_value if config else None
+
+    # Async variants for pages and API routes running on the event loop; they share the sync cache
+
+    @staticmethod
+    async def aget_content_snapshot() -> LandingContentSnapshot:
+        """Async variant of get_content_snapshot"""
+        return await CONTENT_CACHE.aget_or_load(LANDING_NAMESPACE, LandingPageService.aget_landing_bundle)
+
+    @staticmethod
+    async def aget_landing_bundle() -> LandingContentSnapshot:
+        """Async variant of get_landing_bundle"""
+        version = CONTENT_CACHE.version(LANDING_NAMESPACE)
+        async with get_async_session() as session:
+            row = (await session.execute(LANDING_BUNDLE_QUERY)).one()
+        return LandingPageService._bundle_from_row(version, row)
+
+    @staticmethod
+    async def aget_hero_section() -> Optional[HeroSection]:
+        """Async variant of get_hero_section"""
+        try:
+            hero = (await LandingPageService.aget_content_snapshot()).hero
+            return copy_model(hero) if hero is not None else None
+        except Exception as e:
+            logger.error(f"Error fetching hero section: {e}")
+            return None
+
+    @staticmethod
+    async def aget_services() -> List[Service]:
+        """Async variant of get_services"""
+        try:
+            return [copy_model(service) for service in (await LandingPageService.aget_content_snapshot()).services]
+        except Exception as e:
+            logger.error(f"Error fetching services: {e}")
+            return []
+
+    @staticmethod
+    async def aget_benefits() -> List[Benefit]:
+        """Async variant of get_benefits"""
+        try:
+            return [copy_model(benefit) for benefit in (await LandingPageService.aget_content_snapshot()).benefits]
+        except Exception as e:
+            logger.error(f"Error fetching benefits: {e}")
+            return []
+
+    @staticmethod
+    async def aget_cta_buttons() -> List[CallToAction]:
+        """Async variant of get_cta_buttons"""
+        try:
+            return [copy_model(button) for button in (await LandingPageService.aget_content_snapshot()).cta_buttons]
+        except Exception as e:
+            logger.error(f"Error fetching CTA buttons: {e}")
+            return []
+
+    @staticmethod
+    async def aget_footer_content() -> Optional[FooterContent]:
+        """Async variant of get_footer_content"""
+        try:
+            footer = (await LandingPageService.aget_content_snapshot()).footer
+            return copy_model(footer) if footer is not None else None
+        except Exception as e:
+            logger.error(f"Error fetching footer content: {e}")
+            return None
+
+    @staticmethod
+    async def asubmit_contact_form(
+        contact_data: ContactSubmissionCreate, ip_address: Optional[str] = None, user_agent: Optional[str] = None
+    ) -> Optional[ContactSubmission]:
+        """Async variant of submit_contact_form"""
+        try:
+            if not LandingPageService._validate_contact_form(contact_data):
+                CONTACT_SUBMISSIONS.labels("invalid").inc()
+                return None
+
+            if ip_address and await CONTACT_RATE_LIMITER.ais_limited(LandingPageService._anonymize_ip(ip_address)):
+                logger.warning(f"Rate limit exceeded for IP: {ip_address}")
+                CONTACT_SUBMISSIONS.labels("rate_limited").inc()
+                return None
+
+            async with get_async_session() as session:
+                contact = LandingPageService._new_contact_submission(contact_data, ip_address, user_agent)
+                session.add(contact)
+                await session.commit()
+                await session.refresh(contact)
+            if contact.ip_address:
+                CONTACT_RATE_LIMITER.record(contact.ip_address)
+            CONTACT_SUBMISSIONS.labels("accepted").inc()
+            return contact
+        except Exception as e:
+            logger.error(f"Error submitting contact form: {e}")
+            CONTACT_SUBMISSIONS.labels("error").inc()
+            return None
+
+    @staticmethod
+    async def aget_page_view_counts(since: datetime) -> Dict[str, int]:
+        """Async variant of get_page_view_counts"""
+        try:
+            async with get_async_session() as session:
+                statement = (
+                    select(PageView.page_path, func.count())
+                    .where(PageView.created_at >= since)
+                    .group_by(PageView.page_path)
                 )
-                config = session.exec(statement).first()
-                return config.config_value if config else None
+                return {page_path: count for page_path, count in await session.exec(statement)}
+        except Exception as e:
+            logger.error(f"Error counting page views: {e}")
+            return {}
+
+    @staticmethod
+    async def aget_site_config(key: str) -> Optional[str]:
+        """Async variant of get_site_config"""
+        try:
+            return await CONTENT_CACHE.aget_or_load(
+                f"{SITE_CONFIG_NAMESPACE}:{key}", lambda: LandingPageService._aload_site_config(key)
+            )
         except Exception as e:
             logger.error(f"Error fetching site config for key {key}: {e}")
             return None
 
+    @staticmethod
+    async def _aload_site_config(key: str) -> Optional[str]:
+        """Async variant of _load_site_config"""
+        async with get_async_session() as session:
+            statement = select(SiteConfiguration).where(
+                SiteConfiguration.config_key == key, SiteConfiguration.is_active
+            )
+            config = (await session.exec(statement)).first()
+            return config.config_value if config else None
+
+    @staticmethod
+    def _bundle_from_row(version: int, row: Row) -> LandingContentSnapshot:
+        """Build the typed snapshot from one row of LANDING_BUNDLE_QUERY"""
+        return LandingContentSnapshot(
+            version=version,
+            hero=HeroSection.model_validate(row.hero) if row.hero else None,
+            services=tuple(Service.model_validate(item) for item in row.services),
+            benefits=tuple(Benefit.model_validate(item) for item in row.benefits),
+            cta_buttons=tuple(CallToAction.model_validate(item) for item in row.cta_buttons),
+            footer=FooterContent.model_validate(row.footer) if row.footer else None,
+        )
+
+    @staticmethod
+    def _validate_contact_form(contact_data: ContactSubmissionCreate) -> bool:
+        """Validate the contact fields the model schema does not fully cover"""
+        if not LandingPageService._validate_email(contact_data.email):
+            logger.warning(f"Invalid email format submitted: {contact_data.email}")
+            return False
+
+        if not LandingPageService._validate_phone(contact_data.phone):
+            logger.warning(f"Invalid phone format submitted: {contact_data.phone}")
+            return False
+        return True
+
+    @staticmethod
+    def _new_contact_submission(
+        contact_data: ContactSubmissionCreate, ip_address: Optional[str], user_agent: Optional[str]
+    ) -> ContactSubmission:
+        """Build a sanitized submission row"""
+        return ContactSubmission(
+            name=contact_data.name.strip()[:100],  # Sanitize and limit length
+            email=contact_data.email.strip().lower()[:255],
+            phone=contact_data.phone.strip()[:20] if contact_data.phone else None,
+            message=contact_data.message.strip()[:2000],
+            ip_address=LandingPageService._anonymize_ip(ip_address) if ip_address else None,
+            user_agent=user_agent[:500] if user_agent else None,
+            status="new",
+        )
+
     @staticmethod
     def _validate_email(email: str) -> bool:
         """Validate email format"""
@@ -246,22 +497,8 @@ class LandingPageService:
     def _check_rate_limit(ip_address: str) -> bool:
         """Check if IP address has exceeded rate limit"""
         try:
-            with get_session() as session:
-                # Check submissions in the last hour
-                from datetime import timedelta
-
-                hour_ago = datetime.utcnow() - timedelta(hours=1)
-
-                # Use anonymized IP for rate limiting
-                anonymized_ip = LandingPageService._anonymize_ip(ip_address)
-
-                statement = select(ContactSubmission).where(
-                    ContactSubmission.ip_address == anonymized_ip, ContactSubmission.created_at >= hour_ago
-                )
-                recent_submissions = session.exec(statement).all()
-
-                # Allow max 3 submissions per hour per IP
-                return len(recent_submissions) >= 3
+            # Use anonymized IP for rate limiting
+            return CONTACT_RATE_LIMITER.is_limited(LandingPageService._anonymize_ip(ip_address))
         except Exception as e:
             logger.error(f"Error checking rate limit: {e}")
             return False  # Allow submission if check fails
@@ -288,47 +525,79 @@ class LandingPageService:
 
 
 # Initialize default data for landing page
+def upgrade_legacy_seed() -> bool:
+    """Replace the original, shorter default content with the current defaults.
+
+    Only a hero and services that still match LEGACY_HERO_DESCRIPTION and LEGACY_SERVICES exactly
+    are changed, so edited content is kept and running this again does nothing. Returns whether
+    anything was upgraded.
+    """
+    legacy_services = [(item.title, item.description, item.icon) for item in LEGACY_SERVICES]
+    upgraded = False
+    with get_session() as session:
+        hero = session.exec(select(HeroSection).where(HeroSection.is_active)).first()
+        if hero is not None and (hero.headline, hero.description) == (HERO_HEADLINE, LEGACY_HERO_DESCRIPTION):
+            hero.description = HERO_DESCRIPTION
+            hero.updated_at = datetime.utcnow()
+            upgraded = True
+
+        services = sorted(
+            session.exec(select(Service).where(Service.is_active)).all(), key=lambda row: row.display_order
+        )
+        if [(row.title, row.description, row.icon_class) for row in services] == legacy_services:
+            for order, item in enumerate(DEFAULT_SERVICES, start=1):
+                if order <= len(services):
+                    # the original services are the first defaults with shorter descriptions
+                    row = services[order - 1]
+                    row.description = item.description
+                    row.updated_at = datetime.utcnow()
+                else:
+                    row = Service(
+                        title=item.title, description=item.description, icon_class=item.icon, display_order=order
+                    )
+                session.add(row)
+            upgraded = True
+
+        if upgraded:
+            session.commit()
+    if upgraded:
+        logger.info("Upgraded the original default landing page content")
+        CONTENT_CACHE.invalidate(LANDING_NAMESPACE)
+    return upgraded
+
+
 def initialize_default_data() -> None:
-    """Initialize default landing page data if none exists"""
+    """Initialize default landing page data if none exists, and upgrade untouched original defaults"""
     try:
+        upgrade_legacy_seed()
         service = LandingPageService()
 
         # Check if hero section exists
         if not service.get_hero_section():
             logger.info("Creating default hero section")
-            hero_data = HeroSectionCreate(
-                headline="Transform Your Home with Smart IT Solutions",
-                description="Experience the future of home automation with our cutting-edge IT solutions.",
-            )
+            hero_data = HeroSectionCreate(headline=HERO_HEADLINE, description=HERO_DESCRIPTION)
             service.create_hero_section(hero_data)
 
         # Check if services exist
         existing_services = service.get_services()
         if not existing_services:
             logger.info("Creating default services")
-            default_services = [
-                ServiceCreate(
-                    title="Smart Lighting Systems",
-                    description="Intelligent lighting solutions that adapt to your lifestyle.",
-                    icon_class="lightbulb",
-                    display_order=1,
-                ),
-                ServiceCreate(
-                    title="Advanced Security Networks",
-                    description="Comprehensive security systems with HD cameras and smart locks.",
-                    icon_class="security",
-                    display_order=2,
-                ),
-                ServiceCreate(
-                    title="Energy Management",
-                    description="Optimize your home's energy consumption with smart automation.",
-                    icon_class="power",
-                    display_order=3,
-                ),
-            ]
-
-            for service_data in default_services:
-                service.create_service(service_data)
+            for order, item in enumerate(DEFAULT_SERVICES, start=1):
+                service.create_service(
+                    ServiceCreate(
+                        title=item.title, description=item.description, icon_class=item.icon, display_order=order
+                    )
+                )
+
+        # Check if benefits exist
+        if not service.get_benefits():
+            logger.info("Creating default benefits")
+            for order, item in enumerate(DEFAULT_BENEFITS, start=1):
+                service.create_benefit(
+                    BenefitCreate(
+                        title=item.title, description=item.description, icon_class=item.icon, display_order=order
+                    )
+                )
 
         logger.info("Default landing page data initialization completed")
 
@@ -0,0 +1,345 @@
+import bisect
+import math
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence, Tuple, TypeVar
+
+from nicegui import Client
+
+from app.database import pool_stats
+from app.db_pool import PoolStats
+from app.query_cache import DATABRICKS_QUERY_CACHE, QueryCacheStats
+
+T = TypeVar("T")
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Upper bounds in seconds for request, query and render durations; slower ones land in +Inf
+LATENCY_BUCKETS: Tuple[float, ...] = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+@dataclass(frozen=True, slots=True)
+class Sample:
+    name: str
+    labels: Labels
+    value: float
+
+
+@dataclass(frozen=True, slots=True)
+class MetricFamily:
+    name: str
+    documentation: str
+    type: str
+    samples: Tuple[Sample, ...]
+
+
+class _Shards:
+    """Per-thread rows of values: writers only touch their own row, so updates need no lock.
+
+    Readers add the rows up; a sum taken while another thread writes may miss that one update,
+    which is fine for monitoring.
+    """
+
+    def __init__(self, width: int) -> None:
+        self.width = width
+        self._local = threading.local()
+        self._rows: List[List[float]] = []
+        self._lock = threading.Lock()
+
+    def row(self) -> List[float]:
+        row = getattr(self._local, "row", None)
+        if row is None:
+            row = [0.0] * self.width
+            with self._lock:
+                self._rows.append(row)
+            self._local.row = row
+        return row
+
+    def totals(self) -> List[float]:
+        with self._lock:
+            rows = list(self._rows)
+        totals = [0.0] * self.width
+        for row in rows:
+            for index, value in enumerate(row):
+                totals[index] += value
+        return totals
+
+
+class _Metric:
+    type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: str) -> Any:
+        """Child for one combination of label values, created on first use"""
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}, got {values}")
+            with self._lock:
+                child = self._children.setdefault(values, self._new_child())
+        return child
+
+    def _new_child(self) -> Any:
+        raise NotImplementedError
+
+    def _labelled(self) -> Iterator[Tuple[Labels, Any]]:
+        for values, child in list(self._children.items()):
+            yield tuple(zip(self.labelnames, values)), child
+
+    def collect(self) -> Iterable[MetricFamily]:
+        raise NotImplementedError
+
+
+class _CounterChild:
+    def __init__(self) -> None:
+        self._shards = _Shards(1)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._shards.row()[0] += amount
+
+    def value(self) -> float:
+        return self._shards.totals()[0]
+
+
+class Counter(_Metric):
+    type = "counter"
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def collect(self) -> Iterable[MetricFamily]:
+        samples = tuple(Sample(self.name, labels, child.value()) for labels, child in self._labelled())
+        yield MetricFamily(self.name, self.documentation, self.type, samples)
+
+
+class _HistogramChild:
+    def __init__(self, buckets: Tuple[float, ...]) -> None:
+        self.buckets = buckets
+        # One count per bucket, one for +Inf, then the sum of observed values
+        self._shards = _Shards(len(buckets) + 2)
+
+    def observe(self, value: float) -> None:
+        row = self._shards.row()
+        row[bisect.bisect_left(self.buckets, value)] += 1
+        row[-1] += value
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+    def snapshot(self) -> Tuple[Tuple[Tuple[float, float], ...], float, float]:
+        """Cumulative (upper bound, count) pairs ending with +Inf, the sum and the count"""
+        totals = self._shards.totals()
+        cumulative, running = [], 0.0
+        for bound, count in zip((*self.buckets, math.inf), totals):
+            running += count
+            cumulative.append((bound, running))
+        return tuple(cumulative), totals[-1], running
+
+
+class Histogram(_Metric):
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+
+    def time(self) -> Any:
+        return self.labels().time()
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def collect(self) -> Iterable[MetricFamily]:
+        samples: List[Sample] = []
+        for labels, child in self._labelled():
+            cumulative, total, count = child.snapshot()
+            samples.extend(histogram_samples(self.name, labels, cumulative, total, count))
+        yield MetricFamily(self.name, self.documentation, self.type, tuple(samples))
+
+
+def histogram_samples(
+    name: str, labels: Labels, cumulative: Iterable[Tuple[float, float]], total: float, count: float
+) -> Iterator[Sample]:
+    for bound, running in cumulative:
+        yield Sample(f"{name}_bucket", (*labels, ("le", _format_value(bound))), running)
+    yield Sample(f"{name}_sum", labels, total)
+    yield Sample(f"{name}_count", labels, count)
+
+
+class MetricsRegistry:
+    """Collectors rendered together in the Prometheus text exposition format"""
+
+    def __init__(self) -> None:
+        self._collectors: List[Callable[[], Iterable[MetricFamily]]] = []
+        self._lock = threading.Lock()
+
+    def register(self, collector: Callable[[], Iterable[MetricFamily]]) -> None:
+        with self._lock:
+            self._collectors.append(collector)
+
+    def metric(self, metric: T) -> T:
+        """Register a Counter or Histogram and return it"""
+        self.register(metric.collect)  # type: ignore[attr-defined]
+        return metric
+
+    def collect(self) -> Iterator[MetricFamily]:
+        with self._lock:
+            collectors = list(self._collectors)
+        for collector in collectors:
+            yield from collector()
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for family in self.collect():
+            lines.append(f"# HELP {family.name} {_escape_help(family.documentation)}")
+            lines.append(f"# TYPE {family.name} {family.type}")
+            for sample in family.samples:
+                lines.append(f"{sample.name}{_format_labels(sample.labels)} {_format_value(sample.value)}")
+        return "\n".join(lines) + "\n"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape_label(value)}"' for name, value in labels) + "}"
+
+
+def pool_families(stats: Dict[str, PoolStats]) -> Iterator[MetricFamily]:
+    """Connection pool statistics per engine, from the pools' own counters"""
+    connections: List[Sample] = []
+    capacity: List[Sample] = []
+    checkouts: List[Sample] = []
+    failures: List[Sample] = []
+    waits: List[Sample] = []
+    for engine, pool in stats.items():
+        labels: Labels = (("engine", engine),)
+        for state, value in (("checked_in", pool.checked_in), ("checked_out", pool.checked_out)):
+            connections.append(Sample("app_db_pool_connections", (*labels, ("state", state)), value))
+        capacity.append(Sample("app_db_pool_capacity", labels, pool.size + max(pool.max_overflow, 0)))
+        checkouts.append(Sample("app_db_pool_checkouts_total", labels, pool.checkouts))
+        failures.append(Sample("app_db_pool_checkout_failures_total", labels, pool.checkout_failures))
+        waits.extend(
+            histogram_samples(
+                "app_db_pool_wait_seconds", labels, pool.wait_buckets, pool.wait_seconds_total, pool.checkouts
+            )
+        )
+    yield MetricFamily("app_db_pool_connections", "Pooled connections by state", "gauge", tuple(connections))
+    yield MetricFamily("app_db_pool_capacity", "Pool size plus allowed overflow", "gauge", tuple(capacity))
+    yield MetricFamily("app_db_pool_checkouts_total", "Connection checkouts", "counter", tuple(checkouts))
+    yield MetricFamily(
+        "app_db_pool_checkout_failures_total", "Checkouts that raised, e.g. on timeout", "counter", tuple(failures)
+    )
+    yield MetricFamily("app_db_pool_wait_seconds", "Time to check out a connection", "histogram", tuple(waits))
+
+
+def query_cache_families(stats: QueryCacheStats) -> Iterator[MetricFamily]:
+    """Databricks query result cache lookups per outcome, evictions and current size"""
+    lookups = tuple(
+        Sample("app_databricks_query_cache_lookups_total", (("outcome", outcome),), value)
+        for outcome, value in (
+            ("hit", stats.hits),
+            ("stale", stats.stale_hits),
+            ("miss", stats.misses),
+            ("coalesced", stats.coalesced),
+        )
+    )
+    yield MetricFamily(
+        "app_databricks_query_cache_lookups_total",
+        "Query cache lookups: fresh hit, stale hit refreshed in the background, miss, or coalesced into a running load",
+        "counter",
+        lookups,
+    )
+    yield MetricFamily(
+        "app_databricks_query_cache_evictions_total",
+        "Cached results evicted to stay within the entry and row limits",
+        "counter",
+        (Sample("app_databricks_query_cache_evictions_total", (), stats.evictions),),
+    )
+    yield MetricFamily(
+        "app_databricks_query_cache_entries",
+        "Cached query results",
+        "gauge",
+        (Sample("app_databricks_query_cache_entries", (), stats.entries),),
+    )
+    yield MetricFamily(
+        "app_databricks_query_cache_rows",
+        "Rows held by cached query results",
+        "gauge",
+        (Sample("app_databricks_query_cache_rows", (), stats.rows),),
+    )
+
+
+def client_families() -> Iterator[MetricFamily]:
+    yield MetricFamily(
+        "app_nicegui_clients",
+        "Connected NiceGUI clients held by this worker",
+        "gauge",
+        (Sample("app_nicegui_clients", (), len(Client.instances)),),
+    )
+
+
+REGISTRY = MetricsRegistry()
+
+HTTP_REQUEST_DURATION = REGISTRY.metric(
+    Histogram(
+        "app_http_request_duration_seconds",
+        "Time from request to the last response byte, per route template",
+        ("method", "route", "status"),
+    )
+)
+SERVICE_CALL_DURATION = REGISTRY.metric(
+    Histogram("app_service_call_duration_seconds", "LandingPageService call duration, per method", ("method",))
+)
+PAGE_RENDER_DURATION = REGISTRY.metric(
+    Histogram("app_page_render_duration_seconds", "Time to build the landing page, per render mode", ("mode",))
+)
+CONTACT_SUBMISSIONS = REGISTRY.metric(
+    Counter("app_contact_submissions_total", "Contact form submissions, per outcome", ("outcome",))
+)
+
+REGISTRY.register(lambda: pool_families(pool_stats()))
+REGISTRY.register(client_families)
+REGISTRY.register(lambda: query_cache_families(DATABRICKS_QUERY_CACHE.stats()))
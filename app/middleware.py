@@ -0,0 +1,171 @@
+import time
+from dataclasses import dataclass
+from typing import FrozenSet, List, Optional, Sequence, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.metrics import HTTP_REQUEST_DURATION, Histogram
+from app.sql_profiler import SQL_PROFILER, SqlProfiler
+
+HeaderList = Tuple[Tuple[bytes, bytes], ...]
+
+SECURITY_HEADERS: Tuple[Tuple[str, str], ...] = (
+    ("X-XSS-Protection", "1; mode=block"),
+    ("X-Content-Type-Options", "nosniff"),
+    ("Referrer-Policy", "strict-origin-when-cross-origin"),
+    (
+        "Content-Security-Policy",
+        "default-src 'self' http: https: data: blob: 'unsafe-inline'; "
+        "frame-ancestors https://app.build/ https://www.app.build/ https://staging.app.build/",
+    ),
+)
+
+PathHeaders = Tuple[Tuple[str, Tuple[Tuple[str, str], ...]], ...]
+
+# Cache-Control by path prefix, for SecurityHeadersMiddleware's path_headers. NiceGUI already marks
+# its versioned /_nicegui/<version>/ assets immutable, and the theme stylesheet sets its own header
+CACHE_POLICY: PathHeaders = (
+    # Health probes and scrapes must always reach the app, never a cached copy
+    ("/health", (("Cache-Control", "no-store"),)),
+    ("/metrics", (("Cache-Control", "no-store"),)),
+    ("/debug/", (("Cache-Control", "no-store"),)),
+    ("/favicon.ico", (("Cache-Control", "public, max-age=86400"),)),
+)
+
+
+def encode_headers(headers: Sequence[Tuple[str, str]]) -> HeaderList:
+    """Raw ASGI header pairs: lower-case latin-1 names and values"""
+    return tuple((name.lower().encode("latin-1"), value.encode("latin-1")) for name, value in headers)
+
+
+def merge_headers(base: HeaderList, overrides: HeaderList) -> HeaderList:
+    """base with every header named in overrides replaced by the override"""
+    names = {name for name, _ in overrides}
+    return tuple(header for header in base if header[0] not in names) + overrides
+
+
+@dataclass(frozen=True, slots=True)
+class HeaderBlock:
+    headers: HeaderList
+    names: FrozenSet[bytes]
+
+    @classmethod
+    def of(cls, headers: HeaderList) -> "HeaderBlock":
+        return cls(headers, frozenset(name for name, _ in headers))
+
+
+class SecurityHeadersMiddleware:
+    """Pure ASGI middleware that adds a fixed header block to every HTTP response.
+
+    All header blocks are encoded once at construction. Per request the middleware only picks the
+    block for the path and swaps it into the http.response.start message, replacing any header of
+    the same name the application already set. path_headers maps path prefixes to headers that
+    extend or override the defaults; the first matching prefix wins.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        headers: Sequence[Tuple[str, str]] = SECURITY_HEADERS,
+        path_headers: Sequence[Tuple[str, Sequence[Tuple[str, str]]]] = (),
+    ) -> None:
+        self.app = app
+        default_headers = encode_headers(headers)
+        self.default_block = HeaderBlock.of(default_headers)
+        self.path_blocks: Tuple[Tuple[str, HeaderBlock], ...] = tuple(
+            (prefix, HeaderBlock.of(merge_headers(default_headers, encode_headers(extra))))
+            for prefix, extra in path_headers
+        )
+
+    def block_for(self, path: str) -> HeaderBlock:
+        for prefix, block in self.path_blocks:
+            if path.startswith(prefix):
+                return block
+        return self.default_block
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        block = self.block_for(scope["path"])
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers: List[Tuple[bytes, bytes]] = [
+                    header for header in message.get("headers", ()) if header[0].lower() not in block.names
+                ]
+                headers.extend(block.headers)
+                message["headers"] = headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware timing each HTTP request until its last body chunk is sent.
+
+    Requests are labelled with the route template ("/items/{id}") rather than the raw path, and
+    with the mount prefix for mounted apps, so label cardinality stays bounded.
+    """
+
+    def __init__(self, app: ASGIApp, histogram: Optional[Histogram] = None) -> None:
+        self.app = app
+        self.histogram = histogram if histogram is not None else HTTP_REQUEST_DURATION
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        root_path = scope.get("root_path", "")
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # The router has added the matched route (or the mount's root path) to scope by now
+            self.histogram.labels(scope["method"], route_template(scope, root_path), str(status)).observe(
+                time.perf_counter() - start
+            )
+
+
+class SqlProfilerMiddleware:
+    """Scopes SQL profiling per HTTP request, so statements repeated within one request are reported.
+
+    Requests are labelled with the method and route template; a disabled profiler is skipped entirely.
+    """
+
+    def __init__(self, app: ASGIApp, profiler: Optional[SqlProfiler] = None) -> None:
+        self.app = app
+        self.profiler = profiler if profiler is not None else SQL_PROFILER
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.profiler.enabled:
+            await self.app(scope, receive, send)
+            return
+        root_path = scope.get("root_path", "")
+        with self.profiler.request(f"{scope['method']} {scope['path']}") as profile:
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                if profile is not None:
+                    profile.label = f"{scope['method']} {route_template(scope, root_path)}"
+
+
+def route_template(scope: Scope, root_path: str = "") -> str:
+    route = scope.get("route")
+    path = getattr(route, "path", None)
+    if path is not None:
+        return path
+    mount_path = scope.get("root_path", "")
+    if mount_path != root_path:
+        return f"{mount_path[len(root_path) :]}/*"
+    return "<unmatched>"
@@ -1,4 +1,4 @@
-from sqlmodel import SQLModel, Field, JSON, Column
+from sqlmodel import SQLModel, Field, JSON, Column, Index, text
 from datetime import datetime
 from typing import Optional, Dict
 
@@ -6,6 +6,8 @@ from typing import Optional, Dict
 # Hero Section Model
 class HeroSection(SQLModel, table=True):
     __tablename__ = "hero_sections"  # type: ignore[assignment]
+    # Content reads only ever look at active rows, so index just those
+    __table_args__ = (Index("ix_hero_sections_active", "id", postgresql_where=text("is_active")),)
 
     id: Optional[int] = Field(default=None, primary_key=True)
     headline: str = Field(max_length=200, description="Main hero headline")
@@ -19,6 +21,7 @@ class HeroSection(SQLModel, table=True):
 # Services Model
 class Service(SQLModel, table=True):
     __tablename__ = "services"  # type: ignore[assignment]
+    __table_args__ = (Index("ix_services_active_display_order", "display_order", postgresql_where=text("is_active")),)
 
     id: Optional[int] = Field(default=None, primary_key=True)
     title: str = Field(max_length=100, description="Service title")
@@ -33,6 +36,7 @@ class Service(SQLModel, table=True):
 # Benefits Model
 class Benefit(SQLModel, table=True):
     __tablename__ = "benefits"  # type: ignore[assignment]
+    __table_args__ = (Index("ix_benefits_active_display_order", "display_order", postgresql_where=text("is_active")),)
 
     id: Optional[int] = Field(default=None, primary_key=True)
     title: str = Field(max_length=100, description="Benefit title")
@@ -47,6 +51,9 @@ class Benefit(SQLModel, table=True):
 # Call to Action Model
 class CallToAction(SQLModel, table=True):
     __tablename__ = "call_to_actions"  # type: ignore[assignment]
+    __table_args__ = (
+        Index("ix_call_to_actions_active_display_order", "display_order", postgresql_where=text("is_active")),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     button_text: str = Field(max_length=50, description="CTA button text")
@@ -62,6 +69,7 @@ class CallToAction(SQLModel, table=True):
 # Footer Content Model
 class FooterContent(SQLModel, table=True):
     __tablename__ = "footer_contents"  # type: ignore[assignment]
+    __table_args__ = (Index("ix_footer_contents_active", "id", postgresql_where=text("is_active")),)
 
     id: Optional[int] = Field(default=None, primary_key=True)
     company_name: str = Field(max_length=100, description="Company name")
@@ -78,6 +86,8 @@ class FooterContent(SQLModel, table=True):
 # Contact Form Submissions (for security and data handling)
 class ContactSubmission(SQLModel, table=True):
     __tablename__ = "contact_submissions"  # type: ignore[assignment]
+    # Rate limit lookups: submissions from one anonymized IP within a time window
+    __table_args__ = (Index("ix_contact_submissions_ip_address_created_at", "ip_address", "created_at"),)
 
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str = Field(max_length=100, description="Contact name")
@@ -108,6 +118,8 @@ class SiteConfiguration(SQLModel, table=True):
 # Security and Analytics Model
 class PageView(SQLModel, table=True):
     __tablename__ = "page_views"  # type: ignore[assignment]
+    # Analytics scans: page views per path over a time range
+    __table_args__ = (Index("ix_page_views_created_at_page_path", "created_at", "page_path"),)
 
     id: Optional[int] = Field(default=None, primary_key=True)
     page_path: str = Field(max_length=200, description="Page path viewed")
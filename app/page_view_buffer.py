@@ -0,0 +1,172 @@
+import logging
+import os
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, List, Optional
+
+from sqlalchemy import Engine, insert
+
+from app.database import ENGINE, register_reset_hook
+from app.models import PageView
+
+logger = logging.getLogger(__name__)
+
+PAGE_VIEW_BUFFER_SIZE = int(os.environ.get("APP_PAGE_VIEW_BUFFER_SIZE", "10000"))
+PAGE_VIEW_BATCH_SIZE = int(os.environ.get("APP_PAGE_VIEW_BATCH_SIZE", "500"))
+PAGE_VIEW_FLUSH_INTERVAL = float(os.environ.get("APP_PAGE_VIEW_FLUSH_INTERVAL", "2.0"))
+PAGE_VIEW_DROP_POLICY = os.environ.get("APP_PAGE_VIEW_DROP_POLICY", "drop_newest")
+
+DROP_POLICIES = ("drop_newest", "drop_oldest")
+
+
+@dataclass(frozen=True, slots=True)
+class PageViewBufferStats:
+    enqueued: int
+    dropped: int
+    flushed: int
+    failed: int
+    flushes: int
+    pending: int
+
+
+class PageViewBuffer:
+    """Bounded in-memory write-behind queue for page views.
+
+    submit() never touches the database. A background thread writes queued rows with one
+    multi-row INSERT per batch whenever batch_size rows are waiting or flush_interval elapses.
+    When the queue is full the drop policy discards either the new row or the oldest queued one.
+    """
+
+    def __init__(
+        self,
+        engine: Engine = ENGINE,
+        max_size: int = PAGE_VIEW_BUFFER_SIZE,
+        batch_size: int = PAGE_VIEW_BATCH_SIZE,
+        flush_interval: float = PAGE_VIEW_FLUSH_INTERVAL,
+        drop_policy: str = PAGE_VIEW_DROP_POLICY,
+    ) -> None:
+        if drop_policy not in DROP_POLICIES:
+            raise ValueError(f"Unknown drop policy {drop_policy!r}, expected one of {DROP_POLICIES}")
+        self.engine = engine
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.drop_policy = drop_policy
+        self._queue: Deque[PageView] = deque()
+        self._condition = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+        self._enqueued = 0
+        self._dropped = 0
+        self._flushed = 0
+        self._failed = 0
+        self._flushes = 0
+
+    def submit(self, page_view: PageView) -> bool:
+        """Queue a page view without blocking; returns False if the row was dropped.
+
+        After stop() no flusher runs any more, so the row is written before submit returns.
+        """
+        with self._condition:
+            if len(self._queue) >= self.max_size:
+                self._dropped += 1
+                if self.drop_policy == "drop_newest":
+                    return False
+                self._queue.popleft()
+            self._queue.append(page_view)
+            self._enqueued += 1
+            if len(self._queue) >= self.batch_size:
+                self._condition.notify()
+            stopped = self._stopping
+            if not stopped:
+                self._start_flusher()
+        if stopped:
+            self.flush()
+        return True
+
+    def flush(self) -> int:
+        """Synchronously write every queued row, returning the number of rows written"""
+        written = 0
+        with self._flush_lock:
+            while True:
+                with self._condition:
+                    batch = [self._queue.popleft() for _ in range(min(self.batch_size, len(self._queue)))]
+                if not batch:
+                    return written
+                written += self._write(batch)
+
+    def start(self) -> None:
+        """Start the background flusher, also after stop(); calling it again while running is a no-op"""
+        with self._condition:
+            self._stopping = False
+            self._start_flusher()
+
+    def stop(self) -> None:
+        """Stop the background flusher and write everything still queued"""
+        with self._condition:
+            self._stopping = True
+            self._condition.notify()
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join()
+        self.flush()
+
+    def clear(self) -> None:
+        """Discard queued rows without writing them"""
+        with self._condition:
+            self._queue.clear()
+
+    def record_failure(self) -> None:
+        """Count a page view that was lost before it reached the queue"""
+        with self._condition:
+            self._failed += 1
+
+    def stats(self) -> PageViewBufferStats:
+        with self._condition:
+            return PageViewBufferStats(
+                enqueued=self._enqueued,
+                dropped=self._dropped,
+                flushed=self._flushed,
+                failed=self._failed,
+                flushes=self._flushes,
+                pending=len(self._queue),
+            )
+
+    def _start_flusher(self) -> None:
+        # called with self._condition held, so it cannot race stop()
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="page-view-flusher", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: self._stopping or len(self._queue) >= self.batch_size, timeout=self.flush_interval
+                )
+                if self._stopping:
+                    return
+            self.flush()
+
+    def _write(self, batch: List[PageView]) -> int:
+        rows = [page_view.model_dump(exclude={"id"}) for page_view in batch]
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(insert(PageView), rows)
+        except Exception as e:
+            logger.error(f"Error writing {len(rows)} buffered page views: {e}")
+            with self._condition:
+                self._failed += len(rows)
+            return 0
+        with self._condition:
+            self._flushed += len(rows)
+            self._flushes += 1
+        return len(rows)
+
+
+PAGE_VIEW_BUFFER = PageViewBuffer()
+
+# Queued rows belong to the tables being wiped
+register_reset_hook(PAGE_VIEW_BUFFER.clear)
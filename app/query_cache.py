@@ -0,0 +1,257 @@
+import asyncio
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+Rows = List[Dict[str, Any]]
+
+QUERY_CACHE_TTL = float(os.environ.get("APP_DATABRICKS_CACHE_TTL", "60"))
+# Expired results are still served for this long while a single background load refreshes them
+QUERY_CACHE_STALE = float(os.environ.get("APP_DATABRICKS_CACHE_STALE", "300"))
+QUERY_CACHE_MAX_ENTRIES = int(os.environ.get("APP_DATABRICKS_CACHE_MAX_ENTRIES", "256"))
+# Rows held across all cached results; the least recently used results are evicted beyond this
+QUERY_CACHE_MAX_ROWS = int(os.environ.get("APP_DATABRICKS_CACHE_MAX_ROWS", "100000"))
+
+# A quoted literal or identifier (kept as is), or a run of whitespace and comments (one space). Line
+# comments end at their newline, so text on the next line is never folded into the comment.
+_LITERAL_OR_SPACE = re.compile(
+    r"('(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"|`[^`]*`)|(?:\s|--[^\n]*|/\*.*?\*/)+", re.DOTALL
+)
+_READ_ONLY = re.compile(r"\(*\s*(?:SELECT|WITH)\b", re.IGNORECASE)
+
+
+def normalize_sql(query: str) -> str:
+    """query without comments, whitespace outside quoted literals collapsed and trailing semicolons dropped"""
+    collapsed = _LITERAL_OR_SPACE.sub(lambda match: match.group(1) or " ", query)
+    return collapsed.strip().rstrip(";").rstrip()
+
+
+def read_only_statement(query: str) -> bool:
+    """Whether query is a SELECT or WITH statement, the only kind whose results may be cached"""
+    return _READ_ONLY.match(normalize_sql(query)) is not None
+
+
+def cache_key(query: str, parameters: Optional[Mapping[str, Any]] = None) -> str:
+    """Normalized query plus its parameters in name order, so equivalent requests share one entry"""
+    key = normalize_sql(query)
+    if parameters:
+        key += "\n" + json.dumps(parameters, sort_keys=True, default=str)
+    return key
+
+
+@dataclass(frozen=True, slots=True)
+class QueryCacheStats:
+    hits: int
+    stale_hits: int
+    misses: int
+    coalesced: int
+    evictions: int
+    entries: int
+    rows: int
+
+
+@dataclass(frozen=True, slots=True)
+class _CacheEntry:
+    rows: Rows
+    fresh_until: float
+    stale_until: float
+
+
+class _Flight:
+    """One load in progress; every caller asking for the same key meanwhile waits on its future"""
+
+    __slots__ = ("future", "generation")
+
+    def __init__(self, generation: int) -> None:
+        self.future: Future[Rows] = Future()
+        self.generation = generation
+
+
+class QueryResultCache:
+    """LRU cache of query results with TTL expiry, single-flight loads and stale-while-revalidate.
+
+    Concurrent requests for a key that is not cached share one load. For stale_seconds after a
+    result expires it is still returned at once while one background load refreshes it. Entries
+    are evicted least recently used first beyond max_entries results or max_rows rows in total.
+    Cached rows are shared between callers, so they must be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = QUERY_CACHE_TTL,
+        stale_seconds: float = QUERY_CACHE_STALE,
+        max_entries: int = QUERY_CACHE_MAX_ENTRIES,
+        max_rows: int = QUERY_CACHE_MAX_ROWS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.max_entries = max_entries
+        self.max_rows = max_rows
+        self._clock = clock
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._flights: Dict[str, _Flight] = {}
+        self._rows = 0
+        self._generation = 0
+        self._hits = 0
+        self._stale_hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._evictions = 0
+        self._loads: Set[asyncio.Task] = set()
+        self._lock = threading.Lock()
+
+    def get_or_load(
+        self, query: str, loader: Callable[[], Rows], parameters: Optional[Mapping[str, Any]] = None
+    ) -> Rows:
+        """Cached rows for query and parameters, calling loader on a miss.
+
+        Stale rows are refreshed in a background thread. Do not call this on an event loop
+        that may be running the load for the same key; use aget_or_load there.
+        """
+        key = cache_key(query, parameters)
+        rows, flight, leader = self._begin(key)
+        if flight is None:
+            assert rows is not None, "without a load to run or wait for the rows are cached"
+            return rows
+        if rows is not None:
+            # stale rows: this caller refreshes them in the background
+            threading.Thread(
+                target=self._refresh, args=(key, flight, loader), name="query-cache-refresh", daemon=True
+            ).start()
+            return rows
+        if not leader:
+            return flight.future.result()
+        return self._load(key, flight, loader)
+
+    async def aget_or_load(
+        self, query: str, loader: Callable[[], Awaitable[Rows]], parameters: Optional[Mapping[str, Any]] = None
+    ) -> Rows:
+        """Async variant of get_or_load.
+
+        The load runs in its own task, so a caller that is cancelled while waiting does not cancel
+        the load the other callers share; its result is still cached.
+        """
+        key = cache_key(query, parameters)
+        rows, flight, leader = self._begin(key)
+        if flight is None:
+            assert rows is not None, "without a load to run or wait for the rows are cached"
+            return rows
+        if leader:
+            task = asyncio.ensure_future(self._aload(key, flight, loader, refresh=rows is not None))
+            self._loads.add(task)
+            task.add_done_callback(self._loads.discard)
+        if rows is not None:
+            return rows
+        return await asyncio.shield(asyncio.wrap_future(flight.future))
+
+    def invalidate(self) -> None:
+        """Drop every cached result; loads already in flight are not stored"""
+        with self._lock:
+            self._entries.clear()
+            self._rows = 0
+            self._generation += 1
+
+    def stats(self) -> QueryCacheStats:
+        with self._lock:
+            return QueryCacheStats(
+                hits=self._hits,
+                stale_hits=self._stale_hits,
+                misses=self._misses,
+                coalesced=self._coalesced,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                rows=self._rows,
+            )
+
+    def _begin(self, key: str) -> Tuple[Optional[Rows], Optional[_Flight], bool]:
+        """Cached rows (None on a miss), the flight to wait for or run, and whether this caller runs it.
+
+        The flight is None only for rows that need no load: fresh ones, or stale ones already refreshing.
+        """
+        with self._lock:
+            now = self._clock()
+            entry = self._entries.get(key)
+            flight = self._flights.get(key)
+            if entry is not None and now < entry.stale_until:
+                self._entries.move_to_end(key)
+                if now < entry.fresh_until:
+                    self._hits += 1
+                    return entry.rows, None, False
+                self._stale_hits += 1
+                if flight is not None:
+                    return entry.rows, None, False
+                flight = self._flights[key] = _Flight(self._generation)
+                return entry.rows, flight, True
+            if flight is not None:
+                self._coalesced += 1
+                return None, flight, False
+            self._misses += 1
+            flight = self._flights[key] = _Flight(self._generation)
+            return None, flight, True
+
+    def _load(self, key: str, flight: _Flight, loader: Callable[[], Rows]) -> Rows:
+        try:
+            rows = loader()
+        except BaseException as e:
+            self._end(key, flight)
+            flight.future.set_exception(e)
+            raise
+        self._end(key, flight, rows)
+        flight.future.set_result(rows)
+        return rows
+
+    async def _aload(
+        self, key: str, flight: _Flight, loader: Callable[[], Awaitable[Rows]], refresh: bool = False
+    ) -> None:
+        try:
+            rows = await loader()
+        except BaseException as e:
+            self._end(key, flight)
+            flight.future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+            if refresh:
+                logger.error(f"Error refreshing cached query: {e}")
+            return
+        self._end(key, flight, rows)
+        flight.future.set_result(rows)
+
+    def _refresh(self, key: str, flight: _Flight, loader: Callable[[], Rows]) -> None:
+        try:
+            self._load(key, flight, loader)
+        except Exception as e:
+            logger.error(f"Error refreshing cached query: {e}")
+
+    def _end(self, key: str, flight: _Flight, rows: Optional[Rows] = None) -> None:
+        """Finish flight and store its rows, unless the cache was invalidated meanwhile"""
+        with self._lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+            if rows is None or flight.generation != self._generation:
+                return
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._rows -= len(previous.rows)
+            if len(rows) > self.max_rows:
+                return
+            now = self._clock()
+            expires_at = now + self.ttl_seconds
+            self._entries[key] = _CacheEntry(rows, expires_at, expires_at + self.stale_seconds)
+            self._rows += len(rows)
+            while len(self._entries) > self.max_entries or self._rows > self.max_rows:
+                _, evicted = self._entries.popitem(last=False)
+                self._rows -= len(evicted.rows)
+                self._evictions += 1
+
+
+DATABRICKS_QUERY_CACHE = QueryResultCache()
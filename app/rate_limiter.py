@@ -0,0 +1,143 @@
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from datetime import datetime, timedelta
+from typing import Callable, Deque
+
+from sqlmodel import select, func
+
+from app.database import get_session, get_async_session, register_reset_hook
+from app.models import ContactSubmission
+
+CONTACT_RATE_LIMIT = int(os.environ.get("APP_CONTACT_RATE_LIMIT", "3"))
+CONTACT_RATE_WINDOW_SECONDS = float(os.environ.get("APP_CONTACT_RATE_WINDOW_SECONDS", "3600"))
+RATE_LIMIT_BACKEND = os.environ.get("APP_RATE_LIMIT_BACKEND", "memory")
+RATE_LIMIT_MAX_KEYS = int(os.environ.get("APP_RATE_LIMIT_MAX_KEYS", "10000"))
+
+
+class RateLimiter(ABC):
+    """Allows at most `limit` recorded events per key within a sliding window of `window_seconds`"""
+
+    def __init__(self, limit: int, window_seconds: float) -> None:
+        self.limit = limit
+        self.window_seconds = window_seconds
+
+    @abstractmethod
+    def is_limited(self, key: str) -> bool:
+        """Check whether key has used up its allowance for the current window"""
+
+    async def ais_limited(self, key: str) -> bool:
+        """Async variant of is_limited; backends that do I/O override it to avoid blocking the event loop"""
+        return self.is_limited(key)
+
+    @abstractmethod
+    def record(self, key: str) -> None:
+        """Count one accepted event for key"""
+
+    def reset(self) -> None:
+        """Forget all recorded events"""
+
+
+class SlidingWindowRateLimiter(RateLimiter):
+    """In-process sliding-window log.
+
+    Each key keeps at most `limit` timestamps, so checks are O(1) in the number of past events,
+    and the least recently used keys are evicted beyond `max_keys` to bound memory.
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        window_seconds: float,
+        max_keys: int = RATE_LIMIT_MAX_KEYS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(limit, window_seconds)
+        self.max_keys = max_keys
+        self._clock = clock
+        self._events: OrderedDict[str, Deque[float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def is_limited(self, key: str) -> bool:
+        with self._lock:
+            events = self._events.get(key)
+            if events is None:
+                return False
+            window_start = self._clock() - self.window_seconds
+            while events and events[0] <= window_start:
+                events.popleft()
+            if not events:
+                del self._events[key]
+                return False
+            self._events.move_to_end(key)
+            return len(events) >= self.limit
+
+    def record(self, key: str) -> None:
+        with self._lock:
+            events = self._events.get(key)
+            if events is None:
+                events = self._events[key] = deque(maxlen=self.limit)
+            events.append(self._clock())
+            self._events.move_to_end(key)
+            while len(self._events) > self.max_keys:
+                self._events.popitem(last=False)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._events.clear()
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+
+class PostgresRateLimiter(RateLimiter):
+    """Counts stored contact submissions, so the limit is shared by every worker process.
+
+    The submission row itself is the record, and the count stops after `limit` matching rows.
+    """
+
+    def is_limited(self, key: str) -> bool:
+        with get_session() as session:
+            count = session.exec(self._count_statement(key)).one()
+        return count >= self.limit
+
+    async def ais_limited(self, key: str) -> bool:
+        async with get_async_session() as session:
+            count = (await session.exec(self._count_statement(key))).one()
+        return count >= self.limit
+
+    def _count_statement(self, key: str):
+        window_start = datetime.utcnow() - timedelta(seconds=self.window_seconds)
+        recent = (
+            select(ContactSubmission.id)
+            .where(ContactSubmission.ip_address == key, ContactSubmission.created_at >= window_start)
+            .limit(self.limit)
+            .subquery()
+        )
+        return select(func.count()).select_from(recent)
+
+    def record(self, key: str) -> None:
+        pass
+
+
+def create_rate_limiter(
+    backend: str = RATE_LIMIT_BACKEND,
+    limit: int = CONTACT_RATE_LIMIT,
+    window_seconds: float = CONTACT_RATE_WINDOW_SECONDS,
+) -> RateLimiter:
+    match backend:
+        case "memory":
+            return SlidingWindowRateLimiter(limit, window_seconds)
+        case "postgres":
+            return PostgresRateLimiter(limit, window_seconds)
+        case _:
+            raise ValueError(f"Unknown rate limit backend: {backend}")
+
+
+# Contact form policy, keyed by anonymized client IP
+CONTACT_RATE_LIMITER = create_rate_limiter()
+
+# Recorded submissions belong to the tables being wiped
+register_reset_hook(CONTACT_RATE_LIMITER.reset)
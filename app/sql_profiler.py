@@ -0,0 +1,263 @@
+import logging
+import os
+import re
+import threading
+import time
+from collections import Counter, OrderedDict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Engine, event
+
+from app.database import ASYNC_ENGINE, ENGINE
+from app.instrumentation import percentile
+
+logger = logging.getLogger(__name__)
+
+SQL_PROFILER_ENABLED = os.environ.get("APP_SQL_PROFILER", "false").lower() in ("1", "true", "yes")
+# Distinct statements tracked; the least recently executed one is dropped beyond this
+SQL_PROFILER_MAX_STATEMENTS = int(os.environ.get("APP_SQL_PROFILER_MAX_STATEMENTS", "500"))
+SQL_PROFILER_SAMPLES = int(os.environ.get("APP_SQL_PROFILER_SAMPLES", "256"))
+# A statement repeated this often within one request is reported as a likely N+1 query
+SQL_N_PLUS_ONE_THRESHOLD = int(os.environ.get("APP_SQL_N_PLUS_ONE_THRESHOLD", "5"))
+
+SORT_KEYS = ("total_ms", "count", "mean_ms", "p95_ms", "max_ms")
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+# psycopg2 and asyncpg placeholders: %(name)s, %s, $1
+_PLACEHOLDER = re.compile(r"%\(\w+\)s|%s|\$\d+")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def fingerprint(statement: str) -> str:
+    """Statement with literals and parameters replaced by ?, so repeated queries share one entry"""
+    normalized = _STRING.sub("?", statement)
+    normalized = _PLACEHOLDER.sub("?", normalized)
+    normalized = _NUMBER.sub("?", normalized)
+    normalized = _WHITESPACE.sub(" ", normalized).strip()
+    return _IN_LIST.sub("(?, ...)", normalized)
+
+
+@dataclass(frozen=True, slots=True)
+class StatementStats:
+    fingerprint: str
+    count: int
+    total_ms: float
+    max_ms: float
+    p95_ms: float
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class NPlusOneReport:
+    """A statement that one request executed `count` times"""
+
+    request: str
+    fingerprint: str
+    count: int
+
+
+class _StatementRecorder:
+    __slots__ = ("count", "total_ms", "max_ms", "samples")
+
+    def __init__(self, max_samples: int) -> None:
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.samples: Deque[float] = deque(maxlen=max_samples)
+
+
+class RequestProfile:
+    def __init__(self, label: str) -> None:
+        self.label = label
+        self.statements: Counter[str] = Counter()
+
+
+# Statements executed while a request is being handled are also counted per request
+_CURRENT_REQUEST: ContextVar[Optional[RequestProfile]] = ContextVar("sql_profiler_request", default=None)
+
+
+class SqlProfiler:
+    """Times every statement the engines send, grouped by fingerprint.
+
+    Enabling attaches before/after_cursor_execute listeners to the engines and disabling removes
+    them again, so a disabled profiler costs nothing. Within request() scopes, statements that
+    repeat n_plus_one_threshold times or more are logged and kept as likely N+1 queries.
+    """
+
+    def __init__(
+        self,
+        engines: Sequence[Engine],
+        enabled: bool = SQL_PROFILER_ENABLED,
+        max_statements: int = SQL_PROFILER_MAX_STATEMENTS,
+        max_samples: int = SQL_PROFILER_SAMPLES,
+        n_plus_one_threshold: int = SQL_N_PLUS_ONE_THRESHOLD,
+    ) -> None:
+        self.engines = tuple(engines)
+        self.max_statements = max_statements
+        self.max_samples = max_samples
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.enabled = False
+        self._statements: OrderedDict[str, _StatementRecorder] = OrderedDict()
+        self._n_plus_one: OrderedDict[Tuple[str, str], int] = OrderedDict()
+        self._lock = threading.Lock()
+        if enabled:
+            self.enable()
+
+    def enable(self) -> None:
+        with self._lock:
+            if self.enabled:
+                return
+            for engine in self.engines:
+                event.listen(engine, "before_cursor_execute", self._before_execute)
+                event.listen(engine, "after_cursor_execute", self._after_execute)
+                event.listen(engine, "handle_error", self._on_error)
+            self.enabled = True
+
+    def disable(self) -> None:
+        with self._lock:
+            if not self.enabled:
+                return
+            for engine in self.engines:
+                event.remove(engine, "before_cursor_execute", self._before_execute)
+                event.remove(engine, "after_cursor_execute", self._after_execute)
+                event.remove(engine, "handle_error", self._on_error)
+            self.enabled = False
+
+    def reset(self) -> None:
+        with self._lock:
+            self._statements.clear()
+            self._n_plus_one.clear()
+
+    @contextmanager
+    def request(self, label: str) -> Iterator[Optional[RequestProfile]]:
+        """Count the statements executed inside the block and report repeated ones on exit.
+
+        Yields the profile (None while disabled); its label may be refined before the block ends.
+        """
+        if not self.enabled:
+            yield None
+            return
+        profile = RequestProfile(label)
+        token = _CURRENT_REQUEST.set(profile)
+        try:
+            yield profile
+        finally:
+            _CURRENT_REQUEST.reset(token)
+            self._check_n_plus_one(profile)
+
+    def top(self, limit: int = 20, sort_by: str = "total_ms") -> List[StatementStats]:
+        """The `limit` most expensive statements by sort_by"""
+        if sort_by not in SORT_KEYS:
+            raise ValueError(f"Unknown sort key {sort_by!r}, expected one of {SORT_KEYS}")
+        with self._lock:
+            stats = [
+                StatementStats(
+                    fingerprint=statement,
+                    count=recorder.count,
+                    total_ms=recorder.total_ms,
+                    max_ms=recorder.max_ms,
+                    p95_ms=percentile(sorted(recorder.samples), 0.95),
+                )
+                for statement, recorder in self._statements.items()
+            ]
+        return sorted(stats, key=lambda stat: getattr(stat, sort_by), reverse=True)[:limit]
+
+    def n_plus_one(self) -> List[NPlusOneReport]:
+        """Repeated statements per request label, the most repeated first"""
+        with self._lock:
+            reports = [
+                NPlusOneReport(request=request, fingerprint=statement, count=count)
+                for (request, statement), count in self._n_plus_one.items()
+            ]
+        return sorted(reports, key=lambda report: report.count, reverse=True)
+
+    def as_dict(self, limit: int = 20, sort_by: str = "total_ms") -> Dict[str, Any]:
+        """JSON-ready dump of the top statements and the N+1 reports"""
+        return {
+            "enabled": self.enabled,
+            "statements": [
+                {
+                    "fingerprint": stat.fingerprint,
+                    "count": stat.count,
+                    "total_ms": round(stat.total_ms, 3),
+                    "mean_ms": round(stat.mean_ms, 3),
+                    "p95_ms": round(stat.p95_ms, 3),
+                    "max_ms": round(stat.max_ms, 3),
+                }
+                for stat in self.top(limit, sort_by)
+            ],
+            "n_plus_one": [
+                {"request": report.request, "fingerprint": report.fingerprint, "count": report.count}
+                for report in self.n_plus_one()[:limit]
+            ],
+        }
+
+    def report(self, limit: int = 20, sort_by: str = "total_ms") -> str:
+        """Plain-text table of the top statements"""
+        lines = [f"{'count':>8} {'total ms':>10} {'mean':>8} {'p95':>8} {'max':>8}  statement"]
+        for stat in self.top(limit, sort_by):
+            lines.append(
+                f"{stat.count:>8} {stat.total_ms:>10.1f} {stat.mean_ms:>8.2f} {stat.p95_ms:>8.2f} "
+                f"{stat.max_ms:>8.2f}  {stat.fingerprint}"
+            )
+        return "\n".join(lines)
+
+    def _before_execute(
+        self, conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+    ) -> None:
+        conn.info.setdefault("sql_profiler_start", []).append(time.perf_counter())
+
+    def _after_execute(
+        self, conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+    ) -> None:
+        starts = conn.info.get("sql_profiler_start")
+        if not starts:
+            return
+        self._record(fingerprint(statement), (time.perf_counter() - starts.pop()) * 1000)
+
+    def _on_error(self, exception_context: Any) -> None:
+        # after_cursor_execute does not run for failed statements; drop their start time
+        connection = exception_context.connection
+        if connection is not None:
+            starts = connection.info.get("sql_profiler_start")
+            if starts:
+                starts.pop()
+
+    def _record(self, statement: str, elapsed_ms: float) -> None:
+        with self._lock:
+            recorder = self._statements.get(statement)
+            if recorder is None:
+                recorder = self._statements[statement] = _StatementRecorder(self.max_samples)
+                if len(self._statements) > self.max_statements:
+                    self._statements.popitem(last=False)
+            else:
+                self._statements.move_to_end(statement)
+            recorder.count += 1
+            recorder.total_ms += elapsed_ms
+            recorder.max_ms = max(recorder.max_ms, elapsed_ms)
+            recorder.samples.append(elapsed_ms)
+        profile = _CURRENT_REQUEST.get()
+        if profile is not None:
+            profile.statements[statement] += 1
+
+    def _check_n_plus_one(self, profile: RequestProfile) -> None:
+        for statement, count in profile.statements.items():
+            if count < self.n_plus_one_threshold:
+                continue
+            logger.warning(f"Possible N+1 query: {count} executions during {profile.label}: {statement[:200]}")
+            with self._lock:
+                key = (profile.label, statement)
+                self._n_plus_one[key] = max(self._n_plus_one.pop(key, 0), count)
+                if len(self._n_plus_one) > self.max_statements:
+                    self._n_plus_one.popitem(last=False)
+
+
+SQL_PROFILER = SqlProfiler((ENGINE, ASYNC_ENGINE.sync_engine))
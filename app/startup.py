@@ -1,10 +1,21 @@
 from app.database import create_tables
+from app.invalidation import CONTENT_LISTENER, install_notify_triggers
 from app.landing_service import initialize_default_data
+from app.page_view_buffer import PAGE_VIEW_BUFFER
 import app.landing_page
 
 
 def startup() -> None:
     # this function is called before the first request
     create_tables()
+    install_notify_triggers()
     initialize_default_data()
+    CONTENT_LISTENER.start()
+    PAGE_VIEW_BUFFER.start()
     app.landing_page.create()
+
+
+def shutdown() -> None:
+    # this function is called when the server stops
+    CONTENT_LISTENER.stop()
+    PAGE_VIEW_BUFFER.stop()  # flush page views still waiting in memory
@@ -0,0 +1,236 @@
+import hashlib
+import os
+from dataclasses import dataclass
+from html import escape
+from typing import Optional
+from urllib.parse import quote
+
+from nicegui import __version__ as nicegui_version
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.content_cache import CONTENT_CACHE, LANDING_NAMESPACE
+from app.landing_content import (
+    COMPANY_TAGLINE,
+    CONTACT_HOURS,
+    CONTACT_STATS,
+    EMAIL_BODY,
+    EMAIL_SUBJECT,
+    QUICK_LINKS,
+    SOCIAL_ICONS,
+    THEME_META,
+    WHATSAPP_MESSAGE,
+    WHATSAPP_PHONE,
+    LandingView,
+)
+from app.landing_service import LandingPageService
+from app.theme_asset import THEME_ASSET
+
+# Browsers and CDNs may reuse the page this long before revalidating it with If-None-Match
+STATIC_PAGE_MAX_AGE = int(os.environ.get("APP_STATIC_PAGE_MAX_AGE", "60"))
+
+# Live in the landing namespace, so content invalidation also discards rendered HTML
+STATIC_PAGE_KEY = f"{LANDING_NAMESPACE}:static_html"
+LANDING_FRAGMENTS_KEY = f"{LANDING_NAMESPACE}:fragments"
+
+NICEGUI_STATIC = f"/_nicegui/{nicegui_version}/static"
+
+
+@dataclass(frozen=True, slots=True)
+class RenderedPage:
+    body: bytes
+    etag: str
+
+
+@dataclass(frozen=True, slots=True)
+class LandingFragments:
+    """HTML for the non-interactive parts of the landing page.
+
+    Shared by the static document and the lightweight NiceGUI page, which places live buttons
+    between the fragments.
+    """
+
+    hero_text: str
+    services: str
+    benefits: str
+    cta_intro: str
+    cta_contact: str
+    footer: str
+
+
+def render_landing_fragments(view: LandingView) -> LandingFragments:
+    services = "".join(
+        f"""
+        <div class="service-card p-8 rounded-2xl">
+          <i class="material-icons text-5xl text-blue-400 mb-6">{escape(service.icon)}</i>
+          <div class="text-2xl font-bold text-white mb-4">{escape(service.title)}</div>
+          <div class="text-slate-300 leading-relaxed">{escape(service.description)}</div>
+        </div>"""
+        for service in view.services
+    )
+    benefits = "".join(
+        f"""
+        <div class="benefit-item p-6 rounded-xl">
+          <div class="flex items-start gap-4">
+            <i class="material-icons text-3xl text-blue-400 mt-1">{escape(benefit.icon)}</i>
+            <div class="flex-1">
+              <div class="text-xl font-bold text-white mb-2">{escape(benefit.title)}</div>
+              <div class="text-slate-300 leading-relaxed">{escape(benefit.description)}</div>
+            </div>
+          </div>
+        </div>"""
+        for benefit in view.benefits
+    )
+    stats = "".join(
+        f"""
+        <div class="text-center">
+          <div class="text-3xl font-bold text-blue-400">{escape(value)}</div>
+          <div class="text-slate-400">{escape(caption)}</div>
+        </div>"""
+        for value, caption in CONTACT_STATS
+    )
+    social_icons = "".join(
+        f'<i class="material-icons text-2xl text-slate-500 hover:text-blue-400">{escape(icon)}</i>'
+        for icon in SOCIAL_ICONS
+    )
+    quick_links = "".join(
+        f'<div class="text-slate-400 hover:text-blue-400 mb-2">{escape(link)}</div>' for link in QUICK_LINKS
+    )
+
+    return LandingFragments(
+        hero_text=f"""
+    <h1 class="text-5xl md:text-7xl font-bold text-white mb-6 leading-tight">{escape(view.hero_headline)}</h1>
+    <p class="text-xl md:text-2xl text-slate-300 mb-12 max-w-4xl mx-auto leading-relaxed">{escape(view.hero_description)}</p>""",
+        services=f"""
+<section id="services" class="py-20 px-4">
+  <div class="max-w-6xl mx-auto flex flex-col gap-4">
+    <h2 class="text-4xl md:text-5xl font-bold text-center mb-4 text-white">Our Smart Home Services</h2>
+    <p class="text-xl text-slate-400 text-center mb-16 max-w-3xl mx-auto">Comprehensive IT solutions tailored for modern smart homes</p>
+    <div class="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-8">{services}
+    </div>
+  </div>
+</section>""",
+        benefits=f"""
+<section class="py-20 px-4 bg-slate-900/50">
+  <div class="max-w-6xl mx-auto flex flex-col gap-4">
+    <h2 class="text-4xl md:text-5xl font-bold text-center mb-4 text-white">Why Choose Our Smart Home Solutions</h2>
+    <p class="text-xl text-slate-400 text-center mb-16 max-w-3xl mx-auto">Experience the advantages of working with industry-leading professionals</p>
+    <div class="grid grid-cols-1 md:grid-cols-2 gap-8">{benefits}
+    </div>
+  </div>
+</section>""",
+        cta_intro=f"""
+    <h2 class="text-4xl md:text-5xl font-bold mb-6 text-white">Ready to Transform Your Home?</h2>
+    <p class="text-xl text-slate-300 mb-12 max-w-3xl mx-auto leading-relaxed">Get in touch with our experts today for a free consultation and personalized smart home solution.</p>
+    <div class="flex justify-center gap-8 mb-12 flex-wrap">{stats}
+    </div>""",
+        cta_contact=f"""
+    <div class="mt-12 p-6 glass-card rounded-xl">
+      <div class="text-lg font-semibold text-white mb-2">Prefer a Phone Call?</div>
+      <div class="text-blue-400 text-xl font-mono">Call us at: {escape(view.contact_phone)}</div>
+      <div class="text-slate-400 text-sm mt-2">{escape(CONTACT_HOURS)}</div>
+    </div>""",
+        footer=f"""
+<footer class="bg-slate-950 py-12 px-4 border-t border-slate-800">
+  <div class="max-w-6xl mx-auto">
+    <div class="flex justify-between items-start gap-8 flex-wrap">
+      <div class="flex-1 min-w-64">
+        <div class="text-2xl font-bold text-white mb-4">{escape(view.company_name)}</div>
+        <div class="text-slate-400 leading-relaxed mb-4">{escape(COMPANY_TAGLINE)}</div>
+        <div class="flex gap-4">{social_icons}</div>
+      </div>
+      <div class="min-w-48">
+        <div class="text-lg font-semibold text-white mb-4">Quick Links</div>
+        {quick_links}
+      </div>
+      <div class="min-w-64">
+        <div class="text-lg font-semibold text-white mb-4">Contact Information</div>
+        <div class="text-slate-400 mb-2">📧 {escape(view.contact_email)}</div>
+        <div class="text-slate-400 mb-2">📞 {escape(view.contact_phone)}</div>
+        <div class="text-slate-400 mb-2">📍 {escape(view.contact_address)}</div>
+      </div>
+    </div>
+    <div class="border-t border-slate-800 pt-8 mt-8 text-center">
+      <div class="text-slate-500 no-select">{escape(view.copyright_text)}</div>
+    </div>
+  </div>
+</footer>""",
+    )
+
+
+def get_landing_fragments() -> LandingFragments:
+    """Fragments of the current content, rendered once per content version"""
+    return CONTENT_CACHE.get_or_load(
+        LANDING_FRAGMENTS_KEY, lambda: render_landing_fragments(LandingPageService.get_landing_view())
+    )
+
+
+def render_landing_html(view: LandingView) -> str:
+    """Render all landing sections into one self-contained HTML document.
+
+    The interactive buttons of the live page become plain links: in-page anchors for scrolling,
+    wa.me and mailto URLs for the contact actions.
+    """
+    fragments = render_landing_fragments(view)
+    whatsapp_url = f"https://wa.me/{quote(WHATSAPP_PHONE)}?text={quote(WHATSAPP_MESSAGE)}"
+    mailto_url = f"mailto:{view.contact_email}?subject={quote(EMAIL_SUBJECT)}&body={quote(EMAIL_BODY)}"
+
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{escape(view.company_name)}</title>
+{THEME_META}<link href="{NICEGUI_STATIC}/fonts.css" rel="stylesheet" type="text/css">
+{THEME_ASSET.link}
+<script defer src="{NICEGUI_STATIC}/tailwindcss.min.js"></script>
+</head>
+<body>
+<section class="hero-gradient min-h-screen flex items-center justify-center px-4">
+  <div class="max-w-6xl mx-auto text-center hero-content flex flex-col gap-4">{fragments.hero_text}
+    <div class="flex gap-6 justify-center flex-wrap">
+      <a href="#cta" class="cta-button text-white px-8 py-4 text-lg font-semibold rounded-xl btn-focus">Get Free Consultation</a>
+      <a href="#services" class="border-2 border-blue-500 text-blue-400 hover:bg-blue-500 hover:text-white px-8 py-4 text-lg font-semibold rounded-xl btn-focus">View Our Services</a>
+    </div>
+  </div>
+</section>{fragments.services}{fragments.benefits}
+<section id="cta" class="py-20 px-4">
+  <div class="max-w-4xl mx-auto text-center flex flex-col gap-4">{fragments.cta_intro}
+    <div class="flex gap-6 justify-center flex-wrap">
+      <a href="{escape(whatsapp_url)}" target="_blank" rel="noopener noreferrer" class="whatsapp-btn text-white px-8 py-4 text-lg font-semibold rounded-xl btn-focus"><i class="material-icons align-middle mr-2">chat</i>Contact via WhatsApp</a>
+      <a href="{escape(mailto_url)}" class="email-btn text-white px-8 py-4 text-lg font-semibold rounded-xl btn-focus"><i class="material-icons align-middle mr-2">email</i>Send us an Email</a>
+    </div>{fragments.cta_contact}
+  </div>
+</section>{fragments.footer}
+</body>
+</html>
+"""
+
+
+def build_static_landing_page() -> RenderedPage:
+    body = render_landing_html(LandingPageService.get_landing_view()).encode()
+    return RenderedPage(body=body, etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"')
+
+
+def get_static_landing_page() -> RenderedPage:
+    """The rendered page, built once per content version"""
+    return CONTENT_CACHE.get_or_load(STATIC_PAGE_KEY, build_static_landing_page)
+
+
+def landing_response(request: Request) -> Response:
+    """Serve the pre-rendered page, answering conditional requests with 304 Not Modified"""
+    page = get_static_landing_page()
+    headers = {"ETag": page.etag, "Cache-Control": f"public, max-age={STATIC_PAGE_MAX_AGE}"}
+    if etag_matches(request.headers.get("if-none-match"), page.etag):
+        return Response(status_code=304, headers=headers)
+    body = b"" if request.method == "HEAD" else page.body
+    headers["Content-Length"] = str(len(page.body))
+    return Response(body, media_type="text/html; charset=utf-8", headers=headers)
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against etag, as RFC 9110 prescribes for GET"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(candidate.strip().removeprefix("W/") == etag for candidate in if_none_match.split(","))
@@ -0,0 +1,81 @@
+import hashlib
+import re
+from dataclasses import dataclass
+
+from nicegui import app
+from starlette.responses import Response
+
+from app.landing_content import THEME_COLORS, THEME_CSS
+
+# The URL changes with the content, so browsers may keep a fetched asset forever
+ASSET_CACHE_CONTROL = "public, max-age=31536000, immutable"
+ASSET_PREFIX = "/assets"
+
+_COMMENT = re.compile(r"/\*.*?\*/", re.DOTALL)
+_WHITESPACE = re.compile(r"\s+")
+# Whitespace before ":" is kept: in ".card :hover" it is a descendant combinator
+_AROUND_PUNCTUATION = re.compile(r"\s*([{};,>])\s*")
+_AFTER_COLON = re.compile(r":\s+")
+
+
+@dataclass(frozen=True, slots=True)
+class CssAsset:
+    name: str
+    body: bytes
+    digest: str
+
+    @property
+    def path(self) -> str:
+        return f"{ASSET_PREFIX}/{self.name}.{self.digest}.css"
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.digest}"'
+
+    @property
+    def link(self) -> str:
+        return f'<link rel="stylesheet" href="{self.path}">'
+
+
+def minify_css(css: str) -> str:
+    """Drop comments and the whitespace CSS does not need"""
+    css = _COMMENT.sub("", css)
+    css = _WHITESPACE.sub(" ", css)
+    css = _AROUND_PUNCTUATION.sub(r"\1", css)
+    css = _AFTER_COLON.sub(":", css)
+    return css.replace(";}", "}").strip()
+
+
+def theme_stylesheet() -> str:
+    """Theme CSS plus the rules the live page used to set per visitor.
+
+    The Quasar brand variables are what ui.colors() sets on the body from JavaScript; declaring
+    them here lets every page pick them up without a colors element per client.
+    """
+    brand = "".join(f"    --q-{name}: {color};\n" for name, color in THEME_COLORS)
+    return f"{THEME_CSS}\nbody {{\n{brand}}}\n\nhtml {{\n    scroll-behavior: smooth;\n}}\n"
+
+
+def build_css_asset(name: str, css: str) -> CssAsset:
+    body = minify_css(css).encode()
+    return CssAsset(name=name, body=body, digest=hashlib.sha256(body).hexdigest()[:12])
+
+
+# Built once at import: the theme only changes with a deploy
+THEME_ASSET = build_css_asset("theme", theme_stylesheet())
+
+
+def asset_response(asset: CssAsset) -> Response:
+    return Response(
+        asset.body,
+        media_type="text/css; charset=utf-8",
+        headers={"ETag": asset.etag, "Cache-Control": ASSET_CACHE_CONTROL},
+    )
+
+
+def create() -> None:
+    """Serve the theme stylesheet under its content-hashed path"""
+
+    @app.get(THEME_ASSET.path, include_in_schema=False)
+    def theme_stylesheet_asset() -> Response:
+        return asset_response(THEME_ASSET)
@@ -1,38 +1,96 @@
 import logging
 import os
-from app.startup import startup
+import secrets
+from app.startup import startup, shutdown
 from nicegui import app, ui
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from app.compression import CompressionMiddleware
+from app.health import HEALTH_CHECKER
+from app.metrics import CONTENT_TYPE, REGISTRY
+from app.middleware import (
+    CACHE_POLICY,
+    MetricsMiddleware,
+    SecurityHeadersMiddleware,
+    SqlProfilerMiddleware,
+)
+from app.sql_profiler import SQL_PROFILER
 
 # configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request, call_next):
-        response = await call_next(request)
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        response.headers["Content-Security-Policy"] = "default-src 'self' http: https: data: blob: 'unsafe-inline'; frame-ancestors https://app.build/ https://www.app.build/ https://staging.app.build/"
-        return response
-
-
 @app.get("/health")
+@app.get("/health/live")
 async def health():
+    # Liveness: the process serves requests; dependencies are checked by /health/ready
     return {"status": "healthy", "service": "nicegui-app"}
 
 
+@app.get("/health/ready")
+async def ready():
+    report = await HEALTH_CHECKER.check()
+    return JSONResponse(report.as_dict(), status_code=200 if report.ready else 503)
+
+
+@app.get("/metrics")
+def metrics():
+    return Response(REGISTRY.render(), media_type=CONTENT_TYPE)
+
+
+# Debug endpoints expose SQL text and toggle profiling; they only exist when a token is configured
+DEBUG_TOKEN = os.environ.get("APP_DEBUG_TOKEN", "")
+
+
+def debug_authorized(request: Request) -> bool:
+    return secrets.compare_digest(request.headers.get("x-debug-token", ""), DEBUG_TOKEN)
+
+
+if DEBUG_TOKEN:
+
+    @app.get("/debug/sql", include_in_schema=False)
+    def sql_profile(request: Request, limit: int = 20, sort_by: str = "total_ms"):
+        if not debug_authorized(request):
+            return Response(status_code=403)
+        try:
+            return SQL_PROFILER.as_dict(limit, sort_by)
+        except ValueError as e:
+            logging.getLogger(__name__).warning(f"Invalid SQL profile request: {e}")
+            return JSONResponse({"error": str(e)}, status_code=400)
+
+    @app.post("/debug/sql/{action}", include_in_schema=False)
+    def sql_profile_action(request: Request, action: str):
+        if not debug_authorized(request):
+            return Response(status_code=403)
+        match action:
+            case "enable":
+                SQL_PROFILER.enable()
+            case "disable":
+                SQL_PROFILER.disable()
+            case "reset":
+                SQL_PROFILER.reset()
+            case _:
+                return JSONResponse({"error": f"Unknown action: {action}"}, status_code=404)
+        return {"enabled": SQL_PROFILER.enabled}
+
+
 # suppress sqlalchemy engine logs below warning level
 logging.getLogger("sqlalchemy.engine.Engine").setLevel(logging.WARNING)
 
 app.on_startup(startup)
+app.on_shutdown(shutdown)
 
-# Add security headers middleware
-app.add_middleware(SecurityHeadersMiddleware)
+# Add security headers with the caching policy, and compression; the last added middleware runs
+# outermost, so compression sees the final headers
+app.add_middleware(SecurityHeadersMiddleware, path_headers=CACHE_POLICY)
+app.add_middleware(CompressionMiddleware)
+app.add_middleware(SqlProfilerMiddleware)
+# Outermost of the middleware added here, so request durations include all of the above. ui.run()
+# adds NiceGUI's own middleware (session and request tracking, GZip, prefix redirects, cache control)
+# afterwards, around this one, so their work is not timed
+app.add_middleware(MetricsMiddleware)
 
 ui.run(
     host="0.0.0.0",
@@ -1,5 +1,7 @@
-from typing import Generator
+from typing import Generator, List
 import pytest
+from sqlalchemy import event
+from app.database import ENGINE
 from app.startup import startup
 from nicegui.testing import User
 
@@ -10,3 +12,16 @@ pytest_plugins = ["nicegui.testing.plugin"]
 def user(user: User) -> Generator[User, None, None]:
     startup()
     yield user
+
+
+@pytest.fixture
+def statement_log() -> Generator[List[str], None, None]:
+    """Record every SQL statement sent through ENGINE while the test runs"""
+    statements: List[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(ENGINE, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(ENGINE, "before_cursor_execute", before_cursor_execute)
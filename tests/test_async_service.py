@@ -0,0 +1,101 @@
+import asyncio
+from datetime import datetime, timedelta
+import pytest
+from app.database import reset_db, get_session, ASYNC_ENGINE
+from app.landing_service import LandingPageService
+from app.models import ContactSubmissionCreate, HeroSectionCreate, ServiceCreate, BenefitCreate, SiteConfiguration
+from app.page_view_buffer import PAGE_VIEW_BUFFER
+from app.rate_limiter import PostgresRateLimiter
+
+
+@pytest.fixture
+async def new_db():
+    reset_db()
+    yield
+    reset_db()
+    # Pooled asyncpg connections are bound to the event loop of the test that opened them
+    await ASYNC_ENGINE.dispose()
+
+
+@pytest.fixture
+def content(new_db):
+    LandingPageService.create_hero_section(HeroSectionCreate(headline="Hero", description="Desc"))
+    for order in (2, 1):
+        LandingPageService.create_service(
+            ServiceCreate(title=f"Service {order}", description="Desc", display_order=order)
+        )
+    LandingPageService.create_benefit(BenefitCreate(title="Benefit", description="Desc", display_order=1))
+    yield
+
+
+class TestAsyncContent:
+    """Test the awaitable content getters"""
+
+    async def test_matches_sync_bundle(self, content):
+        bundle = await LandingPageService.aget_landing_bundle()
+        assert bundle == LandingPageService.get_landing_bundle()
+        assert [s.title for s in bundle.services] == ["Service 1", "Service 2"]
+
+    async def test_getters(self, content):
+        hero = await LandingPageService.aget_hero_section()
+        assert hero is not None
+        assert hero.headline == "Hero"
+        assert [s.display_order for s in await LandingPageService.aget_services()] == [1, 2]
+        assert len(await LandingPageService.aget_benefits()) == 1
+        assert await LandingPageService.aget_cta_buttons() == []
+        assert await LandingPageService.aget_footer_content() is None
+
+    async def test_shares_sync_cache(self, content, statement_log):
+        LandingPageService.get_services()
+        await LandingPageService.aget_services()
+        await LandingPageService.aget_hero_section()
+        assert len(statement_log) == 1  # only the sync load went through ENGINE
+
+    async def test_concurrent_loads(self, content):
+        results = await asyncio.gather(*(LandingPageService.aget_landing_bundle() for _ in range(10)))
+        assert all(len(bundle.services) == 2 for bundle in results)
+
+    async def test_site_config(self, new_db):
+        with get_session() as session:
+            session.add(SiteConfiguration(config_key="company_email", config_value="info@example.com"))
+            session.commit()
+        assert await LandingPageService.aget_site_config("company_email") == "info@example.com"
+        assert await LandingPageService.aget_site_config("missing") is None
+
+
+class TestAsyncWrites:
+    """Test the awaitable contact form and reporting paths"""
+
+    async def test_submit_contact_form(self, new_db):
+        contact_data = ContactSubmissionCreate(name=" Test User ", email="TEST@Example.com", message="Hello")
+        result = await LandingPageService.asubmit_contact_form(contact_data, "192.168.1.100", "Agent")
+
+        assert result is not None
+        assert result.id is not None
+        assert result.name == "Test User"
+        assert result.email == "test@example.com"
+        assert result.ip_address == "192.168.1.0"
+
+    async def test_submit_rejects_invalid_email(self, new_db):
+        contact_data = ContactSubmissionCreate(name="Test", email="invalid", message="Hello")
+        assert await LandingPageService.asubmit_contact_form(contact_data) is None
+
+    async def test_submit_rate_limited(self, new_db):
+        contact_data = ContactSubmissionCreate(name="Test", email="test@example.com", message="Hello")
+        for _ in range(3):
+            assert await LandingPageService.asubmit_contact_form(contact_data, "10.1.2.3") is not None
+        assert await LandingPageService.asubmit_contact_form(contact_data, "10.1.2.4") is None
+
+    async def test_postgres_limiter_async_check(self, new_db):
+        contact_data = ContactSubmissionCreate(name="Test", email="test@example.com", message="Hello")
+        await LandingPageService.asubmit_contact_form(contact_data, "10.1.2.3")
+        limiter = PostgresRateLimiter(limit=1, window_seconds=3600)
+        assert await limiter.ais_limited("10.1.2.0")
+        assert not await limiter.ais_limited("10.9.9.0")
+
+    async def test_page_view_counts(self, new_db):
+        LandingPageService.log_page_view("/")
+        LandingPageService.log_page_view("/")
+        PAGE_VIEW_BUFFER.flush()
+        counts = await LandingPageService.aget_page_view_counts(datetime.utcnow() - timedelta(hours=1))
+        assert counts == {"/": 2}
@@ -0,0 +1,209 @@
+"""pytest-benchmark suite for the service layer and the landing page render.
+
+Runs against the database in APP_DATABASE_URL and is deselected by default (perf marker).
+Every benchmark also has an absolute budget for its median, scaled by APP_BENCHMARK_BUDGET_SCALE
+on slow machines, so a gross regression fails even without a saved baseline.
+
+Record a baseline, then compare later runs against it and fail on a 25% slowdown:
+
+    uv run pytest -m perf tests/test_benchmarks.py --benchmark-save=baseline
+    uv run pytest -m perf tests/test_benchmarks.py --benchmark-compare --benchmark-compare-fail=median:25%
+
+Baselines are stored per machine under .benchmarks/, so compare only runs made on the same host.
+"""
+
+import asyncio
+import itertools
+import os
+from datetime import datetime, timedelta
+from typing import Any, Callable
+import pytest
+from nicegui.testing import User
+from app.content_cache import CONTENT_CACHE
+from app.database import get_session, reset_db
+from app.landing_service import LandingPageService, initialize_default_data
+from app.models import ContactSubmissionCreate, FooterContent, SiteConfiguration
+from app.page_view_buffer import PAGE_VIEW_BUFFER
+from app.rate_limiter import CONTACT_RATE_LIMITER
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.perf
+
+BUDGET_SCALE = float(os.environ.get("APP_BENCHMARK_BUDGET_SCALE", "1"))
+
+# Median budgets in milliseconds, several times the medians measured against a local database
+BUDGETS_MS = {
+    "cached_getter": 0.1,
+    "cold_getter": 20.0,
+    "page_view_counts": 20.0,
+    "contact_accepted": 30.0,
+    "contact_rate_limited": 0.5,
+    "contact_invalid": 0.5,
+    "page_view_single": 20.0,
+    "page_view_batch": 60.0,
+    "anonymize_ip": 0.01,
+    "validate_email": 0.01,
+    "render": 100.0,
+}
+
+GETTERS = {
+    "get_hero_section": LandingPageService.get_hero_section,
+    "get_services": LandingPageService.get_services,
+    "get_benefits": LandingPageService.get_benefits,
+    "get_cta_buttons": LandingPageService.get_cta_buttons,
+    "get_footer_content": LandingPageService.get_footer_content,
+    "get_content_snapshot": LandingPageService.get_content_snapshot,
+    "get_landing_view": LandingPageService.get_landing_view,
+    "get_site_config": lambda: LandingPageService.get_site_config("company_email"),
+}
+
+PAGE_VIEW_BATCH = 100
+
+
+@pytest.fixture
+def new_db():
+    """Default content plus the footer and the site configuration value the getters read"""
+    reset_db()
+    initialize_default_data()
+    with get_session() as session:
+        session.add(SiteConfiguration(config_key="company_email", config_value="info@example.com"))
+        session.add(FooterContent(company_name="SmartHome IT Solutions", copyright_text="© 2024"))
+        session.commit()
+    yield
+    PAGE_VIEW_BUFFER.clear()
+    reset_db()
+
+
+def check_budget(benchmark: Any, budget: str) -> None:
+    """Fail when the measured median exceeds its budget; no-op under --benchmark-disable"""
+    if benchmark.stats is None:
+        return
+    median_ms = benchmark.stats.stats.median * 1000
+    limit_ms = BUDGETS_MS[budget] * BUDGET_SCALE
+    assert median_ms <= limit_ms, f"{benchmark.name}: median {median_ms:.4f}ms over the {limit_ms:g}ms budget"
+
+
+def contact(index: int = 0) -> ContactSubmissionCreate:
+    return ContactSubmissionCreate(
+        name=f"Visitor {index}", email=f"visitor{index}@example.com", message="Please call me about smart lighting"
+    )
+
+
+class TestGetters:
+    """Benchmark the content getters with a warm and a cold content cache"""
+
+    @pytest.mark.benchmark(group="getters-cached")
+    @pytest.mark.parametrize("name", GETTERS)
+    def test_cached(self, benchmark, new_db, name):
+        getter = GETTERS[name]
+        getter()
+        assert benchmark(getter) is not None
+        check_budget(benchmark, "cached_getter")
+
+    @pytest.mark.benchmark(group="getters-cold")
+    @pytest.mark.parametrize("name", GETTERS)
+    def test_cold(self, benchmark, new_db, name):
+        result = benchmark.pedantic(GETTERS[name], setup=CONTENT_CACHE.invalidate, rounds=100, warmup_rounds=5)
+        assert result is not None
+        check_budget(benchmark, "cold_getter")
+
+    @pytest.mark.benchmark(group="getters-cold")
+    def test_page_view_counts(self, benchmark, new_db):
+        since = datetime.utcnow() - timedelta(days=1)
+        assert benchmark(LandingPageService.get_page_view_counts, since) == {}
+        check_budget(benchmark, "page_view_counts")
+
+
+class TestContactForm:
+    """Benchmark contact submissions that are stored, rate limited or rejected"""
+
+    @pytest.mark.benchmark(group="contact")
+    def test_accepted(self, benchmark, new_db):
+        # A new /24 per submission, so the rate limiter never rejects one
+        addresses = (f"10.{index // 256 % 256}.{index % 256}.1" for index in itertools.count())
+        submission = contact()
+
+        def submit():
+            return LandingPageService.submit_contact_form(submission, ip_address=next(addresses))
+
+        assert benchmark.pedantic(submit, rounds=200, warmup_rounds=5) is not None
+        check_budget(benchmark, "contact_accepted")
+
+    @pytest.mark.benchmark(group="contact")
+    def test_rate_limited(self, benchmark, new_db):
+        for _ in range(CONTACT_RATE_LIMITER.limit):
+            CONTACT_RATE_LIMITER.record(LandingPageService._anonymize_ip("192.168.1.10"))
+        assert benchmark(LandingPageService.submit_contact_form, contact(), ip_address="192.168.1.10") is None
+        check_budget(benchmark, "contact_rate_limited")
+
+    @pytest.mark.benchmark(group="contact")
+    def test_invalid(self, benchmark, new_db):
+        invalid = ContactSubmissionCreate(name="", email="not-an-email", message="")
+        assert benchmark(LandingPageService.submit_contact_form, invalid) is None
+        check_budget(benchmark, "contact_invalid")
+
+
+class TestPageViews:
+    """Benchmark page view logging written one row per flush against batches of PAGE_VIEW_BATCH"""
+
+    @pytest.mark.benchmark(group="page-views")
+    def test_single(self, benchmark, new_db):
+        def log_and_flush() -> int:
+            LandingPageService.log_page_view("/", ip_address="192.168.1.10", user_agent="bench")
+            return PAGE_VIEW_BUFFER.flush()
+
+        benchmark.pedantic(log_and_flush, rounds=200, warmup_rounds=5)
+        check_budget(benchmark, "page_view_single")
+
+    @pytest.mark.benchmark(group="page-views")
+    def test_batched(self, benchmark, new_db):
+        def log_batch_and_flush() -> int:
+            for _ in range(PAGE_VIEW_BATCH):
+                LandingPageService.log_page_view("/", ip_address="192.168.1.10", user_agent="bench")
+            return PAGE_VIEW_BUFFER.flush()
+
+        benchmark.extra_info["views_per_round"] = PAGE_VIEW_BATCH
+        benchmark.pedantic(log_batch_and_flush, rounds=50, warmup_rounds=2)
+        check_budget(benchmark, "page_view_batch")
+
+
+class TestHelpers:
+    """Microbenchmarks of the per-request helpers"""
+
+    @pytest.mark.benchmark(group="helpers")
+    @pytest.mark.parametrize("address", ["192.168.1.100", "2001:db8:85a3:0:0:8a2e:370:7334"])
+    def test_anonymize_ip(self, benchmark, address):
+        assert benchmark(LandingPageService._anonymize_ip, address) != address
+        check_budget(benchmark, "anonymize_ip")
+
+    @pytest.mark.benchmark(group="helpers")
+    @pytest.mark.parametrize("email", ["visitor@example.com", "not-an-email"])
+    def test_validate_email(self, benchmark, email):
+        assert benchmark(LandingPageService._validate_email, email) == ("@" in email)
+        check_budget(benchmark, "validate_email")
+
+
+async def benchmark_request(benchmark: Any, user: User, path: str, check: Callable[[str], bool]) -> None:
+    """Benchmark full requests made with the user's HTTP client.
+
+    pytest-benchmark only times synchronous callables, so the timing loop runs in a worker thread
+    and hands each request back to this event loop, which serves the app.
+    """
+    loop = asyncio.get_running_loop()
+
+    def get() -> str:
+        response = asyncio.run_coroutine_threadsafe(user.http_client.get(path), loop).result()
+        assert response.status_code == 200
+        return response.text
+
+    assert check(await asyncio.to_thread(benchmark.pedantic, get, rounds=100, warmup_rounds=5))
+
+
+@pytest.mark.benchmark(group="render")
+async def test_landing_page_render(benchmark, user: User):
+    """Benchmark: full render of / through the NiceGUI app, page builder and middleware included"""
+    await user.open("/")
+    await user.should_see("Smart Lighting Systems")
+    await benchmark_request(benchmark, user, "/", lambda html: "SmartHome" in html)
+    check_budget(benchmark, "render")
@@ -0,0 +1,172 @@
+import gzip
+from pathlib import Path
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import FileResponse, PlainTextResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+from app.compression import CompressedCache, CompressionMiddleware, brotli, choose_encoding, compress
+
+PAGE = "<html><body>" + "<p>Smart home</p>" * 200 + "</body></html>"
+
+
+@pytest.fixture
+def cache() -> CompressedCache:
+    return CompressedCache(max_bytes=1024 * 1024)
+
+
+@pytest.fixture
+def client(cache: CompressedCache, tmp_path: Path) -> TestClient:
+    api = FastAPI()
+    asset = tmp_path / "bundle.js"
+    asset.write_text("console.log('smart home');\n" * 10000)
+
+    @api.get("/page")
+    def page():
+        return Response(PAGE, media_type="text/html")
+
+    @api.get("/small")
+    def small():
+        return PlainTextResponse("ok")
+
+    @api.get("/image")
+    def image():
+        return Response(b"\x89PNG" + bytes(2000), media_type="image/png")
+
+    @api.get("/encoded")
+    def encoded():
+        return Response(gzip.compress(PAGE.encode()), media_type="text/html", headers={"Content-Encoding": "gzip"})
+
+    @api.get("/etag")
+    def etag():
+        return Response(PAGE, media_type="text/html", headers={"ETag": '"v1"'})
+
+    @api.get("/immutable")
+    def immutable():
+        return Response(PAGE, media_type="text/css", headers={"Cache-Control": "public, max-age=31536000, immutable"})
+
+    @api.get("/stream")
+    def stream():
+        return StreamingResponse((f"<p>row {i}</p>" for i in range(2000)), media_type="text/html")
+
+    @api.get("/bundle.js")
+    def bundle():
+        return FileResponse(asset, media_type="application/javascript")
+
+    api.add_middleware(CompressionMiddleware, minimum_size=500, cache=cache)
+    return TestClient(api)
+
+
+def gzip_get(client: TestClient, path: str, **kwargs):
+    return client.get(path, headers={"Accept-Encoding": "gzip"}, **kwargs)
+
+
+class TestChooseEncoding:
+    """Test Accept-Encoding negotiation"""
+
+    def test_prefers_brotli_when_available(self):
+        assert choose_encoding("gzip, deflate, br", brotli_available=True) == "br"
+        assert choose_encoding("gzip, deflate, br", brotli_available=False) == "gzip"
+
+    def test_quality_values(self):
+        assert choose_encoding("br;q=0, gzip;q=0.5", brotli_available=True) == "gzip"
+        assert choose_encoding("gzip;q=0", brotli_available=False) is None
+        assert choose_encoding("gzip;q=1.000, br;q=high", brotli_available=True) == "gzip"
+        assert choose_encoding("gzip;q=2", brotli_available=False) is None
+        assert choose_encoding("*", brotli_available=False) == "gzip"
+        assert choose_encoding("", brotli_available=True) is None
+        assert choose_encoding("identity", brotli_available=True) is None
+
+
+class TestCompressionMiddleware:
+    """Test which responses are compressed and how"""
+
+    def test_compresses_large_html(self, client):
+        response = gzip_get(client, "/page")
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert int(response.headers["content-length"]) < len(PAGE) / 10
+        assert response.text == PAGE
+
+    def test_skips_small_bodies(self, client):
+        response = gzip_get(client, "/small")
+        assert "content-encoding" not in response.headers
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.text == "ok"
+
+    def test_skips_types_outside_allowlist(self, client):
+        response = gzip_get(client, "/image")
+        assert "content-encoding" not in response.headers
+        assert "vary" not in response.headers
+
+    def test_skips_without_accept_encoding(self, client):
+        response = client.get("/page", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in response.headers
+        assert response.text == PAGE
+
+    def test_keeps_existing_encoding(self, client):
+        response = gzip_get(client, "/encoded")
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.text == PAGE
+
+    def test_head_passes_through(self, client):
+        response = client.head("/page", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in response.headers
+
+    def test_streams_responses_of_unknown_length(self, client, cache):
+        response = gzip_get(client, "/stream")
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        assert response.text == "".join(f"<p>row {i}</p>" for i in range(2000))
+        assert cache.stats().entries == 0
+
+    @pytest.mark.skipif(brotli is None, reason="brotli is not installed")
+    def test_brotli(self, client):
+        response = client.get("/page", headers={"Accept-Encoding": "br"})
+        assert response.headers["content-encoding"] == "br"
+        assert response.text == PAGE
+
+
+class TestPrecompressedCache:
+    """Test that cacheable responses are compressed once per encoding"""
+
+    def test_etag_responses_are_cached(self, client, cache):
+        first = gzip_get(client, "/etag")
+        second = gzip_get(client, "/etag")
+        assert first.content == second.content
+        assert first.headers["etag"] == 'W/"v1"'
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+
+    def test_immutable_responses_are_cached(self, client, cache):
+        gzip_get(client, "/immutable")
+        gzip_get(client, "/immutable")
+        assert cache.stats().hits == 1
+
+    def test_uncacheable_responses_are_not_stored(self, client, cache):
+        gzip_get(client, "/page")
+        assert cache.stats().entries == 0
+
+    def test_multi_chunk_file_is_buffered_and_cached(self, client, cache):
+        first = gzip_get(client, "/bundle.js")
+        second = gzip_get(client, "/bundle.js")
+        assert first.headers["content-encoding"] == "gzip"
+        assert int(first.headers["content-length"]) == len(gzip.compress(first.content))
+        assert second.text == first.text == "console.log('smart home');\n" * 10000
+        assert cache.stats().hits == 1
+
+    def test_size_bound_evicts_least_recently_used(self):
+        cache = CompressedCache(max_bytes=10)
+        cache.put(("/a", "gzip", "1"), b"12345")
+        cache.put(("/b", "gzip", "1"), b"12345")
+        assert cache.get(("/a", "gzip", "1")) == b"12345"
+        cache.put(("/c", "gzip", "1"), b"12345")
+
+        assert cache.get(("/b", "gzip", "1")) is None
+        assert cache.stats().size_bytes == 10
+        cache.put(("/big", "gzip", "1"), bytes(11))
+        assert cache.get(("/big", "gzip", "1")) is None
+
+    def test_compress_is_deterministic(self):
+        assert compress(PAGE.encode(), "gzip", 6, 5) == compress(PAGE.encode(), "gzip", 6, 5)
+        with pytest.raises(ValueError):
+            compress(b"", "deflate", 6, 5)
@@ -0,0 +1,168 @@
+import dataclasses
+import pytest
+from app.content_cache import ContentCache, LandingContentSnapshot
+from app.database import reset_db
+from app.landing_service import LandingPageService
+from app.models import HeroSectionCreate, ServiceCreate, BenefitCreate
+
+
+@pytest.fixture
+def new_db():
+    reset_db()
+    yield
+    reset_db()
+
+
+class TestContentCache:
+    """Unit tests for the versioned content cache"""
+
+    def test_loads_once_until_invalidated(self):
+        cache = ContentCache(ttl_seconds=60)
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return len(calls)
+
+        assert cache.get_or_load("landing", loader) == 1
+        assert cache.get_or_load("landing", loader) == 1
+        assert len(calls) == 1
+
+        cache.invalidate("landing")
+        assert cache.get_or_load("landing", loader) == 2
+
+    def test_ttl_expiry_reloads(self):
+        cache = ContentCache(ttl_seconds=0)
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return len(calls)
+
+        cache.get_or_load("landing", loader)
+        cache.get_or_load("landing", loader)
+        assert len(calls) == 2
+
+    def test_invalidate_bumps_only_its_namespace(self):
+        cache = ContentCache(ttl_seconds=60)
+        cache.get_or_load("landing", lambda: "content")
+        cache.get_or_load("site_config:phone", lambda: "555")
+
+        cache.invalidate("site_config")
+
+        assert cache.version("landing") == 0
+        assert cache.version("site_config") == 1
+        assert cache.get_or_load("landing", lambda: "reloaded") == "content"
+        assert cache.get_or_load("site_config:phone", lambda: "556") == "556"
+
+    def test_invalidate_all(self):
+        cache = ContentCache(ttl_seconds=60)
+        cache.get_or_load("landing", lambda: "content")
+        cache.get_or_load("site_config:phone", lambda: "555")
+
+        cache.invalidate()
+
+        assert cache.get_or_load("landing", lambda: "new content") == "new content"
+        assert cache.get_or_load("site_config:phone", lambda: "556") == "556"
+
+    def test_load_racing_invalidation_is_not_stored(self):
+        cache = ContentCache(ttl_seconds=60)
+
+        def stale_loader():
+            cache.invalidate("landing")  # content changes while the load is in flight
+            return "stale"
+
+        assert cache.get_or_load("landing", stale_loader) == "stale"
+        assert cache.get_or_load("landing", lambda: "fresh") == "fresh"
+
+    def test_none_values_are_cached(self):
+        cache = ContentCache(ttl_seconds=60)
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return None
+
+        assert cache.get_or_load("site_config:missing", loader) is None
+        assert cache.get_or_load("site_config:missing", loader) is None
+        assert len(calls) == 1
+
+
+class TestServiceSnapshotCaching:
+    """LandingPageService getters are served from the snapshot cache"""
+
+    def test_getters_share_one_load(self, new_db, statement_log):
+        LandingPageService.get_hero_section()
+        LandingPageService.get_services()
+        LandingPageService.get_benefits()
+        LandingPageService.get_cta_buttons()
+        LandingPageService.get_footer_content()
+        queries_after_first_render = len(statement_log)
+        assert queries_after_first_render > 0
+
+        LandingPageService.get_hero_section()
+        LandingPageService.get_services()
+        LandingPageService.get_benefits()
+        LandingPageService.get_cta_buttons()
+        LandingPageService.get_footer_content()
+        assert len(statement_log) == queries_after_first_render
+
+    def test_create_bumps_snapshot_version(self, new_db):
+        first = LandingPageService.get_content_snapshot()
+
+        LandingPageService.create_service(ServiceCreate(title="Service", description="Desc", display_order=1))
+        second = LandingPageService.get_content_snapshot()
+        assert second.version > first.version
+        assert [s.title for s in second.services] == ["Service"]
+
+        LandingPageService.create_benefit(BenefitCreate(title="Benefit", description="Desc"))
+        LandingPageService.create_hero_section(HeroSectionCreate(headline="Headline", description="Desc"))
+        third = LandingPageService.get_content_snapshot()
+        assert third.version > second.version
+        assert [b.title for b in third.benefits] == ["Benefit"]
+        assert third.hero is not None
+        assert third.hero.headline == "Headline"
+
+    def test_snapshot_is_frozen(self, new_db):
+        snapshot = LandingPageService.get_content_snapshot()
+        assert isinstance(snapshot, LandingContentSnapshot)
+        assert isinstance(snapshot.services, tuple)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            snapshot.hero = None  # type: ignore[misc]
+
+    def test_getters_return_independent_lists(self, new_db):
+        LandingPageService.create_service(ServiceCreate(title="Service", description="Desc"))
+        services = LandingPageService.get_services()
+        services.clear()
+        assert len(LandingPageService.get_services()) == 1
+
+    def test_getters_return_copies(self, new_db):
+        LandingPageService.create_service(ServiceCreate(title="Service", description="Desc"))
+        LandingPageService.create_hero_section(HeroSectionCreate(headline="Headline", description="Desc"))
+        hero = LandingPageService.get_hero_section()
+        assert hero is not None
+        hero.headline = "Changed"
+        LandingPageService.get_services()[0].title = "Changed"
+
+        snapshot = LandingPageService.get_content_snapshot()
+        assert snapshot.hero is not None and snapshot.hero.headline == "Headline"
+        assert snapshot.services[0].title == "Service"
+        returned = LandingPageService.get_hero_section()
+        assert returned is not None and returned.headline == "Headline"
+        assert LandingPageService.get_services()[0].title == "Service"
+
+    def test_reset_db_invalidates_cache(self, new_db):
+        LandingPageService.create_service(ServiceCreate(title="Service", description="Desc"))
+        assert len(LandingPageService.get_services()) == 1
+        version = LandingPageService.get_content_snapshot().version
+
+        reset_db()
+
+        assert LandingPageService.get_services() == []
+        assert LandingPageService.get_content_snapshot().version > version
+
+    def test_site_config_cached(self, new_db, statement_log):
+        assert LandingPageService.get_site_config("missing_key") is None
+        queries = len(statement_log)
+        assert LandingPageService.get_site_config("missing_key") is None
+        assert len(statement_log) == queries
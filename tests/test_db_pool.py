@@ -0,0 +1,105 @@
+import pytest
+from sqlalchemy import create_engine, exc, text
+from app.database import DATABASE_URL, ENGINE, ASYNC_ENGINE, pool_stats
+from app.db_pool import (
+    InstrumentedQueuePool,
+    InstrumentedAsyncAdaptedQueuePool,
+    PoolMetrics,
+    pool_options,
+    DB_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+)
+
+
+@pytest.fixture
+def small_engine():
+    engine = create_engine(DATABASE_URL, poolclass=InstrumentedQueuePool, pool_size=1, max_overflow=1, pool_timeout=0.1)
+    yield engine
+    engine.dispose()
+
+
+class TestPoolMetrics:
+    """Test the checkout wait histogram"""
+
+    def test_buckets_are_cumulative(self):
+        metrics = PoolMetrics(buckets=(0.01, 0.1))
+        for seconds in (0.001, 0.05, 0.05, 3.0):
+            metrics.record_wait(seconds)
+        stats = metrics.snapshot(InstrumentedQueuePool(lambda: None, pool_size=2))
+
+        assert stats.wait_buckets == ((0.01, 1), (0.1, 3), (float("inf"), 4))
+        assert stats.checkouts == 4
+        assert stats.wait_seconds_total == pytest.approx(3.101)
+        assert stats.wait_seconds_max == 3.0
+
+    def test_reset(self):
+        metrics = PoolMetrics()
+        metrics.record_wait(0.2)
+        metrics.record_failure()
+        metrics.reset()
+        stats = metrics.snapshot(InstrumentedQueuePool(lambda: None))
+        assert stats.checkouts == 0
+        assert stats.checkout_failures == 0
+
+
+class TestInstrumentedPool:
+    """Test live statistics of a real pool"""
+
+    def test_checked_out_and_overflow(self, small_engine):
+        first = small_engine.connect()
+        second = small_engine.connect()
+        stats = small_engine.pool.stats()
+        assert stats.size == 1
+        assert stats.max_overflow == 1
+        assert stats.checked_out == 2
+        assert stats.overflow == 1
+        assert stats.checkouts == 2
+
+        first.close()
+        second.close()
+        stats = small_engine.pool.stats()
+        assert stats.checked_out == 0
+        assert stats.checked_in == 1  # the overflow connection is closed on return
+
+    def test_checkout_timeout_counts_as_failure(self, small_engine):
+        held = [small_engine.connect(), small_engine.connect()]
+        with pytest.raises(exc.TimeoutError):
+            small_engine.connect()
+        for connection in held:
+            connection.close()
+
+        stats = small_engine.pool.stats()
+        assert stats.checkout_failures == 1
+        assert stats.checkouts == 2
+
+    def test_metrics_survive_dispose(self, small_engine):
+        with small_engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        metrics = small_engine.pool.metrics
+        small_engine.dispose()
+
+        assert small_engine.pool.metrics is metrics
+        assert small_engine.pool.stats().checkouts == 1
+
+
+class TestEngineConfiguration:
+    """Test that both application engines use the configured, instrumented pools"""
+
+    def test_engines_use_instrumented_pools(self):
+        assert isinstance(ENGINE.pool, InstrumentedQueuePool)
+        assert isinstance(ASYNC_ENGINE.sync_engine.pool, InstrumentedAsyncAdaptedQueuePool)
+        assert ENGINE.pool.size() == DB_POOL_SIZE
+        assert ENGINE.pool._max_overflow == DB_MAX_OVERFLOW
+        assert ENGINE.pool._pre_ping == pool_options()["pool_pre_ping"]
+
+    def test_pool_stats(self):
+        with ENGINE.connect():
+            assert pool_stats()["sync"].checked_out >= 1
+        assert set(pool_stats()) == {"sync", "async"}
+
+    async def test_async_checkouts_are_counted(self):
+        before = pool_stats()["async"].checkouts
+        async with ASYNC_ENGINE.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        assert pool_stats()["async"].checkouts == before + 1
+        await ASYNC_ENGINE.dispose()
@@ -0,0 +1,584 @@
+import asyncio
+import csv
+import io
+import json
+import threading
+import time
+import tracemalloc
+from logging import getLogger
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Set, cast
+import pytest
+from databricks.sdk import WorkspaceClient
+from databricks.sdk.errors import NotFound
+from databricks.sdk.service.sql import (
+    ColumnInfo,
+    ColumnInfoTypeName,
+    Disposition,
+    EndpointInfo,
+    ExternalLink,
+    Format,
+    ResultData,
+    ResultManifest,
+    ResultSchema,
+    ServiceError,
+    State,
+    StatementResponse,
+    StatementState,
+    StatementParameterListItem,
+    StatementStatus,
+)
+from app.dbrx import (
+    ColumnarResult,
+    DatabricksModel,
+    ResultStream,
+    StatementExecutor,
+    WarehouseResolver,
+    poll_delays,
+    warehouse_unavailable,
+)
+
+logger = getLogger(__name__)
+
+
+class FakeWarehouses:
+    """In-memory stand-in for WorkspaceClient.warehouses"""
+
+    def __init__(self, warehouses: Dict[str, State]) -> None:
+        self.warehouses = warehouses
+        self.list_calls = 0
+        self.listed = threading.Event()
+
+    def list(self) -> List[EndpointInfo]:
+        self.list_calls += 1
+        self.listed.set()
+        return [EndpointInfo(id=warehouse_id, state=state) for warehouse_id, state in self.warehouses.items()]
+
+
+class FakeStatementExecution:
+    """In-memory stand-in for WorkspaceClient.statement_execution answering every query with rows.
+
+    Statements listed in failures fail straight away, the others keep running for polls_to_finish
+    get_statement calls (forever if None). Results are split into chunks of chunk_rows rows, served
+    inline or, for EXTERNAL_LINKS, as links that open_link reads.
+    """
+
+    def __init__(self, warehouses: FakeWarehouses, rows: List[List[Optional[str]]], columns: List[str]) -> None:
+        self.warehouses = warehouses
+        self.rows = rows
+        self.columns = columns
+        self.column_types: Dict[str, ColumnInfoTypeName] = {}
+        self.chunk_rows: Optional[int] = None
+        self.polls_to_finish: Optional[int] = 0
+        self.submit_seconds = 0.0
+        self.failures: Dict[str, str] = {}
+        self.executed_on: List[str] = []
+        self.cancelled: List[str] = []
+        self.chunk_requests: List[int] = []
+        self.opened_links: List[str] = []
+        self.parameters: List[Optional[List[StatementParameterListItem]]] = []
+        self.threads: Set[int] = set()
+        self._statements: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def execute_statement(
+        self,
+        statement: str,
+        warehouse_id: str,
+        disposition: Disposition = Disposition.INLINE,
+        format: Format = Format.JSON_ARRAY,
+        **kwargs,
+    ) -> StatementResponse:
+        time.sleep(self.submit_seconds)
+        with self._lock:
+            self.threads.add(threading.get_ident())
+            self.executed_on.append(warehouse_id)
+            self.parameters.append(kwargs.get("parameters"))
+            if warehouse_id not in self.warehouses.warehouses:
+                raise NotFound(f"Warehouse {warehouse_id} does not exist")
+            statement_id = f"stmt-{len(self.executed_on)}"
+            self._statements[statement_id] = {
+                "statement": statement,
+                "polls": self.polls_to_finish,
+                "disposition": disposition,
+                "format": format,
+            }
+        return self.get_statement(statement_id, poll=False)
+
+    def get_statement(self, statement_id: str, poll: bool = True) -> StatementResponse:
+        with self._lock:
+            self.threads.add(threading.get_ident())
+            state = self._statements[statement_id]
+            if poll and state["polls"]:
+                state["polls"] -= 1
+            polls = state["polls"]
+        if statement_id in self.cancelled:
+            return response(statement_id, StatementState.CANCELED)
+        if state["statement"] in self.failures:
+            error = ServiceError(message=self.failures[state["statement"]])
+            return response(statement_id, StatementState.FAILED, error=error)
+        if polls is None or polls > 0:
+            return response(statement_id, StatementState.RUNNING)
+        manifest = ResultManifest(
+            schema=ResultSchema(
+                columns=[ColumnInfo(name=name, type_name=self.column_types.get(name)) for name in self.columns]
+            ),
+            format=state["format"],
+            total_row_count=len(self.rows),
+            total_chunk_count=len(self._chunks()),
+        )
+        return response(statement_id, StatementState.SUCCEEDED, manifest=manifest, result=self._chunk(statement_id, 0))
+
+    def get_statement_result_chunk_n(self, statement_id: str, chunk_index: int) -> ResultData:
+        self.chunk_requests.append(chunk_index)
+        chunk = self._chunk(statement_id, chunk_index)
+        assert chunk is not None, f"{statement_id} has no chunk {chunk_index}"
+        return chunk
+
+    def cancel_execution(self, statement_id: str) -> None:
+        with self._lock:
+            self.cancelled.append(statement_id)
+
+    def open_link(self, link: ExternalLink) -> BinaryIO:
+        """Body of an external link: the chunk's rows as a JSON array, or as CSV the way the service writes it,
+        with NULL as "null" and a header row in the first chunk only"""
+        url = link.external_link
+        assert url is not None
+        self.opened_links.append(url)
+        statement_id, chunk_index = url.removeprefix("https://results/").split("/")
+        rows = self._chunks()[int(chunk_index)]
+        if self._statements[statement_id]["format"] == Format.CSV:
+            text = io.StringIO()
+            writer = csv.writer(text)
+            if chunk_index == "0":
+                writer.writerow(self.columns)
+            writer.writerows([["null" if value is None else value for value in row] for row in rows])
+            return io.BytesIO(text.getvalue().encode())
+        return io.BytesIO(json.dumps(rows).encode())
+
+    def _chunks(self) -> List[List[List[Optional[str]]]]:
+        size = self.chunk_rows or max(len(self.rows), 1)
+        return [self.rows[start : start + size] for start in range(0, len(self.rows), size)]
+
+    def _chunk(self, statement_id: str, chunk_index: int) -> Optional[ResultData]:
+        chunks = self._chunks()
+        if not chunks:
+            return None
+        next_index = chunk_index + 1 if chunk_index + 1 < len(chunks) else None
+        if self._statements[statement_id]["disposition"] == Disposition.EXTERNAL_LINKS:
+            url = f"https://results/{statement_id}/{chunk_index}"
+            link = ExternalLink(external_link=url, chunk_index=chunk_index, next_chunk_index=next_index)
+            return ResultData(chunk_index=chunk_index, external_links=[link])
+        # inline JSON carries NULL as null, which the SDK's List[List[str]] leaves out
+        data_array = cast(List[List[str]], chunks[chunk_index])
+        return ResultData(chunk_index=chunk_index, data_array=data_array, next_chunk_index=next_index)
+
+
+def response(statement_id: str, state: StatementState, error: Optional[ServiceError] = None, **kwargs):
+    return StatementResponse(statement_id=statement_id, status=StatementStatus(state=state, error=error), **kwargs)
+
+
+class FakeWorkspace:
+    def __init__(self, warehouses: Dict[str, State], rows: Optional[List[List[Optional[str]]]] = None) -> None:
+        self.warehouses = FakeWarehouses(warehouses)
+        self.statement_execution = FakeStatementExecution(self.warehouses, rows or [["1", "a"]], ["id", "name"])
+
+
+def client_factory(workspace: FakeWorkspace) -> Callable[[], WorkspaceClient]:
+    """The fake in place of the WorkspaceClient factory the resolver and executor take"""
+    return lambda: cast(WorkspaceClient, workspace)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestWarehouseResolver:
+    """Test warehouse selection and caching"""
+
+    def test_prefers_running_and_lists_once(self):
+        workspace = FakeWorkspace({"stopped": State.STOPPED, "running": State.RUNNING})
+        resolver = WarehouseResolver(client_factory(workspace))
+        assert resolver.warehouse_id() == "running"
+        assert resolver.warehouse_id() == "running"
+        assert workspace.warehouses.list_calls == 1
+
+    def test_falls_back_to_first_listed(self):
+        workspace = FakeWorkspace({"first": State.STOPPED, "second": State.STOPPED})
+        assert WarehouseResolver(client_factory(workspace)).warehouse_id() == "first"
+        assert workspace.warehouses.list_calls == 1
+
+    def test_no_warehouse(self):
+        with pytest.raises(RuntimeError, match="No SQL warehouse"):
+            WarehouseResolver(client_factory(FakeWorkspace({}))).warehouse_id()
+
+    def test_stale_choice_refreshed_in_background(self):
+        workspace = FakeWorkspace({"a": State.RUNNING})
+        clock = FakeClock()
+        resolver = WarehouseResolver(client_factory(workspace), ttl_seconds=60, clock=clock)
+        assert resolver.warehouse_id() == "a"
+
+        workspace.warehouses.warehouses = {"a": State.STOPPED, "b": State.RUNNING}
+        workspace.warehouses.listed.clear()
+        clock.now = 61
+        assert resolver.warehouse_id() == "a"  # served stale while the refresh runs
+        assert workspace.warehouses.listed.wait(5)
+        for _ in range(100):
+            if resolver.warehouse_id() == "b":
+                break
+            time.sleep(0.01)
+        assert resolver.warehouse_id() == "b"
+        assert workspace.warehouses.list_calls == 2
+
+    def test_invalidate_only_matching(self):
+        workspace = FakeWorkspace({"a": State.RUNNING})
+        resolver = WarehouseResolver(client_factory(workspace))
+        resolver.warehouse_id()
+        resolver.invalidate("other")
+        resolver.warehouse_id()
+        assert workspace.warehouses.list_calls == 1
+        resolver.invalidate("a")
+        resolver.warehouse_id()
+        assert workspace.warehouses.list_calls == 2
+
+
+class TestStatementExecutor:
+    """Test query execution against the fake workspace"""
+
+    def test_client_created_once(self):
+        created: List[FakeWorkspace] = []
+
+        def factory() -> WorkspaceClient:
+            created.append(FakeWorkspace({"a": State.RUNNING}))
+            return cast(WorkspaceClient, created[-1])
+
+        executor = StatementExecutor(factory)
+        assert executor.execute("SELECT 1") == [{"id": "1", "name": "a"}]
+        assert executor.execute("SELECT 2") == [{"id": "1", "name": "a"}]
+        assert len(created) == 1
+        assert created[0].warehouses.list_calls == 1
+
+    async def test_named_parameters(self):
+        workspace = FakeWorkspace({"a": State.RUNNING})
+        executor = StatementExecutor(client_factory(workspace))
+        executor.execute("SELECT * FROM t WHERE id = :id AND name = :name", parameters={"id": 7, "name": None})
+        executor.execute("SELECT 1")
+        await executor.aexecute("SELECT :flag", parameters={"flag": True})
+        assert workspace.statement_execution.parameters == [
+            [StatementParameterListItem(name="id", value="7"), StatementParameterListItem(name="name")],
+            None,
+            [StatementParameterListItem(name="flag", value="True")],
+        ]
+
+    def test_retries_on_missing_warehouse(self):
+        workspace = FakeWorkspace({"a": State.RUNNING})
+        executor = StatementExecutor(client_factory(workspace))
+        executor.execute("SELECT 1")
+
+        workspace.warehouses.warehouses = {"b": State.RUNNING}
+        assert executor.execute("SELECT 1") == [{"id": "1", "name": "a"}]
+        assert workspace.statement_execution.executed_on == ["a", "a", "b"]
+        assert workspace.warehouses.list_calls == 2
+
+    def test_failed_statement_raises(self):
+        workspace = FakeWorkspace({"a": State.RUNNING})
+        workspace.statement_execution.failures["SELECT * FROM t"] = "Table not found: t"
+        with pytest.raises(RuntimeError, match="Table not found"):
+            StatementExecutor(client_factory(workspace)).execute("SELECT * FROM t")
+
+    def test_warehouse_unavailable(self):
+        assert warehouse_unavailable(NotFound("gone"))
+        assert warehouse_unavailable(RuntimeError("Query failed - Warehouse abc is stopped"))
+        assert not warehouse_unavailable(RuntimeError("Table not found: t"))
+
+
+@pytest.fixture
+def workspace():
+    return FakeWorkspace({"a": State.RUNNING})
+
+
+@pytest.fixture
+def executor(workspace):
+    return StatementExecutor(
+        client_factory(workspace),
+        poll_interval=0.001,
+        max_poll_interval=0.01,
+        open_link=workspace.statement_execution.open_link,
+    )
+
+
+async def wait_for(condition, timeout: float = 5.0) -> None:
+    async with asyncio.timeout(timeout):
+        while not condition():
+            await asyncio.sleep(0.005)
+
+
+class TestPolling:
+    """Test statements that are still running after the submit wait"""
+
+    def test_sync_execute_polls_until_done(self, workspace, executor):
+        workspace.statement_execution.polls_to_finish = 3
+        assert executor.execute("SELECT 1") == [{"id": "1", "name": "a"}]
+
+    def test_sync_deadline_cancels(self, workspace, executor):
+        workspace.statement_execution.polls_to_finish = None
+        with pytest.raises(TimeoutError, match="within 0.05s"):
+            executor.execute("SELECT 1", timeout=0.05)
+        assert workspace.statement_execution.cancelled == ["stmt-1"]
+
+    def test_poll_delays_back_off(self):
+        delays = poll_delays(0.25, 1.0)
+        assert [next(delays) for _ in range(5)] == [0.25, 0.5, 1.0, 1.0, 1.0]
+
+
+class TestAsyncExecution:
+    """Test the async API against the fake workspace"""
+
+    async def test_runs_off_the_event_loop(self, workspace, executor):
+        workspace.statement_execution.polls_to_finish = 2
+        assert await executor.aexecute("SELECT 1") == [{"id": "1", "name": "a"}]
+        assert threading.get_ident() not in workspace.statement_execution.threads
+
+    async def test_deadline_cancels_statement(self, workspace, executor):
+        workspace.statement_execution.polls_to_finish = None
+        with pytest.raises(TimeoutError, match="within 0.05s"):
+            await executor.aexecute("SELECT 1", timeout=0.05)
+        await wait_for(lambda: workspace.statement_execution.cancelled == ["stmt-1"])
+
+    async def test_task_cancellation_cancels_statement(self, workspace, executor):
+        workspace.statement_execution.polls_to_finish = None
+        task = asyncio.create_task(executor.aexecute("SELECT 1"))
+        await wait_for(lambda: workspace.statement_execution.executed_on)
+        await asyncio.sleep(0.02)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await wait_for(lambda: workspace.statement_execution.cancelled == ["stmt-1"])
+
+    async def test_cancelled_while_submitting(self, workspace, executor):
+        workspace.statement_execution.polls_to_finish = None
+        workspace.statement_execution.submit_seconds = 0.1
+        task = asyncio.create_task(executor.aexecute("SELECT 1"))
+        await asyncio.sleep(0.02)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await wait_for(lambda: workspace.statement_execution.cancelled == ["stmt-1"])
+
+    async def test_failed_statement_raises(self, workspace, executor):
+        workspace.statement_execution.polls_to_finish = 1
+        workspace.statement_execution.failures["SELECT * FROM t"] = "Table not found: t"
+        with pytest.raises(RuntimeError, match="Table not found"):
+            await executor.aexecute("SELECT * FROM t")
+
+    async def test_many_queries_together(self, workspace, executor):
+        workspace.statement_execution.polls_to_finish = 3
+        results = await executor.aexecute_many([f"SELECT {index}" for index in range(20)])
+        assert results == [[{"id": "1", "name": "a"}]] * 20
+        assert len(workspace.statement_execution.executed_on) == 20
+
+    async def test_one_failure_cancels_the_rest(self, workspace, executor):
+        workspace.statement_execution.polls_to_finish = None
+        workspace.statement_execution.failures["SELECT broken"] = "Syntax error"
+        queries = ["SELECT 1", "SELECT 2", "SELECT broken"]
+        with pytest.raises(RuntimeError, match="Syntax error"):
+            await executor.aexecute_many(queries)
+        await wait_for(lambda: len(workspace.statement_execution.cancelled) == 2)
+
+
+@pytest.fixture
+def large_result(workspace):
+    workspace.statement_execution.rows = [[str(index), f"row {index}"] for index in range(10)]
+    workspace.statement_execution.chunk_rows = 4
+    return workspace.statement_execution
+
+
+class TestResultStream:
+    """Test chunked result retrieval"""
+
+    def test_execute_reads_every_chunk(self, executor, large_result):
+        rows = executor.execute("SELECT *")
+        assert [row["id"] for row in rows] == [str(index) for index in range(10)]
+        assert large_result.chunk_requests == [1, 2]
+
+    def test_rows_are_tuples_with_shared_columns(self, executor, large_result):
+        result = executor.stream("SELECT *")
+        assert result.columns == ("id", "name")
+        assert result.total_rows == 10
+        assert next(iter(result)) == ("0", "row 0")
+
+    def test_chunks_fetched_lazily(self, executor, large_result):
+        rows = iter(executor.stream("SELECT *"))
+        for _ in range(4):
+            next(rows)
+        assert large_result.chunk_requests == []
+        next(rows)
+        assert large_result.chunk_requests == [1]
+
+    def test_batches(self, executor, large_result):
+        result = executor.stream("SELECT *")
+        assert [len(batch) for batch in result.batches()] == [4, 4, 2]
+        assert [len(batch) for batch in result.batches(3)] == [3, 1, 3, 1, 2]
+        assert large_result.chunk_requests == [1, 2, 0, 1, 2]  # the first chunk is released once read
+
+    def test_bounded_memory_reads_csv_links(self, executor, large_result):
+        result = executor.stream("SELECT *", bounded_memory=True)
+        assert result.format == Format.CSV
+        rows = iter(result)
+        assert next(rows) == ("0", "row 0")  # not the header row
+        assert large_result.opened_links == ["https://results/stmt-1/0"]
+        assert len(list(rows)) == 9
+        assert len(large_result.opened_links) == 3
+
+    def test_csv_links_read_null(self, executor, large_result):
+        large_result.rows[0] = ["0", None]
+        large_result.rows[5] = [None, "null"]
+        rows = list(executor.stream("SELECT *", bounded_memory=True))
+        assert rows[0] == ("0", None)
+        assert rows[5] == (None, None)  # CSV writes NULL and the string "null" alike
+
+    def test_json_links(self, workspace, large_result):
+        response = workspace.statement_execution.execute_statement(
+            "SELECT *", "a", disposition=Disposition.EXTERNAL_LINKS, format=Format.JSON_ARRAY
+        )
+        result = ResultStream(workspace.statement_execution, response, large_result.open_link)
+        assert len(list(result)) == 10
+
+    def test_empty_result(self, executor, workspace):
+        workspace.statement_execution.rows = []
+        assert executor.execute("SELECT * FROM empty") == []
+
+    async def test_async_stream(self, executor, large_result):
+        result = await executor.astream("SELECT *", bounded_memory=True)
+        assert len(await asyncio.to_thread(list, result)) == 10
+        assert len(await executor.aexecute("SELECT *")) == 10
+
+
+class Device(DatabricksModel):
+    __catalog__ = "main"
+    __schema__ = "iot"
+    __table__ = "devices"
+
+    id: Optional[int]
+    temperature: float
+    online: bool
+    name: Optional[str]
+
+
+@pytest.fixture
+def typed_result(workspace):
+    statement_execution = workspace.statement_execution
+    statement_execution.columns = ["id", "temperature", "online", "name"]
+    statement_execution.column_types = {
+        "id": ColumnInfoTypeName.LONG,
+        "temperature": ColumnInfoTypeName.DOUBLE,
+        "online": ColumnInfoTypeName.BOOLEAN,
+        "name": ColumnInfoTypeName.STRING,
+    }
+    statement_execution.rows = [
+        ["1", "21.5", "true", "hall"],
+        [None, "19.0", "false", None],
+        ["3", "-2.25", "true", "roof"],
+    ]
+    statement_execution.chunk_rows = 2
+    return statement_execution
+
+
+class TestColumnar:
+    """Test typed column results"""
+
+    def test_typed_columns(self, executor, typed_result):
+        result = executor.columnar("SELECT * FROM main.iot.devices")
+        assert list(result) == ["id", "temperature", "online", "name"]
+        assert result.num_rows == 3
+        assert result["id"].values.typecode == "q"
+        assert list(result["id"]) == [1, None, 3]
+        assert result["id"].null_count == 1
+        assert list(result["temperature"].values) == [21.5, 19.0, -2.25]
+        assert list(result["online"]) == [True, False, True]
+        assert list(result["name"]) == ["hall", None, "roof"]
+        assert next(result.rows()) == (1, 21.5, True, "hall")
+
+    def test_csv_nulls(self, executor, typed_result):
+        typed_result.rows[1] = [None, None, None, None]
+        result = executor.columnar("SELECT * FROM main.iot.devices", bounded_memory=True)
+        assert result.num_rows == 3
+        assert list(result["id"]) == [1, None, 3]
+        assert list(result["temperature"]) == [21.5, None, -2.25]
+        assert list(result["online"]) == [True, None, True]
+        assert list(result["name"]) == ["hall", None, "roof"]
+
+    def test_from_csv_stream(self, workspace, typed_result):
+        response = workspace.statement_execution.execute_statement(
+            "SELECT *", "a", disposition=Disposition.EXTERNAL_LINKS, format=Format.CSV
+        )
+        assert response.result is not None and response.result.external_links
+        body = typed_result.open_link(response.result.external_links[0]).read().decode()
+        assert body.splitlines()[:2] == ["id,temperature,online,name", "1,21.5,true,hall"]
+        result = ColumnarResult.from_stream(
+            ResultStream(workspace.statement_execution, response, typed_result.open_link)
+        )
+        assert result.num_rows == 3
+        assert list(result["id"]) == [1, None, 3]
+        assert list(result["name"]) == ["hall", None, "roof"]
+        assert next(result.rows()) == (1, 21.5, True, "hall")
+
+    def test_models_on_demand(self, executor, typed_result):
+        devices = executor.columnar("SELECT * FROM main.iot.devices").to_models(Device)
+        assert devices[0] == Device(id=1, temperature=21.5, online=True, name="hall")
+        assert devices[1].id is None
+
+    def test_empty(self, executor, typed_result):
+        typed_result.rows = []
+        result = executor.columnar("SELECT * FROM main.iot.devices")
+        assert result.num_rows == 0
+        assert result.to_models(Device) == []
+
+    async def test_async(self, executor, typed_result):
+        result = await executor.acolumnar("SELECT * FROM main.iot.devices")
+        assert isinstance(result, ColumnarResult)
+        assert list(result["temperature"]) == [21.5, 19.0, -2.25]
+
+
+@pytest.mark.perf
+def test_columnar_versus_dict_rows(executor, workspace):
+    """Measurement: memory held and time taken by 200k rows as dicts and as typed columns"""
+    statement_execution = workspace.statement_execution
+    statement_execution.columns = ["id", "temperature", "humidity", "online"]
+    statement_execution.column_types = {
+        "id": ColumnInfoTypeName.LONG,
+        "temperature": ColumnInfoTypeName.DOUBLE,
+        "humidity": ColumnInfoTypeName.FLOAT,
+        "online": ColumnInfoTypeName.BOOLEAN,
+    }
+    statement_execution.rows = [
+        [str(index), f"{index % 40}.5", f"{index % 100}.25", "true" if index % 2 else "false"]
+        for index in range(200_000)
+    ]
+    statement_execution.chunk_rows = 20_000
+
+    def measure(load):
+        tracemalloc.start()
+        try:
+            start = time.perf_counter()
+            result = load()
+            elapsed = time.perf_counter() - start
+            retained = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+        return result, retained, elapsed
+
+    rows, dict_bytes, dict_seconds = measure(lambda: executor.execute("SELECT *"))
+    del rows
+    columns, columnar_bytes, columnar_seconds = measure(lambda: executor.columnar("SELECT *"))
+    assert columns.num_rows == 200_000
+    summary = (
+        f"dicts: {dict_bytes / 2**20:.1f} MiB in {dict_seconds:.2f}s, "
+        f"columns: {columnar_bytes / 2**20:.1f} MiB in {columnar_seconds:.2f}s, "
+        f"x{dict_bytes / columnar_bytes:.1f} less memory"
+    )
+    logger.info(summary)
+    assert columnar_bytes * 5 < dict_bytes, summary
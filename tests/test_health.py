@@ -0,0 +1,137 @@
+import asyncio
+import time
+from sqlalchemy import create_engine
+from app.database import ENGINE
+from app.db_pool import PoolStats
+from app.health import (
+    FAIL,
+    PASS,
+    WARN,
+    HealthChecker,
+    HealthProbe,
+    database_check,
+    pool_check,
+    queue_check,
+)
+from app.models import PageView
+from app.page_view_buffer import PageViewBuffer
+
+
+def make_pool_stats(checked_out: int, size: int = 5, max_overflow: int = 5) -> PoolStats:
+    return PoolStats(
+        size=size,
+        max_overflow=max_overflow,
+        checked_in=0,
+        checked_out=checked_out,
+        overflow=0,
+        checkouts=0,
+        checkout_failures=0,
+        wait_seconds_total=0.0,
+        wait_seconds_max=0.0,
+        wait_buckets=((float("inf"), 0),),
+    )
+
+
+def constant(status: str):
+    return lambda: (status, status)
+
+
+class TestProbes:
+    """Test the individual readiness checks"""
+
+    def test_database_reachable(self):
+        assert database_check(ENGINE)()[0] == PASS
+
+    def test_database_check_bypasses_saturated_pool(self):
+        engine = create_engine(ENGINE.url, pool_size=1, max_overflow=0, pool_timeout=30)
+        with engine.connect():
+            start = time.perf_counter()
+            assert database_check(engine)()[0] == PASS
+            assert time.perf_counter() - start < 5
+        engine.dispose()
+
+    async def test_database_unreachable_fails(self):
+        engine = create_engine("postgresql://postgres:@/postgres?host=/nonexistent")
+        checker = HealthChecker([HealthProbe("database", database_check(engine), 1000)])
+        report = await checker.check()
+        assert report.status == FAIL and not report.ready
+        assert report.checks[0].detail == "OperationalError"
+        engine.dispose()
+
+    def test_pool_saturation(self):
+        assert pool_check(lambda: {"sync": make_pool_stats(2)})()[0] == PASS
+        assert pool_check(lambda: {"sync": make_pool_stats(8)})()[0] == WARN
+        status, detail = pool_check(lambda: {"sync": make_pool_stats(2), "async": make_pool_stats(10)})()
+        assert status == FAIL
+        assert detail == "sync 2/10 checked out, async 10/10 checked out"
+
+    def test_queue_depth(self):
+        buffer = PageViewBuffer(max_size=4, batch_size=100, flush_interval=60)
+        check = queue_check(buffer)
+        assert check() == (PASS, "0/4 page views pending")
+        buffer.submit(PageView(page_path="/"))
+        buffer.submit(PageView(page_path="/"))
+        assert check()[0] == WARN
+        buffer.clear()
+        buffer.stop()
+
+
+class TestHealthChecker:
+    """Test probe aggregation, latency budgets and caching"""
+
+    async def test_worst_status_wins(self):
+        report = await HealthChecker([HealthProbe("a", constant(PASS), 1000)]).check()
+        assert report.status == PASS and report.ready
+
+        probes = [HealthProbe("a", constant(PASS), 1000), HealthProbe("b", constant(WARN), 1000)]
+        report = await HealthChecker(probes).check()
+        assert report.status == WARN and report.ready
+        assert set(report.as_dict()["checks"]) == {"a", "b"}
+
+    async def test_reports_latency_and_budget(self):
+        def slow():
+            time.sleep(0.05)
+            return PASS, "ok"
+
+        report = await HealthChecker([HealthProbe("slow", slow, 10)]).check()
+        result = report.checks[0]
+        assert result.latency_ms >= 50
+        assert result.status == WARN
+        assert "exceeds the 10ms budget" in result.detail
+
+    async def test_timeout_fails(self):
+        def hang():
+            time.sleep(0.5)
+            return PASS, ""
+
+        checker = HealthChecker([HealthProbe("hang", hang, 1000)], timeout=0.05)
+        report = await checker.check()
+        assert report.checks[0].status == FAIL
+        assert report.checks[0].detail == "timed out after 0.05s"
+
+    async def test_exception_fails(self):
+        def broken():
+            raise RuntimeError("boom")
+
+        report = await HealthChecker([HealthProbe("broken", broken, 1000)]).check()
+        assert report.status == FAIL
+        assert report.checks[0].detail == "RuntimeError"
+
+    async def test_cached_and_single_flight(self):
+        calls = []
+
+        def counted():
+            calls.append(1)
+            time.sleep(0.02)
+            return PASS, ""
+
+        checker = HealthChecker([HealthProbe("counted", counted, 1000)], ttl_seconds=60)
+        reports = await asyncio.gather(*(checker.check() for _ in range(10)))
+        assert len(calls) == 1
+        assert all(report is reports[0] for report in reports)
+        await checker.check()
+        assert len(calls) == 1
+
+        checker.clear()
+        await checker.check()
+        assert len(calls) == 2
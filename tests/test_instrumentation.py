@@ -0,0 +1,183 @@
+import logging
+import time
+import pytest
+from app.instrumentation import SERVICE_INSTRUMENTATION, ServiceInstrumentation, count_rows
+from app.landing_service import LandingPageService
+from app.metrics import Histogram, MetricsRegistry
+
+logger = logging.getLogger(__name__)
+
+
+def make_service(instrumentation: ServiceInstrumentation, histogram: Histogram) -> type:
+    @instrumentation.instrument(histogram)
+    class Service:
+        @staticmethod
+        def items(count: int) -> list:
+            return list(range(count))
+
+        @staticmethod
+        async def aitems(count: int) -> list:
+            return list(range(count))
+
+        @staticmethod
+        def nested(count: int) -> list:
+            return Service.items(count)
+
+        @staticmethod
+        async def anested(count: int) -> list:
+            return await Service.aitems(count)
+
+        @staticmethod
+        def sleepy(seconds: float) -> None:
+            time.sleep(seconds)
+
+        @staticmethod
+        def swallowed() -> None:
+            try:
+                raise RuntimeError("boom")
+            except Exception as e:
+                logger.error(f"Error in swallowed: {e}")
+                return None
+
+        @staticmethod
+        def raises() -> None:
+            raise RuntimeError("boom")
+
+        @staticmethod
+        def _helper() -> int:
+            return 1
+
+    return Service
+
+
+@pytest.fixture
+def histogram():
+    return Histogram("calls_seconds", "Calls", ("method",))
+
+
+class TestDisabled:
+    """Test the always-on duration histogram"""
+
+    async def test_only_durations_recorded(self, histogram):
+        instrumentation = ServiceInstrumentation(enabled=False)
+        service = make_service(instrumentation, histogram)
+        assert service.items(3) == [0, 1, 2]
+        assert await service.aitems(2) == [0, 1]
+        assert service._helper() == 1
+        assert service.items.__name__ == "items"
+        assert instrumentation.snapshot() == {}
+
+        registry = MetricsRegistry()
+        registry.metric(histogram)
+        text = registry.render()
+        assert 'calls_seconds_count{method="items"} 1\n' in text
+        assert 'calls_seconds_count{method="aitems"} 1\n' in text
+        assert "_helper" not in text
+
+
+class TestEnabled:
+    """Test the detailed per-method statistics"""
+
+    async def test_calls_and_rows(self, histogram):
+        instrumentation = ServiceInstrumentation(enabled=True)
+        service = make_service(instrumentation, histogram)
+        service.items(3)
+        service.items(4)
+        await service.aitems(5)
+
+        stats = instrumentation.snapshot()
+        assert stats["Service.items"].calls == 2
+        assert stats["Service.items"].rows == 7
+        assert stats["Service.aitems"].rows == 5
+        assert stats["Service.items"].p50_ms <= stats["Service.items"].max_ms
+
+    async def test_nested_calls_recorded_once(self, histogram):
+        instrumentation = ServiceInstrumentation(enabled=True)
+        service = make_service(instrumentation, histogram)
+        assert service.nested(3) == [0, 1, 2]
+        assert await service.anested(2) == [0, 1]
+        service.items(1)
+
+        stats = instrumentation.snapshot()
+        assert set(stats) == {"Service.nested", "Service.anested", "Service.items"}
+        assert stats["Service.items"].calls == 1
+        registry = MetricsRegistry()
+        registry.metric(histogram)
+        text = registry.render()
+        assert 'calls_seconds_count{method="items"} 1\n' in text
+        assert 'calls_seconds_count{method="aitems"} 0\n' in text
+
+    def test_errors_logged_or_raised(self, histogram):
+        instrumentation = ServiceInstrumentation(enabled=True)
+        service = make_service(instrumentation, histogram)
+        service.swallowed()
+        with pytest.raises(RuntimeError):
+            service.raises()
+        stats = instrumentation.snapshot()
+        assert stats["Service.swallowed"].errors == 1
+        assert stats["Service.raises"].errors == 1
+
+    def test_slow_calls(self, histogram, caplog):
+        instrumentation = ServiceInstrumentation(enabled=True, slow_call_ms=20)
+        service = make_service(instrumentation, histogram)
+        service.sleepy(0.0)
+        with caplog.at_level(logging.WARNING, logger="app.instrumentation"):
+            service.sleepy(0.03)
+        stats = instrumentation.snapshot()["Service.sleepy"]
+        assert stats.calls == 2 and stats.slow_calls == 1
+        assert stats.max_ms >= 30
+        assert "Slow call Service.sleepy took" in caplog.text
+
+    def test_percentiles_follow_recent_calls(self, histogram):
+        instrumentation = ServiceInstrumentation(enabled=True, max_samples=10)
+        service = make_service(instrumentation, histogram)
+        for _ in range(20):
+            service.items(1)
+        stats = instrumentation.snapshot()["Service.items"]
+        assert stats.calls == 20
+        assert stats.p50_ms <= stats.p95_ms <= stats.p99_ms <= stats.max_ms
+
+    def test_report_and_reset(self, histogram):
+        instrumentation = ServiceInstrumentation(enabled=True)
+        service = make_service(instrumentation, histogram)
+        service.items(1)
+        service.sleepy(0.01)
+        report = instrumentation.report(limit=1)
+        assert report.splitlines()[1].startswith("Service.sleepy")
+        assert len(report.splitlines()) == 2
+        with pytest.raises(ValueError):
+            instrumentation.report(sort_by="name")
+
+        instrumentation.reset()
+        assert instrumentation.snapshot() == {}
+
+    def test_toggle_at_runtime(self, histogram):
+        instrumentation = ServiceInstrumentation(enabled=False)
+        service = make_service(instrumentation, histogram)
+        service.items(1)
+        instrumentation.enable()
+        service.items(1)
+        instrumentation.disable()
+        service.items(1)
+        assert instrumentation.snapshot()["Service.items"].calls == 1
+
+
+class TestLandingService:
+    """Test that LandingPageService is instrumented"""
+
+    def test_service_methods_recorded(self):
+        SERVICE_INSTRUMENTATION.enable()
+        try:
+            SERVICE_INSTRUMENTATION.reset()
+            LandingPageService.get_landing_view()
+            stats = SERVICE_INSTRUMENTATION.snapshot()
+        finally:
+            SERVICE_INSTRUMENTATION.disable()
+            SERVICE_INSTRUMENTATION.reset()
+        assert stats["LandingPageService.get_landing_view"].calls == 1
+
+    def test_count_rows(self):
+        assert count_rows(None) == 0
+        assert count_rows([1, 2]) == 2
+        assert count_rows({"a": 1}) == 1
+        assert count_rows(object()) == 1
@@ -0,0 +1,108 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from sqlmodel import text
+from app.content_cache import ContentCache, LANDING_NAMESPACE, SITE_CONFIG_NAMESPACE
+from app.database import reset_db, get_session, ENGINE
+from app.invalidation import InvalidationListener, install_notify_triggers, TABLE_NAMESPACES
+from app.models import Service, SiteConfiguration
+
+
+@pytest.fixture
+def new_db():
+    reset_db()
+    install_notify_triggers()
+    yield
+    reset_db()
+
+
+@pytest.fixture
+def listener(new_db):
+    cache = ContentCache(ttl_seconds=60)
+    listener = InvalidationListener(cache=cache, poll_interval=0.05, reconnect_delay=0.1)
+    listener.start()
+    assert listener.wait_until_listening(timeout=5)
+    yield listener
+    listener.stop()
+
+
+def wait_for_version(cache: ContentCache, namespace: str, above: int, timeout: float = 5.0) -> int:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if cache.version(namespace) > above:
+            break
+        time.sleep(0.02)
+    return cache.version(namespace)
+
+
+class TestNotifyTriggers:
+    """Test that writes to content tables emit notifications"""
+
+    def test_triggers_installed_on_all_content_tables(self, new_db):
+        with ENGINE.connect() as conn:
+            rows = conn.execute(
+                text(
+                    "SELECT DISTINCT event_object_table FROM information_schema.triggers WHERE trigger_name LIKE :name"
+                ),
+                {"name": "%_notify_content_changed"},
+            )
+            tables = {row[0] for row in rows}
+        assert tables == set(TABLE_NAMESPACES)
+
+    def test_install_is_idempotent(self, new_db):
+        install_notify_triggers()
+        install_notify_triggers()
+
+    def test_concurrent_installs(self, new_db):
+        with ThreadPoolExecutor(4) as pool:
+            for install in [pool.submit(install_notify_triggers) for _ in range(4)]:
+                install.result(10)
+
+
+class TestInvalidationListener:
+    """Test cross-process cache eviction via LISTEN/NOTIFY"""
+
+    def test_service_insert_evicts_landing_namespace(self, listener):
+        cache = listener.cache
+        cache.get_or_load(LANDING_NAMESPACE, lambda: "cached")
+        version = cache.version(LANDING_NAMESPACE)
+
+        with get_session() as session:
+            session.add(Service(title="New", description="Written by another worker"))
+            session.commit()
+
+        assert wait_for_version(cache, LANDING_NAMESPACE, version) > version
+        assert cache.get_or_load(LANDING_NAMESPACE, lambda: "reloaded") == "reloaded"
+
+    def test_site_config_update_evicts_only_site_config(self, listener):
+        cache = listener.cache
+        landing_version = cache.version(LANDING_NAMESPACE)
+        config_version = cache.version(SITE_CONFIG_NAMESPACE)
+
+        with get_session() as session:
+            session.add(SiteConfiguration(config_key="phone", config_value="555"))
+            session.commit()
+
+        assert wait_for_version(cache, SITE_CONFIG_NAMESPACE, config_version) > config_version
+        assert cache.version(LANDING_NAMESPACE) == landing_version
+
+    def test_unrelated_table_does_not_notify(self, listener):
+        cache = listener.cache
+        version = cache.version(LANDING_NAMESPACE)
+        with ENGINE.begin() as conn:
+            conn.execute(text("INSERT INTO page_views (page_path, created_at) VALUES ('/', now())"))
+        time.sleep(0.3)
+        assert cache.version(LANDING_NAMESPACE) == version
+
+    def test_unknown_payload_is_ignored(self):
+        cache = ContentCache(ttl_seconds=60)
+        InvalidationListener(cache=cache).handle("not_a_table")
+        assert cache.version(LANDING_NAMESPACE) == 0
+
+    def test_start_is_idempotent_and_stop_joins(self, listener):
+        thread = listener._thread
+        listener.start()
+        assert listener._thread is thread
+
+        listener.stop()
+        assert not listener.running
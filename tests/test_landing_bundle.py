@@ -0,0 +1,137 @@
+import statistics
+import time
+import pytest
+from logging import getLogger
+from sqlmodel import select, asc
+from app.database import reset_db, get_session
+from app.landing_service import LandingPageService
+from app.models import (
+    HeroSection,
+    Service,
+    Benefit,
+    CallToAction,
+    FooterContent,
+    HeroSectionCreate,
+    ServiceCreate,
+    BenefitCreate,
+)
+
+logger = getLogger(__name__)
+
+
+@pytest.fixture
+def new_db():
+    reset_db()
+    yield
+    reset_db()
+
+
+@pytest.fixture
+def full_content(new_db):
+    """Populate every landing section, including inactive rows that must be skipped"""
+    LandingPageService.create_hero_section(HeroSectionCreate(headline="Old Hero", description="Old"))
+    LandingPageService.create_hero_section(HeroSectionCreate(headline="Hero", description="Hero description"))
+    for order in (3, 1, 2, 5, 4, 6):
+        LandingPageService.create_service(
+            ServiceCreate(title=f"Service {order}", description="Desc", icon_class="home", display_order=order)
+        )
+        LandingPageService.create_benefit(
+            BenefitCreate(title=f"Benefit {order}", description="Desc", icon_class="verified", display_order=order)
+        )
+    with get_session() as session:
+        session.add(CallToAction(button_text="Email", action_type="email", action_value="a@b.com", display_order=2))
+        session.add(CallToAction(button_text="WhatsApp", action_type="whatsapp", action_value="123", display_order=1))
+        session.add(CallToAction(button_text="Hidden", action_type="phone", action_value="1", is_active=False))
+        session.add(
+            FooterContent(
+                company_name="SmartHome IT Solutions",
+                copyright_text="© 2024",
+                social_links={"twitter": "https://twitter.com/smarthome"},
+            )
+        )
+        session.commit()
+    yield
+
+
+def five_query_load():
+    """The pre-bundle access path: one session and one SELECT per section"""
+    with get_session() as session:
+        hero = session.exec(select(HeroSection).where(HeroSection.is_active)).first()
+    with get_session() as session:
+        services = list(session.exec(select(Service).where(Service.is_active).order_by(asc(Service.display_order))))
+    with get_session() as session:
+        benefits = list(session.exec(select(Benefit).where(Benefit.is_active).order_by(asc(Benefit.display_order))))
+    with get_session() as session:
+        cta_buttons = list(
+            session.exec(select(CallToAction).where(CallToAction.is_active).order_by(asc(CallToAction.display_order)))
+        )
+    with get_session() as session:
+        footer = session.exec(select(FooterContent).where(FooterContent.is_active)).first()
+    return hero, services, benefits, cta_buttons, footer
+
+
+class TestLandingBundle:
+    """Test the single round-trip landing content loader"""
+
+    def test_empty_database(self, new_db):
+        bundle = LandingPageService.get_landing_bundle()
+        assert bundle.hero is None
+        assert bundle.services == ()
+        assert bundle.benefits == ()
+        assert bundle.cta_buttons == ()
+        assert bundle.footer is None
+
+    def test_matches_per_section_queries(self, full_content):
+        bundle = LandingPageService.get_landing_bundle()
+        hero, services, benefits, cta_buttons, footer = five_query_load()
+
+        assert bundle.hero == hero
+        assert list(bundle.services) == services
+        assert list(bundle.benefits) == benefits
+        assert list(bundle.cta_buttons) == cta_buttons
+        assert bundle.footer == footer
+
+    def test_typed_and_ordered(self, full_content):
+        bundle = LandingPageService.get_landing_bundle()
+
+        assert isinstance(bundle.hero, HeroSection)
+        assert bundle.hero.headline == "Hero"
+        assert all(isinstance(service, Service) for service in bundle.services)
+        assert [s.display_order for s in bundle.services] == [1, 2, 3, 4, 5, 6]
+        assert [b.display_order for b in bundle.benefits] == [1, 2, 3, 4, 5, 6]
+        assert [c.button_text for c in bundle.cta_buttons] == ["WhatsApp", "Email"]
+        assert isinstance(bundle.footer, FooterContent)
+        assert bundle.footer.social_links == {"twitter": "https://twitter.com/smarthome"}
+        assert bundle.services[0].created_at.year >= 2024
+
+    def test_single_round_trip(self, full_content, statement_log):
+        LandingPageService.get_landing_bundle()
+        assert len(statement_log) == 1
+
+    def test_cache_miss_uses_bundle(self, full_content, statement_log):
+        LandingPageService.get_services()
+        LandingPageService.get_hero_section()
+        assert len(statement_log) == 1
+
+
+@pytest.mark.perf
+def test_bundle_latency_versus_five_calls(full_content):
+    """Benchmark: one aggregate query against five sessions with one SELECT each"""
+    rounds = 200
+    for _ in range(20):  # warm up the pool and the server plan cache
+        five_query_load()
+        LandingPageService.get_landing_bundle()
+
+    def measure(fn):
+        samples = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            fn()
+            samples.append(time.perf_counter() - start)
+        return statistics.median(samples)
+
+    five_calls = measure(five_query_load)
+    bundle = measure(LandingPageService.get_landing_bundle)
+    summary = f"five calls: {five_calls * 1000:.3f} ms, bundle: {bundle * 1000:.3f} ms, x{five_calls / bundle:.1f}"
+    logger.info(summary)
+    assert bundle < five_calls, summary
@@ -0,0 +1,90 @@
+import gc
+import tracemalloc
+from logging import getLogger
+from typing import Callable, List, Tuple
+import pytest
+from nicegui import Client, ui
+from nicegui.page import page
+from app.database import reset_db
+from app.landing_page import create_lite_sections, create_sections
+from app.landing_service import initialize_default_data
+
+logger = getLogger(__name__)
+
+
+@pytest.fixture
+def new_db():
+    reset_db()
+    initialize_default_data()
+    yield
+    reset_db()
+
+
+def build_clients(build_sections: Callable[[], None], count: int) -> List[Client]:
+    clients = []
+    for _ in range(count):
+        client = Client(page(""), request=None)
+        with client:
+            build_sections()
+        clients.append(client)
+    return clients
+
+
+def client_footprint(build_sections: Callable[[], None], clients: int = 50) -> Tuple[float, float]:
+    """Bytes and elements retained per connected client for one way of building the page.
+
+    A warm-up client is built first so that imports and the content caches are not counted.
+    """
+    for client in build_clients(build_sections, 1):
+        client.delete()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        built = build_clients(build_sections, clients)
+        gc.collect()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    retained = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    elements = sum(len(client.elements) for client in built)
+    for client in built:
+        client.delete()
+    return retained / clients, elements / clients
+
+
+class TestLiteRender:
+    """Test the lightweight landing page built from shared HTML fragments"""
+
+    def test_only_buttons_stay_live(self, new_db):
+        lite, live = build_clients(create_lite_sections, 1)[0], build_clients(create_sections, 1)[0]
+        lite_types = [type(element) for element in lite.elements.values()]
+        assert lite_types.count(ui.button) == 4
+        assert lite_types.count(ui.label) == 0
+        assert len(lite.elements) < len(live.elements) / 5
+        lite.delete()
+        live.delete()
+
+    def test_fragments_shared_between_clients(self, new_db):
+        first, second = build_clients(create_lite_sections, 2)
+        first_html = [element for element in first.elements.values() if isinstance(element, ui.html)]
+        second_html = [element for element in second.elements.values() if isinstance(element, ui.html)]
+        assert len(first_html) == 6
+        for a, b in zip(first_html, second_html):
+            assert a.content is b.content
+        assert "Smart Lighting Systems" in "".join(element.content for element in first_html)
+        first.delete()
+        second.delete()
+
+
+@pytest.mark.perf
+def test_client_footprint_live_versus_lite(new_db):
+    """Measurement: memory retained per connected client by the live and the lite render"""
+    live_bytes, live_elements = client_footprint(create_sections)
+    lite_bytes, lite_elements = client_footprint(create_lite_sections)
+    summary = (
+        f"live: {live_bytes / 1024:.1f} KiB/client ({live_elements:.0f} elements), "
+        f"lite: {lite_bytes / 1024:.1f} KiB/client ({lite_elements:.0f} elements), x{live_bytes / lite_bytes:.1f}"
+    )
+    logger.info(summary)
+    assert lite_bytes < live_bytes, summary
@@ -1,5 +1,13 @@
 import pytest
-from app.landing_service import LandingPageService, initialize_default_data
+from app.landing_content import (
+    DEFAULT_BENEFITS,
+    DEFAULT_SERVICES,
+    HERO_DESCRIPTION,
+    HERO_HEADLINE,
+    LEGACY_HERO_DESCRIPTION,
+    LEGACY_SERVICES,
+)
+from app.landing_service import LandingPageService, initialize_default_data, upgrade_legacy_seed
 from app.models import HeroSection, HeroSectionCreate, ServiceCreate, BenefitCreate, ContactSubmissionCreate
 from app.database import reset_db
 
@@ -253,6 +261,43 @@ class TestLandingPageService:
         assert "Advanced Security Networks" in service_titles
         assert "Energy Management" in service_titles
 
+    def test_initialize_upgrades_original_seed(self, new_db):
+        """A database seeded with the original short defaults gets the current ones"""
+        LandingPageService.create_hero_section(
+            HeroSectionCreate(headline=HERO_HEADLINE, description=LEGACY_HERO_DESCRIPTION)
+        )
+        for order, item in enumerate(LEGACY_SERVICES, start=1):
+            LandingPageService.create_service(
+                ServiceCreate(title=item.title, description=item.description, icon_class=item.icon, display_order=order)
+            )
+
+        initialize_default_data()
+        initialize_default_data()  # idempotent
+
+        hero = LandingPageService.get_hero_section()
+        assert hero is not None
+        assert hero.description == HERO_DESCRIPTION
+        services = LandingPageService.get_services()
+        assert [(s.title, s.description, s.display_order) for s in services] == [
+            (item.title, item.description, order) for order, item in enumerate(DEFAULT_SERVICES, start=1)
+        ]
+        assert len(LandingPageService.get_benefits()) == len(DEFAULT_BENEFITS)
+
+    def test_initialize_keeps_edited_content(self, new_db):
+        """Content that differs from the original seed is not overwritten"""
+        LandingPageService.create_hero_section(HeroSectionCreate(headline=HERO_HEADLINE, description="Our own text"))
+        LandingPageService.create_service(
+            ServiceCreate(title="Smart Lighting Systems", description="Edited", icon_class="lightbulb", display_order=1)
+        )
+
+        assert not upgrade_legacy_seed()
+        initialize_default_data()
+
+        hero = LandingPageService.get_hero_section()
+        assert hero is not None
+        assert hero.description == "Our own text"
+        assert [s.description for s in LandingPageService.get_services()] == ["Edited"]
+
     def test_data_sanitization(self, new_db):
         """Test that data is properly sanitized"""
         # Test that the service layer properly sanitizes data
@@ -0,0 +1,70 @@
+import pytest
+from app.database import reset_db, get_session
+from app.landing_content import (
+    DEFAULT_BENEFITS,
+    DEFAULT_ICON,
+    DEFAULT_LANDING_VIEW,
+    DEFAULT_SERVICES,
+    HERO_DESCRIPTION,
+    ContentItem,
+    build_landing_view,
+)
+from app.landing_service import LandingPageService, initialize_default_data
+from app.models import FooterContent, HeroSectionCreate, ServiceCreate, BenefitCreate
+
+
+@pytest.fixture
+def new_db():
+    reset_db()
+    yield
+    reset_db()
+
+
+class TestBuildLandingView:
+    """Test mapping a content snapshot to display-ready sections"""
+
+    def test_empty_snapshot_uses_defaults(self, new_db):
+        assert build_landing_view(LandingPageService.get_landing_bundle()) == DEFAULT_LANDING_VIEW
+
+    def test_database_content_replaces_defaults(self, new_db):
+        LandingPageService.create_hero_section(HeroSectionCreate(headline="Custom Hero", description="Custom"))
+        LandingPageService.create_service(ServiceCreate(title="Second", description="B", display_order=2))
+        LandingPageService.create_service(
+            ServiceCreate(title="First", description="A", icon_class="wifi", display_order=1)
+        )
+        with get_session() as session:
+            session.add(FooterContent(company_name="Acme", copyright_text="© Acme", email="hi@acme.test"))
+            session.commit()
+
+        view = build_landing_view(LandingPageService.get_landing_bundle())
+        assert view.hero_headline == "Custom Hero"
+        assert view.services == (
+            ContentItem(icon="wifi", title="First", description="A"),
+            ContentItem(icon=DEFAULT_ICON, title="Second", description="B"),
+        )
+        assert view.benefits == DEFAULT_BENEFITS  # no benefit rows yet
+        assert view.company_name == "Acme"
+        assert view.contact_email == "hi@acme.test"
+        assert view.contact_phone == DEFAULT_LANDING_VIEW.contact_phone  # not set on the footer row
+
+
+class TestLandingView:
+    """Test that the view is computed once per content version"""
+
+    def test_cached_per_version(self, new_db, statement_log):
+        view = LandingPageService.get_landing_view()
+        assert LandingPageService.get_landing_view() is view
+        assert len(statement_log) == 1
+
+        LandingPageService.create_benefit(BenefitCreate(title="New Benefit", description="Desc"))
+        statement_log.clear()
+        updated = LandingPageService.get_landing_view()
+        assert [benefit.title for benefit in updated.benefits] == ["New Benefit"]
+        assert len(statement_log) == 1
+
+    def test_seeded_content_matches_defaults(self, new_db):
+        initialize_default_data()
+        view = LandingPageService.get_landing_view()
+        assert view.services == DEFAULT_SERVICES
+        assert view.benefits == DEFAULT_BENEFITS
+        assert view.hero_description == HERO_DESCRIPTION
@@ -0,0 +1,119 @@
+import threading
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette.routing import Mount
+from starlette.staticfiles import StaticFiles
+from app.database import pool_stats
+from app.landing_service import LandingPageService
+from app.metrics import (
+    CONTACT_SUBMISSIONS,
+    Counter,
+    Histogram,
+    MetricsRegistry,
+    pool_families,
+)
+from app.middleware import MetricsMiddleware
+from app.models import ContactSubmissionCreate
+
+
+def render(*metrics) -> str:
+    registry = MetricsRegistry()
+    for metric in metrics:
+        registry.metric(metric)
+    return registry.render()
+
+
+class TestMetricTypes:
+    """Test counters, histograms and the text exposition format"""
+
+    def test_counter(self):
+        counter = Counter("jobs_total", "Jobs run", ("kind",))
+        counter.labels("a").inc()
+        counter.labels("a").inc(2)
+        counter.labels('b"\\').inc()
+        text = render(counter)
+        assert "# HELP jobs_total Jobs run\n# TYPE jobs_total counter\n" in text
+        assert 'jobs_total{kind="a"} 3\n' in text
+        assert 'jobs_total{kind="b\\"\\\\"} 1\n' in text
+
+    def test_histogram_buckets_are_cumulative(self):
+        histogram = Histogram("work_seconds", "Work", buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 5.0):
+            histogram.observe(value)
+        text = render(histogram)
+        assert 'work_seconds_bucket{le="0.1"} 2\n' in text
+        assert 'work_seconds_bucket{le="1"} 3\n' in text
+        assert 'work_seconds_bucket{le="+Inf"} 4\n' in text
+        assert "work_seconds_sum 5.65\n" in text
+        assert "work_seconds_count 4\n" in text
+
+    def test_label_count_checked(self):
+        counter = Counter("c_total", "c", ("a", "b"))
+        with pytest.raises(ValueError, match="expects labels"):
+            counter.labels("only-one")
+
+    def test_concurrent_updates_are_not_lost(self):
+        counter = Counter("hits_total", "Hits")
+        histogram = Histogram("lat_seconds", "Latency")
+
+        def work():
+            for _ in range(10_000):
+                counter.inc()
+                histogram.observe(0.002)
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert counter.labels().value() == 80_000
+        assert histogram.labels().snapshot()[2] == 80_000
+
+
+class TestServiceMetrics:
+    """Test the metrics recorded by LandingPageService"""
+
+    def test_landing_service_is_instrumented(self):
+        before = CONTACT_SUBMISSIONS.labels("invalid").value()
+        contact = ContactSubmissionCreate(name="", email="not-an-email", message="")
+        assert LandingPageService.submit_contact_form(contact) is None
+        assert CONTACT_SUBMISSIONS.labels("invalid").value() == before + 1
+
+
+class TestRequestMetrics:
+    """Test per-route request timing"""
+
+    def test_labels_use_route_templates(self, tmp_path):
+        (tmp_path / "a.txt").write_text("a")
+        histogram = Histogram("requests_seconds", "Requests", ("method", "route", "status"))
+        api = FastAPI(routes=[Mount("/files", StaticFiles(directory=tmp_path))])
+
+        @api.get("/items/{item_id}")
+        def item(item_id: int):
+            return {"id": item_id}
+
+        api.add_middleware(MetricsMiddleware, histogram=histogram)
+        client = TestClient(api)
+        for item_id in range(3):
+            assert client.get(f"/items/{item_id}").status_code == 200
+        assert client.get("/files/a.txt").status_code == 200
+        assert client.get("/missing").status_code == 404
+
+        text = render(histogram)
+        assert 'requests_seconds_count{method="GET",route="/items/{item_id}",status="200"} 3\n' in text
+        assert 'requests_seconds_count{method="GET",route="/files/*",status="200"} 1\n' in text
+        assert 'requests_seconds_count{method="GET",route="<unmatched>",status="404"} 1\n' in text
+
+
+class TestPoolMetrics:
+    """Test the exported connection pool statistics"""
+
+    def test_pool_families(self):
+        registry = MetricsRegistry()
+        registry.register(lambda: pool_families(pool_stats()))
+        text = registry.render()
+        assert "# TYPE app_db_pool_wait_seconds histogram" in text
+        assert 'app_db_pool_connections{engine="sync",state="checked_out"}' in text
+        assert 'app_db_pool_wait_seconds_bucket{engine="async",le="+Inf"}' in text
+        assert 'app_db_pool_capacity{engine="sync"} 15' in text
@@ -0,0 +1,152 @@
+import asyncio
+import statistics
+import time
+from logging import getLogger
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import PlainTextResponse
+from app.middleware import (
+    CACHE_POLICY,
+    SECURITY_HEADERS,
+    SecurityHeadersMiddleware,
+    encode_headers,
+    merge_headers,
+)
+
+logger = getLogger(__name__)
+
+
+def make_app(**options) -> FastAPI:
+    api = FastAPI()
+
+    @api.get("/")
+    def index():
+        return PlainTextResponse("ok", headers={"Cache-Control": "no-cache", "X-Custom": "1"})
+
+    @api.get("/assets/app.css")
+    def asset():
+        return PlainTextResponse("body {}", media_type="text/css")
+
+    @api.get("/assets-list")
+    def not_an_asset():
+        return PlainTextResponse("list")
+
+    api.add_middleware(SecurityHeadersMiddleware, **options)
+    return api
+
+
+class TestHeaderBlocks:
+    """Test header encoding and merging"""
+
+    def test_encode(self):
+        assert encode_headers([("X-Frame-Options", "DENY")]) == ((b"x-frame-options", b"DENY"),)
+
+    def test_merge_replaces_same_name(self):
+        base = encode_headers([("A", "1"), ("B", "2")])
+        merged = merge_headers(base, encode_headers([("b", "3"), ("C", "4")]))
+        assert merged == ((b"a", b"1"), (b"b", b"3"), (b"c", b"4"))
+
+
+class TestSecurityHeadersMiddleware:
+    """Test the headers added to real responses"""
+
+    def test_adds_security_headers(self):
+        response = TestClient(make_app()).get("/")
+        for name, value in SECURITY_HEADERS:
+            assert response.headers[name] == value
+        assert response.headers["x-custom"] == "1"
+        assert response.headers["cache-control"] == "no-cache"
+        assert response.text == "ok"
+
+    def test_replaces_header_set_by_app(self):
+        client = TestClient(make_app(headers=[("Cache-Control", "no-store")]))
+        assert client.get("/").headers.get_list("cache-control") == ["no-store"]
+
+    def test_path_overrides(self):
+        immutable = "public, max-age=31536000, immutable"
+        client = TestClient(make_app(path_headers=[("/assets/", [("Cache-Control", immutable)])]))
+
+        asset = client.get("/assets/app.css")
+        assert asset.headers["cache-control"] == immutable
+        assert asset.headers["x-content-type-options"] == "nosniff"
+        assert client.get("/assets-list").headers.get("cache-control") is None
+        assert client.get("/").headers["cache-control"] == "no-cache"
+
+    def test_first_matching_prefix_wins(self):
+        middleware = SecurityHeadersMiddleware(
+            make_app(), path_headers=[("/a/b", [("X-Rule", "specific")]), ("/a", [("X-Rule", "general")])]
+        )
+        assert (b"x-rule", b"specific") in middleware.block_for("/a/b/c").headers
+        assert (b"x-rule", b"general") in middleware.block_for("/a/c").headers
+        assert middleware.block_for("/other") is middleware.default_block
+
+    def test_cache_policy(self):
+        middleware = SecurityHeadersMiddleware(make_app(), path_headers=CACHE_POLICY)
+        assert (b"cache-control", b"no-store") in middleware.block_for("/health/ready").headers
+        assert (b"cache-control", b"no-store") in middleware.block_for("/metrics").headers
+        assert (b"cache-control", b"public, max-age=86400") in middleware.block_for("/favicon.ico").headers
+        assert middleware.block_for("/") is middleware.default_block
+
+    def test_passes_other_scopes_through(self):
+        received = []
+
+        async def inner(scope, receive, send):
+            received.append(scope["type"])
+
+        async def receive():
+            return {"type": "lifespan.startup"}
+
+        async def send(message):
+            pass
+
+        asyncio.run(SecurityHeadersMiddleware(inner)({"type": "lifespan"}, receive, send))
+        assert received == ["lifespan"]
+
+
+class LegacySecurityHeadersMiddleware(BaseHTTPMiddleware):
+    """The BaseHTTPMiddleware implementation main.py used before, kept as the benchmark baseline"""
+
+    async def dispatch(self, request, call_next):
+        response = await call_next(request)
+        response.headers["X-XSS-Protection"] = "1; mode=block"
+        response.headers["X-Content-Type-Options"] = "nosniff"
+        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
+        response.headers["Content-Security-Policy"] = SECURITY_HEADERS[3][1]
+        return response
+
+
+@pytest.mark.perf
+def test_throughput_versus_base_http_middleware():
+    """Benchmark: requests per second through each middleware around a minimal ASGI app"""
+    requests = 5000
+
+    async def endpoint(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"text/plain")]})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    scope = {"type": "http", "method": "GET", "path": "/", "headers": [], "query_string": b""}
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    async def measure(app) -> float:
+        for _ in range(200):  # warm up
+            await app(dict(scope), receive, send)
+        rounds = []
+        for _ in range(5):
+            start = time.perf_counter()
+            for _ in range(requests):
+                await app(dict(scope), receive, send)
+            rounds.append(requests / (time.perf_counter() - start))
+        return statistics.median(rounds)
+
+    legacy = asyncio.run(measure(LegacySecurityHeadersMiddleware(endpoint)))
+    pure = asyncio.run(measure(SecurityHeadersMiddleware(endpoint)))
+    summary = f"BaseHTTPMiddleware: {legacy:,.0f} req/s, pure ASGI: {pure:,.0f} req/s, x{pure / legacy:.1f}"
+    logger.info(summary)
+    assert pure > legacy, summary
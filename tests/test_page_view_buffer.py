@@ -0,0 +1,232 @@
+import time
+import pytest
+from sqlmodel import select, func
+from starlette.requests import Request
+from app.database import reset_db, get_session
+from app.landing_page import capture_page_view, client_ip, parse_trusted_proxies
+from app.landing_service import LandingPageService
+from app.models import PageView
+from app.page_view_buffer import PageViewBuffer, PAGE_VIEW_BUFFER
+
+
+@pytest.fixture
+def new_db():
+    reset_db()
+    yield
+    reset_db()
+
+
+def count_page_views() -> int:
+    with get_session() as session:
+        return session.exec(select(func.count()).select_from(PageView)).one()
+
+
+def make_view(path: str = "/") -> PageView:
+    return PageView(page_path=path, ip_address="192.168.1.0")
+
+
+class TestPageViewBuffer:
+    """Test the write-behind page view queue"""
+
+    def test_submit_does_not_write_until_flush(self, new_db):
+        buffer = PageViewBuffer(batch_size=100, flush_interval=60)
+        for _ in range(5):
+            assert buffer.submit(make_view())
+        assert count_page_views() == 0
+        assert buffer.stats().pending == 5
+
+        assert buffer.flush() == 5
+        assert count_page_views() == 5
+        stats = buffer.stats()
+        assert stats.enqueued == 5
+        assert stats.flushed == 5
+        assert stats.pending == 0
+        buffer.stop()
+
+    def test_flush_uses_multi_row_insert(self, new_db, statement_log):
+        buffer = PageViewBuffer(batch_size=100, flush_interval=60)
+        for i in range(50):
+            buffer.submit(make_view(f"/page/{i}"))
+        buffer.flush()
+        buffer.stop()
+
+        inserts = [s for s in statement_log if s.startswith("INSERT INTO page_views")]
+        assert len(inserts) == 1
+        assert count_page_views() == 50
+
+    def test_flush_splits_into_batches(self, new_db):
+        buffer = PageViewBuffer(batch_size=10, flush_interval=60)
+        for _ in range(25):
+            buffer.submit(make_view())
+        buffer.stop()
+        assert count_page_views() == 25
+        assert buffer.stats().flushes == 3
+
+    def test_background_flush_on_batch_size(self, new_db):
+        buffer = PageViewBuffer(batch_size=3, flush_interval=60)
+        for _ in range(3):
+            buffer.submit(make_view())
+        deadline = time.monotonic() + 5
+        while buffer.stats().flushed < 3 and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert count_page_views() == 3
+        buffer.stop()
+
+    def test_background_flush_on_interval(self, new_db):
+        buffer = PageViewBuffer(batch_size=100, flush_interval=0.05)
+        buffer.submit(make_view())
+        deadline = time.monotonic() + 5
+        while buffer.stats().flushed < 1 and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert count_page_views() == 1
+        buffer.stop()
+
+    def test_drop_newest_when_full(self, new_db):
+        buffer = PageViewBuffer(max_size=2, batch_size=100, flush_interval=60, drop_policy="drop_newest")
+        assert buffer.submit(make_view("/1"))
+        assert buffer.submit(make_view("/2"))
+        assert not buffer.submit(make_view("/3"))
+        buffer.stop()
+
+        with get_session() as session:
+            paths = sorted(session.exec(select(PageView.page_path)).all())
+        assert paths == ["/1", "/2"]
+        assert buffer.stats().dropped == 1
+
+    def test_drop_oldest_when_full(self, new_db):
+        buffer = PageViewBuffer(max_size=2, batch_size=100, flush_interval=60, drop_policy="drop_oldest")
+        for path in ("/1", "/2", "/3"):
+            assert buffer.submit(make_view(path))
+        buffer.stop()
+
+        with get_session() as session:
+            paths = sorted(session.exec(select(PageView.page_path)).all())
+        assert paths == ["/2", "/3"]
+        assert buffer.stats().dropped == 1
+
+    def test_unknown_drop_policy(self):
+        with pytest.raises(ValueError):
+            PageViewBuffer(drop_policy="block")
+
+    def test_failed_batch_is_counted(self, new_db):
+        buffer = PageViewBuffer(batch_size=100, flush_interval=60)
+        buffer.submit(make_view("/" + "x" * 300))  # exceeds the page_path column length
+        assert buffer.flush() == 0
+        buffer.stop()
+        assert buffer.stats().failed == 1
+        assert count_page_views() == 0
+
+    def test_stop_flushes_pending_rows(self, new_db):
+        buffer = PageViewBuffer(batch_size=100, flush_interval=60)
+        buffer.submit(make_view())
+        buffer.submit(make_view())
+        buffer.stop()
+        assert count_page_views() == 2
+
+    def test_submit_after_stop_writes_through(self, new_db):
+        buffer = PageViewBuffer(batch_size=100, flush_interval=60)
+        buffer.stop()
+        assert buffer.submit(make_view())
+        assert count_page_views() == 1
+        assert buffer.stats().pending == 0
+        assert buffer._thread is None  # no flusher restarted during shutdown
+
+        buffer.start()
+        buffer.submit(make_view())
+        assert count_page_views() == 1
+        buffer.stop()
+        assert count_page_views() == 2
+
+
+class TestLogPageView:
+    """LandingPageService.log_page_view queues instead of writing"""
+
+    def test_log_page_view_is_write_behind(self, new_db):
+        result = LandingPageService.log_page_view("/", ip_address="10.0.0.7", session_id="abc")
+        assert result is not None
+        assert result.id is None  # queued, not yet persisted
+        assert result.ip_address == "10.0.0.0"
+
+        PAGE_VIEW_BUFFER.flush()
+        with get_session() as session:
+            stored = session.exec(select(PageView)).one()
+        assert stored.page_path == "/"
+        assert stored.ip_address == "10.0.0.0"
+        assert stored.session_id == "abc"
+        assert stored.created_at is not None
+
+
+def make_request(headers: dict, client_host: str = "203.0.113.9", session: dict | None = None) -> Request:
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "query_string": b"",
+        "headers": [(key.lower().encode(), value.encode()) for key, value in headers.items()],
+        "client": (client_host, 51000),
+        "server": ("testserver", 80),
+        "scheme": "http",
+    }
+    if session is not None:
+        scope["session"] = session
+    return Request(scope)
+
+
+class TestCapturePageView:
+    """The landing page hands request metadata to the page view buffer"""
+
+    def test_captures_request_metadata(self, new_db):
+        request = make_request(
+            {"User-Agent": "Test Browser", "Referer": "https://google.com"}, session={"id": "session-1"}
+        )
+        capture_page_view(request)
+        PAGE_VIEW_BUFFER.flush()
+
+        with get_session() as session:
+            stored = session.exec(select(PageView)).one()
+        assert stored.page_path == "/"
+        assert stored.ip_address == "203.0.113.0"
+        assert stored.user_agent == "Test Browser"
+        assert stored.referrer == "https://google.com"
+        assert stored.session_id == "session-1"
+
+    def test_ignores_forwarded_for_from_untrusted_peer(self, new_db):
+        capture_page_view(make_request({"X-Forwarded-For": "198.51.100.4, 10.0.0.1"}))
+        PAGE_VIEW_BUFFER.flush()
+
+        with get_session() as session:
+            stored = session.exec(select(PageView)).one()
+        assert stored.ip_address == "203.0.113.0"
+        assert stored.session_id is None
+
+    def test_missing_request_is_ignored(self, new_db):
+        enqueued = PAGE_VIEW_BUFFER.stats().enqueued
+        capture_page_view(None)
+        assert PAGE_VIEW_BUFFER.stats().enqueued == enqueued
+
+    def test_capture_errors_are_counted(self, new_db):
+        failed = PAGE_VIEW_BUFFER.stats().failed
+        capture_page_view(make_request({}, session="not-a-dict"))  # type: ignore[arg-type]
+        assert PAGE_VIEW_BUFFER.stats().failed == failed + 1
+
+
+class TestClientIp:
+    """X-Forwarded-For is only honoured behind trusted proxies"""
+
+    PROXIES = parse_trusted_proxies("10.0.0.0/8, 2001:db8::1")
+
+    def test_untrusted_peer_is_the_client(self):
+        request = make_request({"X-Forwarded-For": "198.51.100.4"}, client_host="203.0.113.9")
+        assert client_ip(request, self.PROXIES) == "203.0.113.9"
+
+    def test_trusted_proxy_skips_trusted_hops(self):
+        request = make_request({"X-Forwarded-For": "1.2.3.4, 198.51.100.4, 10.0.0.2"}, client_host="10.0.0.1")
+        assert client_ip(request, self.PROXIES) == "198.51.100.4"  # 1.2.3.4 may be forged by the client
+
+    def test_trusted_proxy_without_header(self):
+        assert client_ip(make_request({}, client_host="2001:db8::1"), self.PROXIES) == "2001:db8::1"
+
+    def test_no_trusted_proxies_by_default(self):
+        assert parse_trusted_proxies("") == ()
+        request = make_request({"X-Forwarded-For": "198.51.100.4"}, client_host="10.0.0.1")
+        assert client_ip(request, ()) == "10.0.0.1"
@@ -0,0 +1,270 @@
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+import pytest
+from app.metrics import MetricsRegistry, query_cache_families
+from app.query_cache import QueryResultCache, cache_key, normalize_sql, read_only_statement
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingLoader:
+    """Loader returning rows tagged with the call number, optionally blocking until released"""
+
+    def __init__(self, rows: int = 1) -> None:
+        self.rows = rows
+        self.calls = 0
+        self.release = threading.Event()
+        self.release.set()
+        self.done = threading.Event()
+
+    def __call__(self) -> List[Dict[str, Any]]:
+        self.calls += 1
+        call = self.calls
+        assert self.release.wait(5)
+        self.done.set()
+        return [{"call": call} for _ in range(self.rows)]
+
+
+def wait_for(condition) -> None:
+    for _ in range(500):
+        if condition():
+            return
+        time.sleep(0.01)
+    raise AssertionError("condition not met")
+
+
+class TestCacheKey:
+    """Test query normalization"""
+
+    def test_whitespace_and_semicolons(self):
+        assert normalize_sql("SELECT *\n  FROM t\tWHERE a = 1;\n") == "SELECT * FROM t WHERE a = 1"
+
+    def test_literals_kept(self):
+        assert normalize_sql("SELECT 'a  b',  `x  y` FROM t") == "SELECT 'a  b', `x  y` FROM t"
+        assert normalize_sql("SELECT 'it\\'s  ok'") == "SELECT 'it\\'s  ok'"
+
+    def test_comments_removed(self):
+        assert normalize_sql("SELECT 1 -- note\n, 2") == normalize_sql("SELECT 1\n, 2") == "SELECT 1 , 2"
+        assert cache_key("SELECT 1 -- note\n, 2") != cache_key("SELECT 1 -- note , 2")
+        assert normalize_sql("SELECT /* a\n b */ x FROM t -- trailing") == "SELECT x FROM t"
+        assert normalize_sql("SELECT '-- not a comment'") == "SELECT '-- not a comment'"
+
+    def test_parameters(self):
+        assert cache_key("SELECT :a, :b", {"b": 2, "a": 1}) == cache_key("SELECT  :a, :b", {"a": 1, "b": 2})
+        assert cache_key("SELECT :a", {"a": 1}) != cache_key("SELECT :a", {"a": 2})
+        assert cache_key("SELECT 1", {}) == cache_key("SELECT 1")
+
+    def test_read_only_statement(self):
+        assert read_only_statement("select * FROM t")
+        assert read_only_statement("-- latest\n WITH r AS (SELECT 1) SELECT * FROM r;")
+        assert read_only_statement("(SELECT 1) UNION (SELECT 2)")
+        assert not read_only_statement("INSERT INTO t SELECT * FROM s")
+        assert not read_only_statement("MERGE INTO t USING s ON t.id = s.id WHEN MATCHED THEN DELETE")
+        assert not read_only_statement("CREATE TABLE t AS SELECT 1")
+        assert not read_only_statement("SELECTED")
+
+
+class TestQueryResultCache:
+    """Test TTL, stale-while-revalidate and eviction with a fake clock"""
+
+    def test_hit_after_miss(self):
+        cache = QueryResultCache(ttl_seconds=60)
+        loader = CountingLoader()
+        assert cache.get_or_load("SELECT 1", loader) == [{"call": 1}]
+        assert cache.get_or_load("SELECT  1;", loader) == [{"call": 1}]
+        assert cache.get_or_load("SELECT 1", loader, {"id": 1}) == [{"call": 2}]
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.entries, stats.rows) == (1, 2, 2, 2)
+
+    def test_stale_served_while_refreshing(self):
+        clock = FakeClock()
+        cache = QueryResultCache(ttl_seconds=60, stale_seconds=30, clock=clock)
+        loader = CountingLoader()
+        cache.get_or_load("SELECT 1", loader)
+
+        clock.now = 61
+        loader.release.clear()
+        loader.done.clear()
+        assert cache.get_or_load("SELECT 1", loader) == [{"call": 1}]
+        assert cache.get_or_load("SELECT 1", loader) == [{"call": 1}]  # one refresh at a time
+        loader.release.set()
+        assert loader.done.wait(5)
+        wait_for(lambda: cache.get_or_load("SELECT 1", loader) == [{"call": 2}])
+        assert loader.calls == 2
+        assert cache.stats().stale_hits >= 2
+
+    def test_expired_beyond_stale_window_reloads(self):
+        clock = FakeClock()
+        cache = QueryResultCache(ttl_seconds=60, stale_seconds=30, clock=clock)
+        loader = CountingLoader()
+        cache.get_or_load("SELECT 1", loader)
+        clock.now = 91
+        assert cache.get_or_load("SELECT 1", loader) == [{"call": 2}]
+        assert cache.stats().misses == 2
+
+    def test_failed_refresh_keeps_stale_rows(self, caplog):
+        clock = FakeClock()
+        cache = QueryResultCache(ttl_seconds=60, stale_seconds=30, clock=clock)
+        cache.get_or_load("SELECT 1", lambda: [{"id": 1}])
+        clock.now = 61
+        failed = threading.Event()
+
+        def failing():
+            failed.set()
+            raise RuntimeError("warehouse stopped")
+
+        with caplog.at_level(logging.ERROR, logger="app.query_cache"):
+            assert cache.get_or_load("SELECT 1", failing) == [{"id": 1}]
+            assert failed.wait(5)
+            wait_for(lambda: "Error refreshing cached query: warehouse stopped" in caplog.text)
+        assert cache.get_or_load("SELECT 1", lambda: [{"id": 2}]) == [{"id": 1}]
+
+    def test_lru_eviction_by_entries_and_rows(self):
+        cache = QueryResultCache(ttl_seconds=60, max_entries=2, max_rows=5)
+        cache.get_or_load("SELECT 'a'", CountingLoader())
+        cache.get_or_load("SELECT 'b'", CountingLoader())
+        cache.get_or_load("SELECT 'a'", CountingLoader())  # a is now the most recently used
+        cache.get_or_load("SELECT 'c'", CountingLoader())
+        assert cache.get_or_load("SELECT 'a'", CountingLoader()) == [{"call": 1}]
+        assert cache.stats().evictions == 1
+        assert cache.stats().misses == 3
+
+        cache.get_or_load("SELECT 'd'", CountingLoader(rows=4))
+        stats = cache.stats()
+        assert (stats.entries, stats.rows, stats.evictions) == (2, 5, 2)
+
+        cache.get_or_load("SELECT 'e'", CountingLoader(rows=6))  # larger than the whole cache
+        assert cache.stats().entries == 2
+        assert cache.get_or_load("SELECT 'd'", CountingLoader()) == [{"call": 1}] * 4
+
+    def test_errors_are_not_cached(self):
+        cache = QueryResultCache(ttl_seconds=60)
+
+        def failing():
+            raise RuntimeError("Query failed")
+
+        with pytest.raises(RuntimeError, match="Query failed"):
+            cache.get_or_load("SELECT 1", failing)
+        assert cache.get_or_load("SELECT 1", CountingLoader()) == [{"call": 1}]
+
+    def test_invalidate_during_load(self):
+        cache = QueryResultCache(ttl_seconds=60)
+
+        def racing_loader():
+            cache.invalidate()
+            return [{"id": "old"}]
+
+        assert cache.get_or_load("SELECT 1", racing_loader) == [{"id": "old"}]
+        assert cache.get_or_load("SELECT 1", lambda: [{"id": "new"}]) == [{"id": "new"}]
+
+
+class TestSingleFlight:
+    """Test that concurrent identical queries share one load"""
+
+    def test_threads_share_one_load(self):
+        cache = QueryResultCache(ttl_seconds=60)
+        loader = CountingLoader()
+        loader.release.clear()
+        results: List[Any] = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get_or_load("SELECT 1", loader))) for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        wait_for(lambda: cache.stats().coalesced == 7)
+        loader.release.set()
+        for thread in threads:
+            thread.join(5)
+        assert results == [[{"call": 1}]] * 8
+        assert loader.calls == 1
+
+    def test_error_reaches_every_waiter(self):
+        cache = QueryResultCache(ttl_seconds=60)
+        release = threading.Event()
+
+        def failing():
+            assert release.wait(5)
+            raise RuntimeError("Query failed")
+
+        with ThreadPoolExecutor(3) as pool:
+            requests = [pool.submit(cache.get_or_load, "SELECT 1", failing) for _ in range(3)]
+            wait_for(lambda: cache.stats().coalesced == 2)
+            release.set()
+            for request in requests:
+                with pytest.raises(RuntimeError, match="Query failed"):
+                    request.result(5)
+        assert cache.stats().entries == 0
+
+    async def test_tasks_share_one_load(self):
+        cache = QueryResultCache(ttl_seconds=60)
+        calls = []
+
+        async def loader():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return [{"id": 1}]
+
+        results = await asyncio.gather(*(cache.aget_or_load("SELECT 1", loader) for _ in range(10)))
+        assert results == [[{"id": 1}]] * 10
+        assert len(calls) == 1
+        stats = cache.stats()
+        assert (stats.misses, stats.coalesced) == (1, 9)
+        assert await cache.aget_or_load("SELECT 1", loader) == [{"id": 1}]
+        assert cache.stats().hits == 1
+
+    async def test_cancelled_waiter_does_not_cancel_shared_load(self):
+        cache = QueryResultCache(ttl_seconds=60)
+        release = asyncio.Event()
+
+        async def loader():
+            await release.wait()
+            return [{"id": 1}]
+
+        first = asyncio.create_task(cache.aget_or_load("SELECT 1", loader))
+        second = asyncio.create_task(cache.aget_or_load("SELECT 1", loader))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+        assert await second == [{"id": 1}]
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        assert cache.stats().entries == 1
+
+    async def test_async_stale_while_revalidate(self):
+        clock = FakeClock()
+        cache = QueryResultCache(ttl_seconds=60, stale_seconds=30, clock=clock)
+        calls = []
+
+        async def loader():
+            calls.append(1)
+            return [{"call": len(calls)}]
+
+        await cache.aget_or_load("SELECT 1", loader)
+        clock.now = 61
+        assert await cache.aget_or_load("SELECT 1", loader) == [{"call": 1}]
+        await asyncio.sleep(0.01)
+        assert await cache.aget_or_load("SELECT 1", loader) == [{"call": 2}]
+        assert len(calls) == 2
+
+
+def test_query_cache_metrics():
+    cache = QueryResultCache(ttl_seconds=60)
+    cache.get_or_load("SELECT 1", CountingLoader(rows=3))
+    cache.get_or_load("SELECT 1", CountingLoader())
+    registry = MetricsRegistry()
+    registry.register(lambda: query_cache_families(cache.stats()))
+    text = registry.render()
+    assert 'app_databricks_query_cache_lookups_total{outcome="hit"} 1\n' in text
+    assert 'app_databricks_query_cache_lookups_total{outcome="miss"} 1\n' in text
+    assert 'app_databricks_query_cache_lookups_total{outcome="coalesced"} 0\n' in text
+    assert "app_databricks_query_cache_rows 3\n" in text
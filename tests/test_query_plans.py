@@ -0,0 +1,106 @@
+from datetime import datetime, timedelta
+from typing import Any, Dict, Generator, List, Set, Tuple
+import pytest
+from sqlalchemy import event, inspect
+from app.database import reset_db, create_tables, ENGINE
+from app.landing_service import LandingPageService
+from app.models import HeroSectionCreate, ServiceCreate, BenefitCreate
+from app.page_view_buffer import PAGE_VIEW_BUFFER
+from app.rate_limiter import PostgresRateLimiter
+
+
+@pytest.fixture
+def new_db():
+    reset_db()
+    LandingPageService.create_hero_section(HeroSectionCreate(headline="Hero", description="Desc"))
+    LandingPageService.create_service(ServiceCreate(title="Service", description="Desc", display_order=1))
+    LandingPageService.create_benefit(BenefitCreate(title="Benefit", description="Desc", display_order=1))
+    LandingPageService.log_page_view("/", ip_address="10.0.0.1")
+    PAGE_VIEW_BUFFER.flush()
+    yield
+    reset_db()
+
+
+@pytest.fixture
+def executed() -> Generator[List[Tuple[str, Any]], None, None]:
+    """Capture statements together with their parameters so they can be EXPLAINed afterwards"""
+    statements: List[Tuple[str, Any]] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(ENGINE, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(ENGINE, "before_cursor_execute", before_cursor_execute)
+
+
+def plan_indexes(statement: str, parameters: Any) -> Set[str]:
+    """Index names used by the plan, with sequential scans disabled.
+
+    The test tables hold a handful of rows, where a sequential scan is always cheapest;
+    disabling it shows whether a usable index exists for the access path at all.
+    """
+    with ENGINE.connect() as conn:
+        conn.exec_driver_sql("SET enable_seqscan = off")
+        plan = conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters).scalar()
+        conn.rollback()
+    assert plan is not None
+
+    indexes: Set[str] = set()
+
+    def walk(node: Dict[str, Any]) -> None:
+        if "Index Name" in node:
+            indexes.add(node["Index Name"])
+        for child in node.get("Plans", []):
+            walk(child)
+
+    walk(plan[0]["Plan"])
+    return indexes
+
+
+class TestIndexes:
+    """Test that the hot access paths are covered by indexes"""
+
+    def test_create_tables_adds_missing_indexes(self, new_db):
+        with ENGINE.begin() as conn:
+            conn.exec_driver_sql("DROP INDEX ix_page_views_created_at_page_path")
+        create_tables()
+        index_names = {index["name"] for index in inspect(ENGINE).get_indexes("page_views")}
+        assert "ix_page_views_created_at_page_path" in index_names
+
+    def test_active_content_indexes_are_partial(self, new_db):
+        with ENGINE.connect() as conn:
+            definition = conn.exec_driver_sql(
+                "SELECT indexdef FROM pg_indexes WHERE indexname = 'ix_services_active_display_order'"
+            ).scalar()
+        assert definition is not None
+        assert "WHERE is_active" in definition
+
+
+class TestQueryPlans:
+    """EXPLAIN the statements the service actually runs"""
+
+    def test_landing_bundle_uses_partial_indexes(self, new_db, executed):
+        LandingPageService.get_landing_bundle()
+        assert len(executed) == 1
+
+        assert plan_indexes(*executed[0]) >= {
+            "ix_hero_sections_active",
+            "ix_services_active_display_order",
+            "ix_benefits_active_display_order",
+            "ix_call_to_actions_active_display_order",
+            "ix_footer_contents_active",
+        }
+
+    def test_rate_limit_count_uses_ip_created_at_index(self, new_db, executed):
+        PostgresRateLimiter(limit=3, window_seconds=3600).is_limited("10.0.0.0")
+        assert len(executed) == 1
+
+        assert "ix_contact_submissions_ip_address_created_at" in plan_indexes(*executed[0])
+
+    def test_page_view_counts_use_created_at_page_path_index(self, new_db, executed):
+        counts = LandingPageService.get_page_view_counts(datetime.utcnow() - timedelta(days=1))
+        assert counts == {"/": 1}
+        assert len(executed) == 1
+
+        assert "ix_page_views_created_at_page_path" in plan_indexes(*executed[0])
@@ -0,0 +1,139 @@
+from datetime import datetime, timedelta
+import pytest
+from app.database import reset_db, get_session
+from app.landing_service import LandingPageService
+from app.models import ContactSubmission, ContactSubmissionCreate
+from app.rate_limiter import (
+    SlidingWindowRateLimiter,
+    PostgresRateLimiter,
+    CONTACT_RATE_LIMITER,
+    create_rate_limiter,
+)
+
+
+@pytest.fixture
+def new_db():
+    reset_db()
+    yield
+    reset_db()
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestSlidingWindowRateLimiter:
+    """Test the in-process sliding window limiter"""
+
+    def test_limits_after_allowance(self):
+        limiter = SlidingWindowRateLimiter(limit=3, window_seconds=60)
+        for _ in range(3):
+            assert not limiter.is_limited("10.0.0.0")
+            limiter.record("10.0.0.0")
+        assert limiter.is_limited("10.0.0.0")
+        assert not limiter.is_limited("10.0.1.0")
+
+    def test_window_slides(self):
+        clock = FakeClock()
+        limiter = SlidingWindowRateLimiter(limit=2, window_seconds=60, clock=clock)
+        limiter.record("ip")
+        clock.now += 30
+        limiter.record("ip")
+        assert limiter.is_limited("ip")
+
+        clock.now += 31  # first event leaves the window
+        assert not limiter.is_limited("ip")
+        limiter.record("ip")
+        assert limiter.is_limited("ip")
+
+        clock.now += 61
+        assert not limiter.is_limited("ip")
+        assert len(limiter) == 0  # fully expired keys are dropped
+
+    def test_memory_bounded_per_key(self):
+        limiter = SlidingWindowRateLimiter(limit=3, window_seconds=60)
+        for _ in range(100):
+            limiter.record("ip")
+        assert len(limiter._events["ip"]) == 3
+
+    def test_lru_eviction(self):
+        limiter = SlidingWindowRateLimiter(limit=1, window_seconds=60, max_keys=2)
+        limiter.record("a")
+        limiter.record("b")
+        assert limiter.is_limited("a")  # touching "a" makes "b" least recently used
+        limiter.record("c")
+
+        assert len(limiter) == 2
+        assert limiter.is_limited("a")
+        assert not limiter.is_limited("b")
+        assert limiter.is_limited("c")
+
+    def test_reset(self):
+        limiter = SlidingWindowRateLimiter(limit=1, window_seconds=60)
+        limiter.record("ip")
+        limiter.reset()
+        assert not limiter.is_limited("ip")
+
+
+class TestPostgresRateLimiter:
+    """Test the shared database-backed limiter"""
+
+    def add_submission(self, ip_address: str, age: timedelta = timedelta()) -> None:
+        with get_session() as session:
+            session.add(
+                ContactSubmission(
+                    name="Test",
+                    email="test@example.com",
+                    message="Hi",
+                    ip_address=ip_address,
+                    created_at=datetime.utcnow() - age,
+                )
+            )
+            session.commit()
+
+    def test_counts_recent_submissions(self, new_db):
+        limiter = PostgresRateLimiter(limit=2, window_seconds=3600)
+        self.add_submission("192.168.1.0")
+        assert not limiter.is_limited("192.168.1.0")
+        self.add_submission("192.168.1.0")
+        assert limiter.is_limited("192.168.1.0")
+        assert not limiter.is_limited("192.168.2.0")
+
+    def test_ignores_submissions_outside_window(self, new_db):
+        limiter = PostgresRateLimiter(limit=1, window_seconds=3600)
+        self.add_submission("192.168.1.0", age=timedelta(hours=2))
+        assert not limiter.is_limited("192.168.1.0")
+
+    def test_count_uses_count_query(self, new_db, statement_log):
+        PostgresRateLimiter(limit=3, window_seconds=3600).is_limited("192.168.1.0")
+        assert len(statement_log) == 1
+        assert "count(*)" in statement_log[0]
+
+
+class TestRateLimitPolicy:
+    """Test limiter configuration and service integration"""
+
+    def test_create_rate_limiter(self):
+        assert isinstance(create_rate_limiter("memory", 5, 60), SlidingWindowRateLimiter)
+        limiter = create_rate_limiter("postgres", 5, 60)
+        assert isinstance(limiter, PostgresRateLimiter)
+        assert limiter.limit == 5
+        with pytest.raises(ValueError):
+            create_rate_limiter("redis")
+
+    def test_submission_is_recorded_under_anonymized_ip(self, new_db):
+        contact_data = ContactSubmissionCreate(name="Test User", email="test@example.com", message="Hello")
+        for _ in range(CONTACT_RATE_LIMITER.limit):
+            assert LandingPageService.submit_contact_form(contact_data, ip_address="192.168.7.25") is not None
+
+        # Another address in the same /24 shares the anonymized key
+        assert LandingPageService._check_rate_limit("192.168.7.200")
+        assert LandingPageService.submit_contact_form(contact_data, ip_address="192.168.7.200") is None
+
+    def test_rate_limit_check_runs_no_queries(self, new_db, statement_log):
+        LandingPageService._check_rate_limit("192.168.1.1")
+        assert statement_log == []
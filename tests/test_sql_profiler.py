@@ -0,0 +1,117 @@
+import logging
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import event, text
+from sqlalchemy.exc import ProgrammingError
+from app.database import ASYNC_ENGINE, ENGINE
+from app.middleware import SqlProfilerMiddleware
+from app.sql_profiler import SqlProfiler, fingerprint
+
+
+@pytest.fixture
+def profiler():
+    profiler = SqlProfiler([ENGINE, ASYNC_ENGINE.sync_engine], enabled=True, n_plus_one_threshold=5)
+    yield profiler
+    profiler.disable()
+
+
+def run(statement: str, times: int = 1, **params) -> None:
+    with ENGINE.connect() as conn:
+        for _ in range(times):
+            conn.execute(text(statement), params)
+
+
+class TestFingerprint:
+    """Test statement normalization"""
+
+    def test_literals_and_placeholders(self):
+        assert fingerprint("SELECT * FROM t WHERE a = 'x''y' AND b = 42") == "SELECT * FROM t WHERE a = ? AND b = ?"
+        assert fingerprint("SELECT * FROM t WHERE a = %(a_1)s AND b = %s") == "SELECT * FROM t WHERE a = ? AND b = ?"
+        assert fingerprint("SELECT * FROM t WHERE a = $1") == "SELECT * FROM t WHERE a = ?"
+
+    def test_in_lists_and_whitespace(self):
+        assert fingerprint("SELECT *\n  FROM t WHERE id IN (1, 2, 3)") == "SELECT * FROM t WHERE id IN (?, ...)"
+        assert fingerprint("SELECT * FROM t WHERE id IN (%(p1)s, %(p2)s)") == "SELECT * FROM t WHERE id IN (?, ...)"
+
+    def test_identifiers_keep_digits(self):
+        assert fingerprint("SELECT col1 FROM table2") == "SELECT col1 FROM table2"
+
+
+class TestProfiler:
+    """Test statement timing on the real engines"""
+
+    def test_groups_by_fingerprint(self, profiler):
+        run("SELECT :value AS v", times=3, value=1)
+        run("SELECT :value AS v", value=2)
+        stats = {stat.fingerprint: stat for stat in profiler.top()}
+        stat = stats["SELECT ? AS v"]
+        assert stat.count == 4
+        assert 0 < stat.p95_ms <= stat.max_ms <= stat.total_ms
+
+    async def test_async_engine(self, profiler):
+        async with ASYNC_ENGINE.connect() as conn:
+            await conn.execute(text("SELECT :value AS async_v"), {"value": "x"})
+        await ASYNC_ENGINE.dispose()
+        assert "SELECT ? AS async_v" in {stat.fingerprint for stat in profiler.top()}
+
+    def test_disable_detaches_listeners(self, profiler):
+        profiler.disable()
+        assert not event.contains(ENGINE, "before_cursor_execute", profiler._before_execute)
+        run("SELECT 'while disabled'")
+        assert profiler.top() == []
+
+        profiler.enable()
+        run("SELECT 'enabled again'")
+        assert [stat.count for stat in profiler.top()] == [1]
+
+    def test_failed_statements_are_not_timed(self, profiler):
+        with pytest.raises(ProgrammingError):
+            run("SELECT * FROM no_such_table")
+        with ENGINE.connect() as conn:
+            assert not conn.info.get("sql_profiler_start")
+        assert profiler.top() == []
+
+    def test_report_and_sort(self, profiler):
+        run("SELECT 1", times=3)
+        run("SELECT pg_sleep(0.02)")
+        assert profiler.top(1, sort_by="max_ms")[0].fingerprint == "SELECT pg_sleep(?)"
+        assert profiler.top(1, sort_by="count")[0].fingerprint == "SELECT ?"
+        assert "SELECT pg_sleep(?)" in profiler.report()
+        with pytest.raises(ValueError):
+            profiler.top(sort_by="name")
+
+        profiler.reset()
+        assert profiler.top() == []
+
+
+class TestNPlusOne:
+    """Test repeated statement detection per request"""
+
+    def test_repeated_statement_reported(self, profiler, caplog):
+        with caplog.at_level(logging.WARNING, logger="app.sql_profiler"):
+            with profiler.request("GET /items"):
+                run("SELECT :id AS item", times=6, id=1)
+                run("SELECT :id AS owner", times=2, id=1)
+        reports = profiler.n_plus_one()
+        assert [(report.request, report.fingerprint, report.count) for report in reports] == [
+            ("GET /items", "SELECT ? AS item", 6)
+        ]
+        assert "Possible N+1 query: 6 executions during GET /items" in caplog.text
+
+    def test_outside_request_not_reported(self, profiler):
+        run("SELECT :id AS item", times=6, id=1)
+        assert profiler.n_plus_one() == []
+
+    def test_middleware_labels_route(self, profiler):
+        api = FastAPI()
+
+        @api.get("/items/{item_id}")
+        def item(item_id: int):
+            run("SELECT :id AS item", times=5, id=item_id)
+            return {"id": item_id}
+
+        api.add_middleware(SqlProfilerMiddleware, profiler=profiler)
+        assert TestClient(api).get("/items/7").status_code == 200
+        assert profiler.n_plus_one()[0].request == "GET /items/{item_id}"
+        assert profiler.as_dict()["n_plus_one"][0]["count"] == 5
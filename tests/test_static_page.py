@@ -0,0 +1,120 @@
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from app.content_cache import CONTENT_CACHE, LANDING_NAMESPACE
+from app.database import reset_db
+from app.landing_content import DEFAULT_LANDING_VIEW, HERO_HEADLINE
+from app.landing_service import LandingPageService
+from app.models import ServiceCreate
+from app.static_page import (
+    etag_matches,
+    get_static_landing_page,
+    landing_response,
+    render_landing_html,
+    STATIC_PAGE_MAX_AGE,
+)
+
+
+@pytest.fixture
+def new_db():
+    reset_db()
+    yield
+    reset_db()
+
+
+@pytest.fixture
+def client(new_db):
+    api = FastAPI()
+
+    @api.api_route("/", methods=["GET", "HEAD"])
+    def landing(request: Request):
+        return landing_response(request)
+
+    yield TestClient(api)
+
+
+class TestRender:
+    """Test the pre-rendered landing document"""
+
+    def test_contains_all_sections(self):
+        html = render_landing_html(DEFAULT_LANDING_VIEW)
+        assert html.startswith("<!DOCTYPE html>")
+        assert HERO_HEADLINE in html
+        for item in (*DEFAULT_LANDING_VIEW.services, *DEFAULT_LANDING_VIEW.benefits):
+            assert item.title in html
+        assert "Ready to Transform Your Home?" in html
+        assert "<footer" in html
+
+    def test_buttons_degrade_to_links(self):
+        html = render_landing_html(DEFAULT_LANDING_VIEW)
+        assert "<button" not in html
+        assert 'href="#cta"' in html
+        assert 'href="#services"' in html and 'id="services"' in html
+        assert 'href="https://wa.me/1234567890?text=Hello%21%20I%27m' in html
+        assert 'href="mailto:info@smarthome-it.com?subject=Smart%20Home' in html
+
+    def test_attributes_are_escaped(self):
+        assert "&amp;body=" in render_landing_html(DEFAULT_LANDING_VIEW)
+
+
+class TestEtag:
+    """Test If-None-Match comparison"""
+
+    def test_matches(self):
+        assert etag_matches('"abc"', '"abc"')
+        assert etag_matches('W/"abc"', '"abc"')
+        assert etag_matches('"x", "abc"', '"abc"')
+        assert etag_matches("*", '"abc"')
+
+    def test_no_match(self):
+        assert not etag_matches(None, '"abc"')
+        assert not etag_matches("", '"abc"')
+        assert not etag_matches('"abd"', '"abc"')
+
+
+class TestStaticRoute:
+    """Test caching headers and conditional requests"""
+
+    def test_full_response(self, client):
+        response = client.get("/")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "text/html; charset=utf-8"
+        assert response.headers["cache-control"] == f"public, max-age={STATIC_PAGE_MAX_AGE}"
+        assert response.headers["etag"] == get_static_landing_page().etag
+        assert HERO_HEADLINE in response.text
+
+    def test_not_modified(self, client):
+        etag = client.get("/").headers["etag"]
+        response = client.get("/", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_stale_etag_gets_full_page(self, client):
+        response = client.get("/", headers={"If-None-Match": '"outdated"'})
+        assert response.status_code == 200
+
+    def test_head(self, client):
+        response = client.head("/")
+        assert response.status_code == 200
+        assert response.content == b""
+        assert int(response.headers["content-length"]) == len(get_static_landing_page().body)
+
+    def test_rendered_once_per_content_version(self, client):
+        page = get_static_landing_page()
+        client.get("/")
+        assert get_static_landing_page() is page
+
+        CONTENT_CACHE.invalidate(LANDING_NAMESPACE)
+        rebuilt = get_static_landing_page()
+        assert rebuilt is not page
+        assert rebuilt.etag == page.etag  # unchanged content keeps its validator
+
+    def test_content_change_produces_new_etag(self, client):
+        etag = client.get("/").headers["etag"]
+        LandingPageService.create_service(ServiceCreate(title="Solar <Panels>", description="Desc"))
+
+        response = client.get("/", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        assert "Solar &lt;Panels&gt;" in response.text
@@ -0,0 +1,61 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.landing_content import DEFAULT_LANDING_VIEW, THEME_CSS
+from app.static_page import render_landing_html
+from app.theme_asset import (
+    ASSET_CACHE_CONTROL,
+    THEME_ASSET,
+    asset_response,
+    build_css_asset,
+    minify_css,
+)
+
+
+class TestMinify:
+    """Test the CSS minifier"""
+
+    def test_drops_comments_and_whitespace(self):
+        css = "/* note */\n.card {\n    color: red;\n    margin: 0 auto;\n}\n"
+        assert minify_css(css) == ".card{color:red;margin:0 auto}"
+
+    def test_keeps_descendant_pseudo_selector(self):
+        assert minify_css(".card :hover { color: red; }") == ".card :hover{color:red}"
+
+    def test_keeps_media_queries(self):
+        css = "@media (max-width: 768px) {\n  .a { padding: 2rem 1rem; }\n}"
+        assert minify_css(css) == "@media (max-width:768px){.a{padding:2rem 1rem}}"
+
+    def test_theme_shrinks(self):
+        assert len(minify_css(THEME_CSS)) < len(THEME_CSS) * 0.8
+
+
+class TestThemeAsset:
+    """Test the fingerprinted theme stylesheet"""
+
+    def test_path_follows_content(self):
+        same = build_css_asset("theme", ".a { color: red; }")
+        other = build_css_asset("theme", ".a { color: blue; }")
+        assert same.path == build_css_asset("theme", ".a{color:red}").path
+        assert same.path != other.path
+        assert THEME_ASSET.path == f"/assets/theme.{THEME_ASSET.digest}.css"
+
+    def test_contains_theme_and_brand_colors(self):
+        css = THEME_ASSET.body.decode()
+        assert ".hero-gradient{" in css
+        assert "--q-primary:#2563eb" in css
+        assert "scroll-behavior:smooth" in css
+
+    def test_served_immutable(self):
+        api = FastAPI()
+        api.get(THEME_ASSET.path)(lambda: asset_response(THEME_ASSET))
+        response = TestClient(api).get(THEME_ASSET.path)
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "text/css; charset=utf-8"
+        assert response.headers["cache-control"] == ASSET_CACHE_CONTROL
+        assert response.headers["etag"] == THEME_ASSET.etag
+        assert response.content == THEME_ASSET.body
+
+    def test_static_page_links_asset(self):
+        html = render_landing_html(DEFAULT_LANDING_VIEW)
+        assert THEME_ASSET.link in html
+        assert "<style>" not in html